@@ -0,0 +1,45 @@
+"""Atomic file writes for caches, state files and generated assets.
+
+Other sessions, processes and external readers (a metrics scraper, a second
+app instance) may read these files at any moment, so none may ever be seen
+half-written. Data goes to a temporary file next to the target, which is then
+renamed over it with ``os.replace``. The rename is atomic on POSIX and
+Windows. The temporary name includes the process and thread, so concurrent
+writers never share one.
+"""
+import os
+import threading
+from contextlib import contextmanager, suppress
+
+
+@contextmanager
+def replacing(path, mode="wb", encoding=None):
+    """File object whose contents replace ``path`` when the block exits cleanly."""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp, mode, encoding=encoding) as f:
+            yield f
+        os.replace(tmp, path)
+    except BaseException:
+        with suppress(OSError):
+            os.remove(tmp)
+        raise
+
+
+def write(path, data):
+    """Replace ``path`` with ``data`` (bytes, or str written as UTF-8)."""
+    if isinstance(data, str):
+        with replacing(path, "w", encoding="utf-8") as f:
+            f.write(data)
+    else:
+        with replacing(path) as f:
+            f.write(data)
+
+
+def write_once(path, data):
+    """``write`` unless ``path`` exists; for content-addressed files."""
+    if not os.path.exists(path):
+        write(path, data)
@@ -0,0 +1,187 @@
+"""Headless per-page rerun benchmark for app.py.
+
+Every page is driven through ``streamlit.testing.v1.AppTest``. For each one the
+suite records:
+
+``first_ms``       the first visit to the page in this process
+``wall_ms``        median script time over ``--runs`` warm reruns
+``peak_kib``       peak Python allocation during one rerun (tracemalloc)
+``deltas``         delta ForwardMsgs produced by one rerun
+``payload_bytes``  serialized size of all ForwardMsgs of that rerun
+
+With ``--record`` the results are appended to ``benchmarks/history.jsonl``.
+With ``--check`` each metric is compared to the median of the last
+``--window`` recorded runs, and the script exits non-zero if any metric grew
+by more than ``--threshold``. Time metrics are noisy, so give them a looser
+``--time-threshold`` on shared CI runners.
+
+    python benchmarks/bench_pages.py --runs 10 --check --record
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import views  # noqa: E402
+
+APP = os.path.join(ROOT, "app.py")
+HISTORY = os.path.join(ROOT, "benchmarks", "history.jsonl")
+TIMEOUT = 120
+
+TIME_METRICS = ("first_ms", "wall_ms")
+
+
+@contextmanager
+def captured_messages():
+    """Expose the ForwardMsgs of the most recent AppTest run.
+
+    AppTest does not keep its script runner, so wrap the runner's accessor for
+    the duration of the benchmark and remember what it returned last.
+    """
+    from streamlit.testing.v1.local_script_runner import LocalScriptRunner
+
+    original = LocalScriptRunner.forward_msgs
+    last = []
+
+    def forward_msgs(self):
+        msgs = original(self)
+        last[:] = list(msgs)
+        return msgs
+
+    LocalScriptRunner.forward_msgs = forward_msgs
+    try:
+        yield last
+    finally:
+        LocalScriptRunner.forward_msgs = original
+
+
+def _timed_run(at):
+    started = time.perf_counter()
+    at.run()
+    elapsed = (time.perf_counter() - started) * 1000
+    if at.exception:
+        raise RuntimeError(at.exception[0].value)
+    return elapsed
+
+
+def bench_page(title, runs, messages):
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(APP, default_timeout=TIMEOUT)
+    at.run()
+    if title != next(iter(views.PAGES)):
+        at.sidebar.radio[0].set_value(title)
+    first = _timed_run(at)
+
+    wall = [_timed_run(at) for _ in range(runs)]
+
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    _timed_run(at)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return {
+        "first_ms": round(first, 2),
+        "wall_ms": round(statistics.median(wall), 2),
+        "peak_kib": round(peak / 1024, 1),
+        "deltas": sum(1 for msg in messages if msg.HasField("delta")),
+        "payload_bytes": sum(msg.ByteSize() for msg in messages),
+    }
+
+
+def run_suite(runs):
+    with captured_messages() as messages:
+        return {title: bench_page(title, runs, messages) for title in views.PAGES}
+
+
+# ── History ──────────────────────────────────────────────────────────────────
+def _commit():
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True)
+    except OSError:
+        return None
+    return out.stdout.strip() or None
+
+
+def load_history(path=HISTORY):
+    if not os.path.exists(path):
+        return []
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def record(pages, path=HISTORY):
+    import streamlit
+
+    entry = {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "commit": _commit(),
+        "python": platform.python_version(),
+        "streamlit": streamlit.__version__,
+        "pages": pages,
+    }
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(json.dumps(entry) + "\n")
+    return entry
+
+
+def regressions(pages, history, window, threshold, time_threshold):
+    """``(page, metric, baseline, current)`` for every metric over its limit."""
+    recent = history[-window:]
+    found = []
+    for title, metrics in pages.items():
+        for metric, value in metrics.items():
+            past = [h["pages"][title][metric] for h in recent if metric in h["pages"].get(title, {})]
+            if not past:
+                continue
+            baseline = statistics.median(past)
+            limit = time_threshold if metric in TIME_METRICS else threshold
+            if value > baseline * (1 + limit):
+                found.append((title, metric, baseline, value))
+    return found
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5, help="warm reruns per page (default: 5)")
+    parser.add_argument("--record", action="store_true", help=f"append results to {os.path.relpath(HISTORY, ROOT)}")
+    parser.add_argument("--check", action="store_true", help="fail if a metric regressed against history")
+    parser.add_argument("--window", type=int, default=5, help="history entries forming the baseline")
+    parser.add_argument("--threshold", type=float, default=0.10, help="allowed growth of size metrics")
+    parser.add_argument("--time-threshold", type=float, default=0.50, help="allowed growth of time metrics")
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    args = parser.parse_args(argv)
+
+    pages = run_suite(args.runs)
+
+    if args.json:
+        print(json.dumps(pages, indent=2))
+    else:
+        print(f"{'Page':<24} {'first ms':>9} {'wall ms':>8} {'peak KiB':>9} {'deltas':>7} {'bytes':>8}")
+        for title, m in pages.items():
+            print(f"{title:<24} {m['first_ms']:>9.1f} {m['wall_ms']:>8.1f} {m['peak_kib']:>9.1f} "
+                  f"{m['deltas']:>7} {m['payload_bytes']:>8}")
+
+    failed = []
+    if args.check:
+        failed = regressions(pages, load_history(), args.window, args.threshold, args.time_threshold)
+        for title, metric, baseline, value in failed:
+            print(f"REGRESSION {title} {metric}: {baseline} -> {value}", file=sys.stderr)
+    if args.record:
+        record(pages)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,272 @@
+"""Columnar on-disk store of benchmark results, read through memory maps.
+
+Result files from pytest-benchmark (``--benchmark-json``, add
+``--benchmark-save-data`` to keep raw samples) or asv (``results/<machine>/``)
+are ingested into ``PROFILE_BENCH_STORE`` (default ``data/bench/``):
+
+``values.f8``   every raw timing sample, float64 seconds, append-only
+``blocks.bin``  one fixed-width record per (run, benchmark): where its samples
+                start in ``values.f8``, how many there are, and precomputed
+                min / quartiles / p95 / mean
+``names.json``  benchmark names; blocks refer to them by position
+``runs.json``   one entry per ingested file: commit, timestamp, source hash
+
+Both binary files are opened with ``numpy.memmap``. Trend and regression
+queries only touch the small ``blocks`` records; distributions slice just the
+samples of the requested blocks, so the full history never has to fit in
+memory. ``runs.json`` is replaced last and atomically and records where each
+run's data ends; readers map only that far and the next ingest truncates
+anything beyond it, so a crashed ingest leaves no partial run behind.
+"""
+import hashlib
+import json
+import os
+import threading
+from collections import namedtuple
+from datetime import datetime, timezone
+
+import numpy as np
+
+import atomic
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+STORE_DIR = os.environ.get("PROFILE_BENCH_STORE", os.path.join(ROOT, "data", "bench"))
+
+BLOCK_DTYPE = np.dtype([
+    ("run", "<u4"), ("bench", "<u4"), ("start", "<u8"), ("count", "<u8"),
+    ("min", "<f8"), ("q1", "<f8"), ("median", "<f8"), ("q3", "<f8"), ("p95", "<f8"), ("mean", "<f8"),
+])
+
+Result = namedtuple("Result", ["name", "samples", "stats"])
+Run = namedtuple("Run", ["commit", "timestamp", "source", "results"])
+Trend = namedtuple("Trend", ["runs", "labels", "median", "q1", "q3", "p95", "regressed"])
+Distribution = namedtuple("Distribution", ["labels", "q1", "median", "q3", "lower", "upper", "mean", "count"])
+
+_STAT_FIELDS = ("min", "q1", "median", "q3", "p95", "mean")
+_lock = threading.Lock()
+
+
+# ── Parsers ──────────────────────────────────────────────────────────────────
+def _iso(ts):
+    if ts is None:
+        return None
+    if isinstance(ts, (int, float)):
+        # asv stores milliseconds since the epoch
+        return datetime.fromtimestamp(ts / 1000, timezone.utc).isoformat(timespec="seconds")
+    return str(ts)
+
+
+def parse_pytest_benchmark(doc):
+    commit = doc.get("commit_info") or {}
+    results = []
+    for bench in doc.get("benchmarks", []):
+        stats = bench.get("stats", {})
+        samples = stats.get("data") or []
+        summary = {
+            "min": stats.get("min"), "q1": stats.get("q1"), "median": stats.get("median"),
+            "q3": stats.get("q3"), "mean": stats.get("mean"),
+        }
+        results.append(Result(bench.get("fullname") or bench["name"], samples, summary))
+    return Run(commit.get("id"), _iso(commit.get("time") or doc.get("datetime")), "pytest-benchmark", results)
+
+
+def parse_asv(doc):
+    columns = doc.get("result_columns") or []
+    results = []
+    for name, row in (doc.get("results") or {}).items():
+        if isinstance(row, dict):  # asv < 0.5
+            row = [row.get("result"), row.get("params", [])]
+        record = dict(zip(columns or ["result", "params"], row))
+        values = record.get("result")
+        if not isinstance(values, list):
+            values = [values]
+        all_samples = record.get("samples") or [None] * len(values)
+        for i, value in enumerate(values):
+            if value is None:
+                continue
+            label = name if len(values) == 1 else f"{name}[{i}]"
+            samples = all_samples[i] if i < len(all_samples) and all_samples[i] else [value]
+            stats = {"median": value}
+            if record.get("stats_q_25"):
+                stats["q1"] = record["stats_q_25"][i]
+                stats["q3"] = record["stats_q_75"][i]
+            results.append(Result(label, samples, stats))
+    return Run(doc.get("commit_hash"), _iso(doc.get("date")), "asv", results)
+
+
+def parse(doc):
+    """A ``Run`` from a loaded pytest-benchmark or asv result document."""
+    if "benchmarks" in doc and "machine_info" in doc:
+        return parse_pytest_benchmark(doc)
+    if "results" in doc and "commit_hash" in doc:
+        return parse_asv(doc)
+    raise ValueError("not a pytest-benchmark or asv result file")
+
+
+def _block_stats(samples, given):
+    if len(samples):
+        q = np.quantile(samples, [0, 0.25, 0.5, 0.75, 0.95])
+        return (*q, float(np.mean(samples)))
+    stats = {field: given.get(field) for field in _STAT_FIELDS}
+    return tuple(np.nan if stats[f] is None else float(stats[f]) for f in _STAT_FIELDS)
+
+
+# ── Store ────────────────────────────────────────────────────────────────────
+class BenchStore:
+    """Append-only benchmark history in ``path``."""
+
+    def __init__(self, path=STORE_DIR):
+        self.path = path
+        self._cached = None
+
+    def _file(self, name):
+        return os.path.join(self.path, name)
+
+    def _read_json(self, name, default):
+        try:
+            with open(self._file(name), encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return default
+
+    def _write_json(self, name, data):
+        atomic.write(self._file(name), json.dumps(data))
+
+    def ingest(self, path):
+        """Append one result file; returns the number of benchmarks, 0 if already stored."""
+        with open(path, "rb") as f:
+            raw = f.read()
+        digest = hashlib.sha256(raw).hexdigest()[:16]
+        run = parse(json.loads(raw))
+
+        with _lock:
+            os.makedirs(self.path, exist_ok=True)
+            runs = self._read_json("runs.json", [])
+            if any(r["source_hash"] == digest for r in runs):
+                return 0
+            names = self._read_json("names.json", [])
+            ids = {name: i for i, name in enumerate(names)}
+
+            # Drop whatever an interrupted ingest appended after the last run.
+            values_path, blocks_path = self._file("values.f8"), self._file("blocks.bin")
+            values_end = runs[-1]["values_end"] if runs else 0
+            blocks_end = runs[-1]["blocks_end"] if runs else 0
+            for file, end in ((values_path, values_end), (blocks_path, blocks_end)):
+                with open(file, "ab") as f:
+                    f.truncate(end)
+
+            start = values_end // 8
+            blocks = np.zeros(len(run.results), dtype=BLOCK_DTYPE)
+            with open(values_path, "ab") as values:
+                for i, result in enumerate(run.results):
+                    samples = np.asarray(result.samples, dtype="<f8")
+                    if result.name not in ids:
+                        ids[result.name] = len(names)
+                        names.append(result.name)
+                    blocks[i] = (len(runs), ids[result.name], start, len(samples),
+                                 *_block_stats(samples, result.stats))
+                    values.write(samples.tobytes())
+                    start += len(samples)
+            with open(blocks_path, "ab") as f:
+                f.write(blocks.tobytes())
+
+            self._write_json("names.json", names)
+            runs.append({
+                "commit": run.commit, "timestamp": run.timestamp, "source": run.source,
+                "source_file": os.path.basename(path), "source_hash": digest,
+                "values_end": start * 8, "blocks_end": blocks_end + blocks.nbytes,
+            })
+            self._write_json("runs.json", runs)
+            self._cached = None
+        return len(run.results)
+
+    # ── Reading ──────────────────────────────────────────────────────────────
+    def _open(self):
+        """``(runs, names, blocks, values)``; remapped only when runs.json changes."""
+        try:
+            mtime = os.stat(self._file("runs.json")).st_mtime_ns
+        except FileNotFoundError:
+            return [], [], np.zeros(0, dtype=BLOCK_DTYPE), np.zeros(0)
+        if self._cached is not None and self._cached[0] == mtime:
+            return self._cached[1]
+
+        runs = self._read_json("runs.json", [])
+        names = self._read_json("names.json", [])
+        # Map only the extent runs.json vouches for.
+        n_blocks = runs[-1]["blocks_end"] // BLOCK_DTYPE.itemsize if runs else 0
+        n_values = runs[-1]["values_end"] // 8 if runs else 0
+        blocks = np.zeros(0, dtype=BLOCK_DTYPE)
+        if n_blocks:
+            blocks = np.memmap(self._file("blocks.bin"), dtype=BLOCK_DTYPE, mode="r", shape=(n_blocks,))
+        values = np.zeros(0)
+        if n_values:
+            values = np.memmap(self._file("values.f8"), dtype="<f8", mode="r", shape=(n_values,))
+        opened = (runs, names, blocks, values)
+        self._cached = (mtime, opened)
+        return opened
+
+    def __len__(self):
+        return len(self._open()[0])
+
+    def benchmarks(self):
+        return list(self._open()[1])
+
+    def _label(self, runs, i):
+        commit = (runs[i].get("commit") or "")[:8]
+        when = (runs[i].get("timestamp") or "")[:10]
+        return " ".join(filter(None, (f"#{i + 1}", commit, when)))
+
+    def _blocks_for(self, name, last=None):
+        runs, names, blocks, _ = self._open()
+        if name not in names:
+            return runs, blocks[:0]
+        # Boolean mask over the small fixed-width records; samples stay on disk.
+        selected = blocks[blocks["bench"] == names.index(name)]
+        order = np.argsort(selected["run"], kind="stable")
+        selected = selected[order]
+        if last:
+            selected = selected[-last:]
+        return runs, selected
+
+    def trend(self, name, last=None, window=5, threshold=0.10):
+        """Median/IQR/p95 per run, with runs whose median regressed flagged.
+
+        A run regressed when its median exceeds the median of the previous
+        ``window`` runs by more than ``threshold``.
+        """
+        runs, selected = self._blocks_for(name, last)
+        median = np.asarray(selected["median"], dtype=np.float64)
+        regressed = np.zeros(len(median), dtype=bool)
+        for i in range(1, len(median)):
+            baseline = np.nanmedian(median[max(0, i - window):i])
+            regressed[i] = median[i] > baseline * (1 + threshold)
+        return Trend(
+            selected["run"].tolist(), [self._label(runs, r) for r in selected["run"]], median,
+            np.asarray(selected["q1"]), np.asarray(selected["q3"]), np.asarray(selected["p95"]), regressed,
+        )
+
+    def distribution(self, name, last=20):
+        """Box statistics per run, computed from each run's raw samples only."""
+        runs, selected = self._blocks_for(name, last)
+        values = self._open()[3]
+        out = {field: [] for field in Distribution._fields}
+        for block in selected:
+            samples = np.asarray(values[block["start"]:block["start"] + block["count"]])
+            if len(samples):
+                q1, med, q3 = np.quantile(samples, [0.25, 0.5, 0.75])
+                iqr = q3 - q1
+                inside = samples[(samples >= q1 - 1.5 * iqr) & (samples <= q3 + 1.5 * iqr)]
+                lower, upper, mean = inside.min(), inside.max(), samples.mean()
+            else:
+                q1, med, q3 = block["q1"], block["median"], block["q3"]
+                lower, upper, mean = block["min"], block["p95"], block["mean"]
+            row = dict(labels=self._label(runs, block["run"]), q1=q1, median=med, q3=q3,
+                       lower=lower, upper=upper, mean=mean, count=int(block["count"]))
+            for field, value in row.items():
+                if not isinstance(value, (str, int)):
+                    value = None if np.isnan(value) else float(value)
+                out[field].append(value)
+        return Distribution(**out)
+
+
+store = BenchStore()
@@ -0,0 +1,234 @@
+"""Profile content loaded from ``data/profile.json``.
+
+The data file is parsed once into immutable, shared structures (tuples,
+namedtuples and read-only mappings) with lookup indexes. ``get()`` checks the
+file's mtime on every call and, when it has changed, re-parses only the
+sections whose raw content differs from the previous load. A file that fails
+to parse mid-edit is logged and the last good load keeps being served until
+the file changes again; only a store that never loaded raises.
+
+Other researchers' profiles live in ``PROFILE_TENANTS_DIR`` (default
+``data/profiles/``) as ``<profile id>.json`` and are served with
+``get(profile_id)``. Their stores are opened on first request and kept in a
+bounded LRU (``PROFILE_STORE_CACHE`` entries), so memory follows the number
+of recently viewed profiles rather than the number on disk.
+
+Each load also rebuilds ``Content.search``, the full-text index over all
+sections (see search.py), so queries never rescan the content.
+"""
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+from collections import OrderedDict, namedtuple
+from types import MappingProxyType
+
+import search
+import taxonomy
+
+SCHEMA_VERSION = 2
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+DEFAULT_PATH = os.path.join(DATA_DIR, "profile.json")
+TENANTS_DIR = os.environ.get("PROFILE_TENANTS_DIR", os.path.join(DATA_DIR, "profiles"))
+STORE_CACHE_SIZE = int(os.environ.get("PROFILE_STORE_CACHE", "256"))
+
+log = logging.getLogger(__name__)
+
+_PROFILE_ID = re.compile(r"[A-Za-z0-9][A-Za-z0-9_-]{0,63}")
+
+Person = namedtuple("Person", ["name", "headline", "bio", "badges", "page_title", "footer", "links"])
+Link = namedtuple("Link", ["label", "url"])
+Highlight = namedtuple("Highlight", ["value", "label"])
+Education = namedtuple("Education", ["year", "title", "subtitle", "note"])
+Feature = namedtuple("Feature", ["heading", "title", "desc"])
+Diagram = namedtuple("Diagram", ["boxes", "arrows"])
+Card = namedtuple("Card", ["title", "desc"])
+Cards = namedtuple("Cards", ["items", "by_title"])
+Skill = namedtuple("Skill", ["name", "proficiency", "category"])
+Engagement = namedtuple(
+    "Engagement", ["quarters", "sa_engagement", "drc_engagement", "sa_conversion", "drc_conversion"],
+)
+
+
+# ── Section parsers ──────────────────────────────────────────────────────────
+def _strings(raw):
+    return tuple(str(item) for item in raw)
+
+
+def _scores(raw):
+    return MappingProxyType({str(k): v for k, v in raw.items()})
+
+
+def _person(raw):
+    links = tuple(Link(link["label"], link["url"]) for link in raw.get("links", []))
+    return Person(raw["name"], raw["headline"], raw["bio"], _strings(raw.get("badges", [])),
+                  raw.get("page_title") or f"{raw['name']} | Researcher Profile", raw.get("footer", ""), links)
+
+
+def _highlights(raw):
+    return tuple(Highlight(str(h["value"]), h["label"]) for h in raw)
+
+
+def _education(raw):
+    return tuple(Education(e["year"], e["title"], e.get("subtitle", ""), e.get("note", "")) for e in raw)
+
+
+def _features(raw):
+    return MappingProxyType({key: Feature(f["heading"], f["title"], f["desc"]) for key, f in raw.items()})
+
+
+def _diagram(raw):
+    # Boxes stay plain dicts: they are handed to the SVG compiler and Plotly as-is.
+    return Diagram(tuple(dict(b) for b in raw["boxes"]), tuple(tuple(a) for a in raw["arrows"]))
+
+
+def _cards(raw):
+    items = tuple(Card(c["title"], c["desc"]) for c in raw)
+    return Cards(items, MappingProxyType({c.title: c for c in items}))
+
+
+def _skills(raw):
+    return taxonomy.SkillIndex(Skill(r["skill"], r["proficiency"], r["category"]) for r in raw)
+
+
+def _tools(raw):
+    return taxonomy.TagIndex(raw)
+
+
+def _engagement(raw):
+    return Engagement(**{field: tuple(raw[field]) for field in Engagement._fields})
+
+
+SECTIONS = {
+    "person": _person,
+    "highlights": _highlights,
+    "education": _education,
+    "contact": _cards,
+    "research": _features,
+    "architecture": _diagram,
+    "certs": _strings,
+    "projects": _cards,
+    "skills": _skills,
+    "skill_colors": _scores,
+    "tools": _tools,
+    "competencies": _scores,
+    "accomplishments": _cards,
+    "engagement": _engagement,
+    "interests": _scores,
+}
+
+Content = namedtuple("Content", ["version", *SECTIONS, "search"])
+
+
+def _section_hash(raw):
+    return hashlib.sha256(json.dumps(raw, sort_keys=True).encode()).hexdigest()
+
+
+class ContentStore:
+    """Shared, hot-reloading view of one profile data file."""
+
+    def __init__(self, path=DEFAULT_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self._mtime = None
+        self._hashes = {}
+        self._content = None
+        self.reloads = 0
+
+    def get(self):
+        """Return the current ``Content``, reloading changed sections first."""
+        mtime = os.stat(self.path).st_mtime_ns
+        if mtime == self._mtime:
+            return self._content
+        with self._lock:
+            if mtime != self._mtime:
+                try:
+                    self._load(mtime)
+                except (ValueError, KeyError, TypeError, AttributeError) as exc:
+                    if self._content is None:
+                        raise
+                    log.error("content: %s failed to load, serving the previous version: %s", self.path, exc)
+                    # Remember the broken mtime so it is not re-parsed on every rerun.
+                    self._mtime = mtime
+            return self._content
+
+    def _load(self, mtime):
+        with open(self.path, encoding="utf-8") as f:
+            raw = json.load(f)
+
+        version = raw.get("version")
+        if version != SCHEMA_VERSION:
+            raise ValueError(f"{self.path}: unsupported content version {version!r} (expected {SCHEMA_VERSION})")
+
+        changed = {"version": version}
+        hashes = {}
+        for name, parse in SECTIONS.items():
+            if name not in raw:
+                raise ValueError(f"{self.path}: missing section {name!r}")
+            hashes[name] = _section_hash(raw[name])
+            if self._content is None or hashes[name] != self._hashes.get(name):
+                changed[name] = parse(raw[name])
+
+        if self._content is None:
+            content = Content(**changed, search=None)
+        else:
+            content = self._content._replace(**changed)
+        self._content = content._replace(search=search.ProfileIndex.build(content))
+        self._hashes = hashes
+        self._mtime = mtime
+        self.reloads += 1
+
+
+class UnknownProfile(LookupError):
+    pass
+
+
+class StoreCache:
+    """Bounded LRU of ``ContentStore``s for tenant profiles, keyed by id."""
+
+    def __init__(self, directory=TENANTS_DIR, max_entries=STORE_CACHE_SIZE):
+        self.directory = directory
+        self.max_entries = max_entries
+        self._stores = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, profile_id):
+        with self._lock:
+            found = self._stores.get(profile_id)
+            if found is not None:
+                self._stores.move_to_end(profile_id)
+                return found
+
+        if not _PROFILE_ID.fullmatch(profile_id):
+            raise UnknownProfile(profile_id)
+        path = os.path.join(self.directory, f"{profile_id}.json")
+        if not os.path.exists(path):
+            # Misses are not cached, so probing random ids costs no memory.
+            raise UnknownProfile(profile_id)
+
+        with self._lock:
+            found = self._stores.get(profile_id)
+            if found is None:
+                found = self._stores[profile_id] = ContentStore(path)
+                while len(self._stores) > self.max_entries:
+                    self._stores.popitem(last=False)
+            return found
+
+    def __len__(self):
+        return len(self._stores)
+
+
+store = ContentStore()
+stores = StoreCache()
+
+
+def get(profile_id=None):
+    """Content of the default profile, or of tenant ``profile_id``."""
+    if not profile_id:
+        return store.get()
+    try:
+        return stores.get(profile_id).get()
+    except FileNotFoundError:
+        raise UnknownProfile(profile_id) from None
@@ -0,0 +1,392 @@
+"""Downloadable PDF CV of a profile, built in the background and cached on disk.
+
+``document(profile)`` copies the sections that go into the CV (person,
+education timeline, certifications, projects, accomplishments, skills and
+competencies) into plain tuples, with the inline HTML of descriptions reduced
+to text. ``render(doc)`` lays that out as PDF with the small writer below. It
+uses the standard Helvetica fonts, so no font files or PDF library are
+needed. When kaleido is installed, the skill and competency charts are
+rasterized from the same Plotly figures the pages draw. Without kaleido, or
+when it cannot start its browser, they are drawn as vector bars.
+
+``pdf(profile)`` is what the sidebar's download button calls; Streamlit runs
+it off the script thread. Rendering happens in a spawn process pool. The file
+is stored as ``.cache/cv/<hash>.pdf``, keyed on the document's content, so a
+repeat download is a file read until the profile changes. Concurrent requests
+for the same document share one job.
+"""
+import hashlib
+import importlib.util
+import json
+import os
+import re
+import threading
+import zlib
+from collections import namedtuple
+from concurrent.futures import Future
+
+import atomic
+import pools
+import search
+
+# Bump when the layout changes, so cached files are not served for it.
+CV_VERSION = 1
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache", "cv")
+MAX_WORKERS = int(os.environ.get("PROFILE_CV_WORKERS", "1"))
+CHARTS = importlib.util.find_spec("kaleido") is not None
+
+CV = namedtuple("CV", [
+    "name", "headline", "bio", "badges", "links", "education", "certs", "projects", "accomplishments",
+    "skills", "skill_colors", "competencies",
+])
+
+_jobs = {}
+_lock = threading.Lock()
+# Cache hits and misses of submit(); outcomes of the builds those misses started.
+hits = misses = builds = failures = 0
+
+
+# ── Document ─────────────────────────────────────────────────────────────────
+def _cards(cards):
+    return tuple((c.title, search.plain(c.desc)) for c in cards.items)
+
+
+def document(profile):
+    """The parts of ``profile`` that go into the CV, as picklable plain data."""
+    person = profile.person
+    return CV(
+        person.name, person.headline, search.plain(person.bio), person.badges,
+        tuple((link.label, link.url) for link in person.links),
+        tuple((e.year, e.title, e.subtitle, search.plain(e.note)) for e in profile.education),
+        profile.certs, _cards(profile.projects), _cards(profile.accomplishments),
+        tuple((s.name, s.proficiency, s.category) for s in profile.skills.rows),
+        tuple(profile.skill_colors.items()), tuple(profile.competencies.items()),
+    )
+
+
+def digest(doc):
+    payload = json.dumps([CV_VERSION, CHARTS, doc], ensure_ascii=False)
+    return hashlib.sha256(payload.encode()).hexdigest()[:32]
+
+
+def file_name(name):
+    """Download file name for the CV of the person called ``name``."""
+    return f"{re.sub(r'[^A-Za-z0-9]+', '-', name).strip('-') or 'profile'}-CV.pdf"
+
+
+# ── PDF writer ───────────────────────────────────────────────────────────────
+# Advance widths (1/1000 em) of printable ASCII in the standard Helvetica
+# faces; anything else is measured as a digit.
+_WIDTHS = {
+    False: (278, 278, 355, 556, 556, 889, 667, 191, 333, 333, 389, 584, 278, 333, 278, 278,
+            556, 556, 556, 556, 556, 556, 556, 556, 556, 556, 278, 278, 584, 584, 584, 556,
+            1015, 667, 667, 722, 722, 667, 611, 778, 722, 278, 500, 667, 556, 833, 722, 778,
+            667, 778, 722, 667, 611, 722, 667, 944, 667, 667, 611, 278, 278, 278, 469, 556,
+            333, 556, 556, 500, 556, 556, 278, 556, 556, 222, 222, 500, 222, 833, 556, 556,
+            556, 556, 333, 500, 278, 556, 500, 722, 500, 500, 500, 334, 260, 334, 584),
+    True: (278, 333, 474, 556, 556, 889, 722, 238, 333, 333, 389, 584, 278, 333, 278, 278,
+           556, 556, 556, 556, 556, 556, 556, 556, 556, 556, 333, 333, 584, 584, 584, 611,
+           975, 722, 722, 722, 722, 667, 611, 778, 722, 278, 556, 722, 611, 833, 722, 778,
+           667, 778, 722, 667, 611, 722, 667, 944, 667, 667, 611, 333, 278, 333, 584, 556,
+           333, 556, 611, 556, 611, 556, 333, 611, 611, 278, 278, 556, 278, 889, 611, 611,
+           611, 611, 389, 556, 333, 611, 556, 778, 556, 556, 500, 389, 280, 389, 584),
+}
+PAGE_WIDTH, PAGE_HEIGHT = 595, 842  # A4, points
+MARGIN = 50
+
+
+def text_width(text, size, bold=False):
+    widths = _WIDTHS[bold]
+    return sum(widths[ord(c) - 32] if 32 <= ord(c) < 127 else 556 for c in text) * size / 1000
+
+
+def wrap(text, size, width, bold=False):
+    """Greedy word wrap of ``text`` into lines at most ``width`` points wide."""
+    lines, line = [], ""
+    for word in text.split():
+        candidate = f"{line} {word}" if line else word
+        if line and text_width(candidate, size, bold) > width:
+            lines.append(line)
+            line = word
+        else:
+            line = candidate
+    if line:
+        lines.append(line)
+    return lines
+
+
+def _pdf_string(text):
+    data = text.encode("cp1252", errors="replace")
+    return b"(" + data.replace(b"\\", b"\\\\").replace(b"(", b"\\(").replace(b")", b"\\)") + b")"
+
+
+def _rgb(color):
+    color = color.lstrip("#")
+    return tuple(int(color[i:i + 2], 16) / 255 for i in (0, 2, 4))
+
+
+def _jpeg_info(data):
+    """Width, height and component count from a JPEG's start-of-frame marker."""
+    i = 2
+    while i + 9 < len(data):
+        marker = data[i + 1]
+        if 0xC0 <= marker <= 0xCF and marker not in (0xC4, 0xC8, 0xCC):
+            return int.from_bytes(data[i + 7:i + 9], "big"), int.from_bytes(data[i + 5:i + 7], "big"), data[i + 9]
+        i += 2 + int.from_bytes(data[i + 2:i + 4], "big")
+    raise ValueError("no JPEG frame header found")
+
+
+class PdfWriter:
+    """Minimal PDF 1.4 writer: A4 pages of Helvetica text, filled rectangles and JPEG images.
+
+    Coordinates are PDF points from the bottom-left corner of the page.
+    """
+
+    def __init__(self):
+        self.pages = []
+        self.images = []
+
+    def add_page(self):
+        self.pages.append([])
+
+    def text(self, x, y, text, size, bold=False, color="#000000", page=-1):
+        r, g, b = _rgb(color)
+        self.pages[page].append(b"BT %.3f %.3f %.3f rg /F%d %.1f Tf %.2f %.2f Td %s Tj ET" % (
+            r, g, b, 2 if bold else 1, size, x, y, _pdf_string(text)))
+
+    def rect(self, x, y, width, height, color):
+        r, g, b = _rgb(color)
+        self.pages[-1].append(b"%.3f %.3f %.3f rg %.2f %.2f %.2f %.2f re f" % (r, g, b, x, y, width, height))
+
+    def image(self, jpeg, x, y, width, height):
+        self.images.append(jpeg)
+        self.pages[-1].append(b"q %.2f 0 0 %.2f %.2f %.2f cm /Im%d Do Q" % (width, height, x, y, len(self.images)))
+
+    def tobytes(self):
+        objects = [
+            b"<< /Type /Catalog /Pages 2 0 R >>",
+            None,  # page tree, once the page objects are numbered
+            b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>",
+            b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica-Bold /Encoding /WinAnsiEncoding >>",
+        ]
+        xobjects = []
+        for n, jpeg in enumerate(self.images, 1):
+            width, height, components = _jpeg_info(jpeg)
+            space = b"/DeviceGray" if components == 1 else b"/DeviceRGB"
+            objects.append(b"<< /Type /XObject /Subtype /Image /Width %d /Height %d /ColorSpace %s "
+                           b"/BitsPerComponent 8 /Filter /DCTDecode /Length %d >>\nstream\n%s\nendstream"
+                           % (width, height, space, len(jpeg), jpeg))
+            xobjects.append(b"/Im%d %d 0 R" % (n, len(objects)))
+        resources = b"<< /Font << /F1 3 0 R /F2 4 0 R >> /XObject << %s >> >>" % b" ".join(xobjects)
+
+        kids = []
+        for ops in self.pages:
+            stream = zlib.compress(b"\n".join(ops))
+            objects.append(b"<< /Length %d /Filter /FlateDecode >>\nstream\n%s\nendstream" % (len(stream), stream))
+            objects.append(b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 %d %d] /Resources %s /Contents %d 0 R >>"
+                           % (PAGE_WIDTH, PAGE_HEIGHT, resources, len(objects)))
+            kids.append(b"%d 0 R" % len(objects))
+        objects[1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (b" ".join(kids), len(kids))
+
+        out = bytearray(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+        offsets = []
+        for n, body in enumerate(objects, 1):
+            offsets.append(len(out))
+            out += b"%d 0 obj\n%s\nendobj\n" % (n, body)
+        xref = len(out)
+        out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+        out += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+        out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+        return bytes(out)
+
+
+# ── Layout ───────────────────────────────────────────────────────────────────
+INK = "#0f2027"
+MUTED = "#4a5c6a"
+ACCENT = "#2c5364"
+TRACK = "#e8eef2"
+BAR_COLOR = "#2c5364"
+
+
+class _Flow:
+    """Top-to-bottom text flow over ``PdfWriter`` pages, breaking pages as needed."""
+
+    def __init__(self, pdf):
+        self.pdf = pdf
+        self.width = PAGE_WIDTH - 2 * MARGIN
+        self.y = 0
+        self._new_page()
+
+    def _new_page(self):
+        self.pdf.add_page()
+        self.y = PAGE_HEIGHT - MARGIN
+
+    def need(self, height):
+        if self.y - height < MARGIN:
+            self._new_page()
+
+    def space(self, height):
+        self.y -= height
+
+    def paragraph(self, text, size=10, bold=False, color=INK, indent=0, leading=1.35):
+        for line in wrap(text, size, self.width - indent, bold):
+            self.need(size * leading)
+            self.y -= size * leading
+            self.pdf.text(MARGIN + indent, self.y, line, size, bold, color)
+
+    def heading(self, text):
+        self.need(60)  # never leave a heading alone at the foot of a page
+        self.space(14)
+        self.paragraph(text, size=13, bold=True, color=ACCENT)
+        self.space(4)
+        self.pdf.rect(MARGIN, self.y, self.width, 0.8, ACCENT)
+        self.space(6)
+
+    def bars(self, rows, label_width=170):
+        """One horizontal bar per ``(label, value out of 100, colour)``."""
+        track = self.width - label_width - 36
+        for label, value, color in rows:
+            self.need(16)
+            self.y -= 16
+            self.pdf.text(MARGIN, self.y + 3, label, 9, color=INK)
+            self.pdf.rect(MARGIN + label_width, self.y + 2, track, 8, TRACK)
+            self.pdf.rect(MARGIN + label_width, self.y + 2, track * min(max(value, 0), 100) / 100, 8, color)
+            self.pdf.text(MARGIN + label_width + track + 6, self.y + 3, f"{value}%", 9, color=MUTED)
+
+    def image(self, jpeg):
+        width, height, _ = _jpeg_info(jpeg)
+        height = self.width * height / width
+        self.need(height)
+        self.y -= height
+        self.pdf.image(jpeg, MARGIN, self.y, self.width, height)
+
+
+def _charts(doc):
+    """Skill and competency charts as JPEG bytes, or None without a working kaleido."""
+    if not CHARTS:
+        return None
+    import figures
+    from content import Skill
+
+    skills = figures.skills_figure(tuple(Skill(*s) for s in doc.skills), dict(doc.skill_colors))
+    radar = figures.radar_figure(dict(doc.competencies))
+    try:
+        return [fig.to_image(format="jpeg", width=900, height=fig.layout.height, scale=2) for fig in (skills, radar)]
+    except Exception:
+        # kaleido is installed but could not start its browser.
+        return None
+
+
+def render(doc):
+    """PDF bytes of the CV for ``doc``."""
+    pdf = PdfWriter()
+    flow = _Flow(pdf)
+
+    flow.paragraph(doc.name, size=22, bold=True, leading=1.1)
+    flow.space(4)
+    flow.paragraph(doc.headline, size=11, color=ACCENT)
+    if doc.badges:
+        flow.paragraph(" · ".join(doc.badges), size=9, color=MUTED)
+    if doc.links:
+        flow.paragraph("   ".join(f"{label}: {url}" for label, url in doc.links), size=9, color=MUTED)
+
+    flow.heading("Profile")
+    flow.paragraph(doc.bio)
+
+    flow.heading("Education & Experience")
+    for year, title, subtitle, note in doc.education:
+        flow.need(40)
+        flow.paragraph(f"{year}   {title}", bold=True)
+        if subtitle:
+            flow.paragraph(subtitle, size=9, color=MUTED)
+        if note:
+            flow.paragraph(note, size=9, color=MUTED)
+        flow.space(5)
+
+    if doc.certs:
+        flow.heading("Certifications")
+        for cert in doc.certs:
+            flow.paragraph(f"•  {cert}")
+
+    for heading, cards in (("Projects", doc.projects), ("Accomplishments", doc.accomplishments)):
+        if not cards:
+            continue
+        flow.heading(heading)
+        for title, desc in cards:
+            flow.need(40)
+            flow.paragraph(title, bold=True)
+            flow.paragraph(desc, size=9, color=MUTED)
+            flow.space(5)
+
+    charts = _charts(doc)
+    colors = dict(doc.skill_colors)
+    flow.heading("Technical Skills")
+    if charts:
+        flow.image(charts[0])
+    else:
+        flow.bars([(name, value, colors.get(category, BAR_COLOR)) for name, value, category in doc.skills])
+    flow.heading("Competencies")
+    if charts:
+        flow.image(charts[1])
+    else:
+        flow.bars([(name, value, BAR_COLOR) for name, value in doc.competencies])
+
+    total = len(pdf.pages)
+    for page in range(total):
+        footer = f"{doc.name} · CV · {page + 1}/{total}"
+        pdf.text(PAGE_WIDTH - MARGIN - text_width(footer, 8), MARGIN / 2, footer, 8, color=MUTED, page=page)
+    return pdf.tobytes()
+
+
+# ── Background generation ────────────────────────────────────────────────────
+def build(doc, path):
+    """Render ``doc`` and write it to ``path`` atomically; runs in a pool worker."""
+    atomic.write(path, render(doc))
+    return path
+
+
+def _finished(path, future):
+    global builds, failures
+    with _lock:
+        _jobs.pop(path, None)
+        if future.cancelled() or future.exception() is not None:
+            failures += 1
+        else:
+            builds += 1
+
+
+def submit(doc, cache_dir=CACHE_DIR):
+    """Future for the path of ``doc``'s PDF, starting a build unless it is cached or already running."""
+    global hits, misses
+    path = os.path.join(cache_dir, f"{digest(doc)}.pdf")
+    with _lock:
+        job = _jobs.get(path)
+        if job is not None:
+            return job
+        if os.path.exists(path):
+            hits += 1
+            job = Future()
+            job.set_result(path)
+            return job
+    pool = pools.get("cv", MAX_WORKERS)
+    with _lock:
+        job = _jobs.get(path)
+        if job is not None:
+            return job
+        misses += 1
+        job = _jobs[path] = pool.submit(build, doc, path)
+    # Outside the lock: a job that is already done runs the callback right here.
+    job.add_done_callback(lambda future: _finished(path, future))
+    return job
+
+
+def cached(doc, cache_dir=CACHE_DIR):
+    """Path of ``doc``'s PDF if it has already been built, else None."""
+    path = os.path.join(cache_dir, f"{digest(doc)}.pdf")
+    return path if os.path.exists(path) else None
+
+
+def pdf(profile):
+    """PDF bytes of ``profile``'s CV. Blocks until built, so call it off the script thread."""
+    with open(submit(document(profile)).result(), "rb") as f:
+        return f.read()
@@ -0,0 +1,127 @@
+"""Process-wide, read-only datasets shared by every session.
+
+Streamlit reruns a page's script for each session, so data built inside a
+view is rebuilt, and held, once per visitor. ``get`` builds a dataset once
+per process and key instead and hands every session the same object, frozen
+so no session can change it under another:
+
+* NumPy arrays are marked non-writeable.
+* DataFrames and Series are rebuilt on non-writeable column arrays. pandas
+  copy-on-write (always on from pandas 3, switched on here for pandas 2 the
+  first time a frame is frozen) makes every derived frame a lazy copy, and an
+  in-place write to the shared frame raises instead of leaking into other
+  sessions. pandas itself is never imported here: a value can only be a
+  DataFrame if its builder already loaded pandas.
+* Tuples, lists and dicts are frozen item by item into tuples and read-only
+  mappings.
+
+``report`` lists what is held and how large it is, for the diagnostics page
+and scripts/memory_report.py.
+"""
+import sys
+import threading
+from collections import OrderedDict, namedtuple
+from types import MappingProxyType
+
+import numpy as np
+
+# Keyed variants (filters, source file versions) kept before the oldest is dropped.
+MAX_ENTRIES = 64
+
+Dataset = namedtuple("Dataset", ["name", "kind", "nbytes", "readonly"])
+
+_shared = OrderedDict()
+_lock = threading.Lock()
+_copy_on_write = False
+
+
+def _pandas():
+    """The pandas module if some builder has loaded it, else ``None``."""
+    global _copy_on_write
+    pd = sys.modules.get("pandas")
+    if pd is not None and not _copy_on_write:
+        if int(pd.__version__.split(".")[0]) < 3:
+            pd.set_option("mode.copy_on_write", True)
+        _copy_on_write = True
+    return pd
+
+
+def freeze(obj):
+    """``obj`` made read-only; arrays are frozen in place, containers rebuilt."""
+    if isinstance(obj, np.ndarray):
+        obj.setflags(write=False)
+        return obj
+    pd = _pandas()
+    if pd is not None and isinstance(obj, pd.DataFrame):
+        columns = {name: freeze(obj[name].to_numpy(copy=True)) for name in obj.columns}
+        return pd.DataFrame(columns, index=obj.index, copy=False)
+    if pd is not None and isinstance(obj, pd.Series):
+        return pd.Series(freeze(obj.to_numpy(copy=True)), index=obj.index, name=obj.name, copy=False)
+    if isinstance(obj, tuple) and hasattr(obj, "_fields"):
+        return obj._make(freeze(item) for item in obj)
+    if isinstance(obj, (tuple, list)):
+        return tuple(freeze(item) for item in obj)
+    if isinstance(obj, dict):
+        return MappingProxyType({key: freeze(value) for key, value in obj.items()})
+    return obj
+
+
+def get(key, build):
+    """The shared, frozen result of ``build()`` for ``key`` (built once per process)."""
+    with _lock:
+        if key in _shared:
+            _shared.move_to_end(key)
+            return _shared[key]
+    value = freeze(build())
+    with _lock:
+        # Another session may have built it meanwhile; keep the first copy.
+        value = _shared.setdefault(key, value)
+        _shared.move_to_end(key)
+        while len(_shared) > MAX_ENTRIES:
+            _shared.popitem(last=False)
+        return value
+
+
+def _nbytes(obj):
+    if isinstance(obj, np.ndarray):
+        return obj.nbytes
+    pd = _pandas()
+    if pd is not None and isinstance(obj, pd.DataFrame):
+        return int(obj.memory_usage(index=True, deep=True).sum())
+    if pd is not None and isinstance(obj, pd.Series):
+        return int(obj.memory_usage(index=True, deep=True))
+    if isinstance(obj, tuple):
+        return sum(_nbytes(item) for item in obj)
+    if isinstance(obj, MappingProxyType):
+        return sum(_nbytes(item) for item in obj.values())
+    return 0
+
+
+def _readonly(obj):
+    if isinstance(obj, np.ndarray):
+        return not obj.flags.writeable
+    pd = _pandas()
+    if pd is not None and isinstance(obj, pd.DataFrame):
+        return all(not obj[name].to_numpy().flags.writeable for name in obj.columns)
+    if pd is not None and isinstance(obj, pd.Series):
+        return not obj.to_numpy().flags.writeable
+    if isinstance(obj, tuple):
+        return all(_readonly(item) for item in obj)
+    if isinstance(obj, MappingProxyType):
+        return all(_readonly(item) for item in obj.values())
+    return True
+
+
+def report():
+    """One ``Dataset`` row per shared object, most recently used last."""
+    with _lock:
+        items = list(_shared.items())
+    return [
+        Dataset(key if isinstance(key, str) else " · ".join(map(str, key)), type(value).__name__,
+                _nbytes(value), _readonly(value))
+        for key, value in items
+    ]
+
+
+def size():
+    return len(_shared)
@@ -0,0 +1,77 @@
+"""Progressive first paint: charts are built off the script thread.
+
+Streamlit sends each element as soon as the script creates it, so a figure
+built inline holds back every header and card below it. Inside
+``progressive()`` a view's ``chart(build, *data)`` call instead reserves a
+placeholder, hands ``build(*data)`` to a shared thread pool and returns at
+once. The rest of the page, text included, goes out immediately. When the
+block ends, each placeholder is filled as soon as its figure is ready, in
+completion order. Time to first content therefore no longer depends on how
+many charts a page has.
+
+Work that has to draw from the script thread itself, such as a simulation
+streaming partial results into its own placeholders, goes through
+``later(fn)``: it runs after the deferred charts, still below its heading.
+
+Outside ``progressive()`` (a fragment rerunning on its own, or the static
+export) ``chart`` and ``later`` run inline as before.
+"""
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+
+import streamlit as st
+
+import metrics
+
+WORKERS = int(os.environ.get("PROFILE_CHART_WORKERS", "4"))
+PLACEHOLDER = '<div class="chart-placeholder" style="height:{height}px"></div>'
+
+_pool = ThreadPoolExecutor(max_workers=WORKERS, thread_name_prefix="chart")
+# Streamlit runs each session's script in its own thread.
+_local = threading.local()
+
+
+def _build(build, data):
+    with metrics.section(f"figure.{build.__name__}"):
+        return build(*data)
+
+
+def chart(build, *data, height=400):
+    """Draw ``build(*data)`` now, or reserve a placeholder inside ``progressive()``."""
+    pending = getattr(_local, "pending", None)
+    if pending is None:
+        st.plotly_chart(_build(build, data), use_container_width=True)
+        return
+    placeholder = st.empty()
+    placeholder.markdown(PLACEHOLDER.format(height=height), unsafe_allow_html=True)
+    pending[_pool.submit(_build, build, data)] = placeholder
+
+
+def later(fn):
+    """Call ``fn()`` at the end of ``progressive()``, or now outside it."""
+    queued = getattr(_local, "later", None)
+    if queued is None:
+        fn()
+    else:
+        queued.append(fn)
+
+
+@contextmanager
+def progressive():
+    """Defer ``chart`` and ``later`` calls made in the block and fill them in as they finish."""
+    pending = _local.pending = {}
+    queued = _local.later = []
+    try:
+        yield
+    except BaseException:
+        for future in pending:
+            future.cancel()
+        raise
+    finally:
+        _local.pending = _local.later = None
+    for future in as_completed(pending):
+        pending[future].plotly_chart(future.result(), use_container_width=True)
+    for fn in queued:
+        fn()
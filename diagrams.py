@@ -0,0 +1,109 @@
+"""Box-and-arrow diagrams compiled to static SVG.
+
+A diagram spec is the same ``boxes``/``arrows`` data ``figures.architecture_figure``
+takes: boxes are dicts with ``x``, ``y`` (0-1, origin bottom left), ``text``
+and ``color``; arrows are ``(ax, ay, bx, by)`` tuples from tail to head.
+
+``compile_svg`` renders a spec once, writes it to static/ under a
+content-hashed name and remembers the result, so the page only sends a short
+``<img>`` tag and browsers cache the file for good. The interactive Plotly
+figure stays available as a fallback.
+"""
+import base64
+import hashlib
+import html
+import json
+import os
+import threading
+from collections import OrderedDict, namedtuple
+
+import atomic
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+STATIC_DIR = os.path.join(ROOT, "static")
+
+# Canvas and box geometry match the Plotly version (480px tall, 20/10px margins).
+WIDTH, HEIGHT = 1000, 480
+MARGIN_X, MARGIN_Y = 20, 10
+BOX_W, BOX_H = 0.26, 0.12
+FONT_SIZE, LINE_HEIGHT = 13, 16
+ARROW_COLOR = "#6b7c8a"
+# Compiled specs kept in memory; one per recently viewed profile and variant.
+MAX_COMPILED = 256
+
+Diagram = namedtuple("Diagram", ["name", "svg"])
+
+_compiled = OrderedDict()
+_lock = threading.Lock()
+
+
+def _px(x, y):
+    return (MARGIN_X + x * (WIDTH - 2 * MARGIN_X), MARGIN_Y + (1 - y) * (HEIGHT - 2 * MARGIN_Y))
+
+
+def to_svg(boxes, arrows, title="Architecture diagram"):
+    """SVG markup for a diagram spec."""
+    box_w = BOX_W * (WIDTH - 2 * MARGIN_X)
+    box_h = BOX_H * (HEIGHT - 2 * MARGIN_Y)
+    parts = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {WIDTH} {HEIGHT}" '
+        f'width="100%" role="img" aria-label="{html.escape(title)}">',
+        f"<title>{html.escape(title)}</title>",
+        "<defs><marker id=\"head\" viewBox=\"0 0 10 10\" refX=\"9\" refY=\"5\" markerWidth=\"7\" "
+        f"markerHeight=\"7\" orient=\"auto-start-reverse\"><path d=\"M0,0 L10,5 L0,10 z\" fill=\"{ARROW_COLOR}\"/>"
+        "</marker></defs>",
+    ]
+
+    for b in boxes:
+        cx, cy = _px(b["x"], b["y"])
+        parts.append(
+            f'<rect x="{cx - box_w / 2:.1f}" y="{cy - box_h / 2:.1f}" width="{box_w:.1f}" '
+            f'height="{box_h:.1f}" rx="4" fill="{html.escape(b["color"])}"/>'
+        )
+        lines = b["text"].split("\n")
+        top = cy - (len(lines) - 1) * LINE_HEIGHT / 2
+        spans = "".join(
+            f'<tspan x="{cx:.1f}" y="{top + i * LINE_HEIGHT:.1f}">{html.escape(line)}</tspan>'
+            for i, line in enumerate(lines)
+        )
+        parts.append(
+            f'<text fill="#ffffff" font-family="Inter, -apple-system, \'Segoe UI\', sans-serif" '
+            f'font-size="{FONT_SIZE}" text-anchor="middle" dominant-baseline="central">{spans}</text>'
+        )
+
+    for ax, ay, bx, by in arrows:
+        (x1, y1), (x2, y2) = _px(ax, ay), _px(bx, by)
+        parts.append(
+            f'<line x1="{x1:.1f}" y1="{y1:.1f}" x2="{x2:.1f}" y2="{y2:.1f}" '
+            f'stroke="{ARROW_COLOR}" stroke-width="1.5" marker-end="url(#head)"/>'
+        )
+
+    parts.append("</svg>")
+    return "\n".join(parts)
+
+
+def compile_svg(boxes, arrows, stem="architecture", out_dir=STATIC_DIR):
+    """Render a spec to ``<out_dir>/<stem>.<hash>.svg`` once per process and spec."""
+    spec = json.dumps([stem, boxes, arrows])
+    with _lock:
+        diagram = _compiled.get(spec)
+        if diagram is not None:
+            _compiled.move_to_end(spec)
+            return diagram
+        svg = to_svg(boxes, arrows)
+        data = svg.encode("utf-8")
+        name = f"{stem}.{hashlib.sha256(data).hexdigest()[:12]}.svg"
+        atomic.write_once(os.path.join(out_dir, name), data)
+        diagram = _compiled[spec] = Diagram(name, svg)
+        while len(_compiled) > MAX_COMPILED:
+            _compiled.popitem(last=False)
+        return diagram
+
+
+def image_tag(diagram, served=True, alt="Architecture diagram"):
+    """``<img>`` for a compiled diagram, from app/static or inlined as a data URI."""
+    if served:
+        src = f"app/static/{diagram.name}"
+    else:
+        src = "data:image/svg+xml;base64," + base64.b64encode(diagram.svg.encode("utf-8")).decode("ascii")
+    return f'<img src="{src}" alt="{html.escape(alt)}" style="width:100%;height:auto;display:block;">'
@@ -0,0 +1,104 @@
+"""Server-side downsampling so chart payloads stay bounded.
+
+Views cut a series to the visible x range first and then reduce it to at most
+``MAX_POINTS`` before building a figure. Zooming into a narrower range
+therefore shows finer detail, and the browser never receives more points
+than the chart can draw, however long the source series is.
+
+* ``series`` reduces one line with LTTB (largest triangle three buckets, which
+  keeps the visual shape) or min/max bucketing (which keeps every spike).
+* ``mean_buckets`` averages several series that share an x axis, for grouped
+  bars and aligned lines such as monthly ORT/ART.
+
+``x`` must be sorted ascending (numbers or ``datetime64``).
+"""
+import numpy as np
+
+MAX_POINTS = 1500
+
+
+def _numeric(x):
+    x = np.asarray(x)
+    if np.issubdtype(x.dtype, np.datetime64):
+        return x.astype("datetime64[ns]").astype(np.int64).astype(np.float64)
+    return x.astype(np.float64)
+
+
+def window(x, ys, x_range=None):
+    """Slice ``x`` and each of ``ys`` to ``x_range`` (inclusive), if given."""
+    x = np.asarray(x)
+    ys = [np.asarray(y) for y in ys]
+    if x_range is None:
+        return x, ys
+    lo = np.searchsorted(x, np.asarray(x_range[0], dtype=x.dtype), side="left")
+    hi = np.searchsorted(x, np.asarray(x_range[1], dtype=x.dtype), side="right")
+    return x[lo:hi], [y[lo:hi] for y in ys]
+
+
+def lttb(x, y, n_out):
+    """Indices of the ``n_out`` points LTTB keeps (always first and last)."""
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    xf, yf = _numeric(x), np.asarray(y, dtype=np.float64)
+    # n_out - 2 buckets between the fixed first and last points.
+    edges = (np.arange(n_out - 1) * ((n - 2) / (n_out - 2))).astype(np.int64) + 1
+    edges[-1] = n - 1
+
+    keep = np.empty(n_out, dtype=np.int64)
+    keep[0], keep[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        if i + 2 < len(edges):
+            following = slice(end, edges[i + 2])
+            cx, cy = xf[following].mean(), yf[following].mean()
+        else:
+            cx, cy = xf[-1], yf[-1]
+        bx, by = xf[start:end], yf[start:end]
+        area = np.abs((xf[a] - cx) * (by - yf[a]) - (xf[a] - bx) * (cy - yf[a]))
+        a = start + int(np.argmax(area))
+        keep[i + 1] = a
+    return keep
+
+
+def minmax(x, y, n_out):
+    """Indices of each bucket's minimum and maximum, in x order."""
+    n = len(x)
+    buckets = max(n_out // 2, 1)
+    if n <= n_out:
+        return np.arange(n)
+
+    y = np.asarray(y, dtype=np.float64)
+    starts = np.linspace(0, n, buckets + 1).astype(np.int64)[:-1]
+    lengths = np.diff(np.append(starts, n))
+    width = lengths.max()
+    # Pad ragged buckets into a (buckets, width) grid so argmin/argmax run once.
+    grid_idx = np.minimum(starts[:, None] + np.arange(width), n - 1)
+    grid = y[grid_idx]
+    pad = np.arange(width) >= lengths[:, None]
+    lo = np.where(pad, np.inf, grid).argmin(axis=1)
+    hi = np.where(pad, -np.inf, grid).argmax(axis=1)
+    return np.unique(np.concatenate([starts + lo, starts + hi]))
+
+
+def series(x, y, max_points=MAX_POINTS, x_range=None, method="lttb"):
+    """Visible, reduced ``(x, y)`` for one line trace."""
+    x, (y,) = window(x, [y], x_range)
+    keep = (lttb if method == "lttb" else minmax)(x, y, max_points)
+    return x[keep], y[keep]
+
+
+def mean_buckets(x, ys, max_points=MAX_POINTS, x_range=None):
+    """Average aligned series into at most ``max_points`` equal-count buckets.
+
+    Each bucket is labelled with its first x value.
+    """
+    x, ys = window(x, ys, x_range)
+    n = len(x)
+    if n <= max_points:
+        return x, ys
+    starts = np.linspace(0, n, max_points + 1).astype(np.int64)[:-1]
+    counts = np.diff(np.append(starts, n))
+    return x[starts], [np.add.reduceat(np.asarray(y, dtype=np.float64), starts) / counts for y in ys]
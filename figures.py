@@ -0,0 +1,417 @@
+"""Plotly figure builders for the profile pages.
+
+Every chart is produced by a builder function decorated with ``cached_figure``.
+Calls are keyed on a hash of the builder's input data and served from a
+process-wide cache, so all sessions share one prebuilt figure until the data
+it was built from changes.
+"""
+import hashlib
+import json
+import threading
+from collections import OrderedDict, namedtuple
+from collections.abc import Mapping
+from functools import wraps
+
+import plotly.graph_objects as go
+import plotly.io as pio
+
+FIGURE_CACHE_SIZE = 64
+# Chart controls produce a handful of variants of each figure (filters, date
+# ranges); keep this many per kind before evicting that kind's oldest.
+VARIANTS_PER_KIND = 8
+
+# Line traces switch to WebGL above this many points, and the ORT/ART chart
+# switches from grouped bars to lines above MAX_BARS months.
+WEBGL_THRESHOLD = 1000
+MAX_BARS = 60
+
+FigureEntry = namedtuple("FigureEntry", ["key", "figure"])
+
+# Every figure embeds its template in the JSON sent to the browser. "profile"
+# keeps the plotly_white layout keys these 2D charts use and drops the trace
+# defaults for chart types never drawn here, a few KB less per figure.
+TEMPLATE = "profile"
+_TEMPLATE_LAYOUT = ("autotypenumbers", "colorway", "font", "hovermode", "hoverlabel", "paper_bgcolor",
+                    "plot_bgcolor", "polar", "xaxis", "yaxis", "shapedefaults", "annotationdefaults", "title")
+
+
+def _register_template():
+    white = pio.templates["plotly_white"].layout.to_plotly_json()
+    pio.templates[TEMPLATE] = go.layout.Template(layout={k: white[k] for k in _TEMPLATE_LAYOUT if k in white})
+
+
+_register_template()
+
+
+def _jsonable(obj):
+    if isinstance(obj, Mapping):
+        return dict(obj)
+    if hasattr(obj, "to_dict"):
+        return obj.to_dict("list") if hasattr(obj, "columns") else obj.to_dict()
+    if hasattr(obj, "tolist"):
+        return obj.tolist()
+    if isinstance(obj, (set, frozenset)):
+        return sorted(obj)
+    return str(obj)
+
+
+def data_key(*data):
+    """Stable short hash of a builder's input data."""
+    payload = json.dumps(data, default=_jsonable)
+    return hashlib.sha256(payload.encode()).hexdigest()[:16]
+
+
+class FigureCache:
+    """Bounded LRU of built figures.
+
+    Entries are keyed on ``(kind, data_key)``. Each kind keeps at most
+    ``variants`` keys, most recently used last; when a builder is called with
+    new data the kind's oldest variant is dropped instead of waiting to age
+    out of the whole cache.
+    """
+
+    def __init__(self, max_entries=FIGURE_CACHE_SIZE, variants=VARIANTS_PER_KIND):
+        self.max_entries = max_entries
+        self.variants = variants
+        self._entries = OrderedDict()
+        self._current = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, kind, data, build):
+        key = (kind, data_key(*data))
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._current[kind].move_to_end(key)
+                self.hits += 1
+                return entry
+            self.misses += 1
+
+        fig = build(*data)
+        entry = FigureEntry(key[1], fig)
+
+        with self._lock:
+            current = self._current.setdefault(kind, OrderedDict())
+            current[key] = None
+            current.move_to_end(key)
+            while len(current) > self.variants:
+                self._entries.pop(current.popitem(last=False)[0], None)
+            self._entries[key] = entry
+            while len(self._entries) > self.max_entries:
+                old, _ = self._entries.popitem(last=False)
+                self._current.get(old[0], {}).pop(old, None)
+        return entry
+
+    def invalidate(self, kind=None):
+        """Drop every cached figure, or only those of one ``kind``."""
+        with self._lock:
+            if kind is None:
+                self._entries.clear()
+                self._current.clear()
+                return
+            for key in [k for k in self._entries if k[0] == kind]:
+                del self._entries[key]
+            self._current.pop(kind, None)
+
+    def __len__(self):
+        return len(self._entries)
+
+
+cache = FigureCache()
+
+
+def cached_figure(kind):
+    """Serve a figure builder through the shared ``cache``.
+
+    The wrapped function returns the cached ``go.Figure``; ``.entry(*data)``
+    returns the ``FigureEntry`` with its data key and ``.build`` is the
+    undecorated builder.
+    """
+    def decorator(build):
+        @wraps(build)
+        def figure(*data):
+            return cache.get(kind, data, build).figure
+
+        figure.entry = lambda *data: cache.get(kind, data, build)
+        figure.build = build
+        figure.kind = kind
+        return figure
+    return decorator
+
+
+def invalidate(kind=None):
+    cache.invalidate(kind)
+
+
+def scatter(n_points, **kwargs):
+    """``go.Scatter``, or ``go.Scattergl`` for large series."""
+    trace = go.Scattergl if n_points > WEBGL_THRESHOLD else go.Scatter
+    return trace(**kwargs)
+
+
+# ── Research & Projects ──────────────────────────────────────────────────────
+@cached_figure("architecture")
+def architecture_figure(boxes, arrows):
+    fig_arch = go.Figure()
+
+    for b in boxes:
+        fig_arch.add_shape(
+            type="rect",
+            x0=b["x"] - 0.13, y0=b["y"] - 0.06,
+            x1=b["x"] + 0.13, y1=b["y"] + 0.06,
+            fillcolor=b["color"], line=dict(width=0),
+            layer="below",
+        )
+        fig_arch.add_annotation(
+            x=b["x"], y=b["y"], text=b["text"],
+            showarrow=False, font=dict(color="white", size=11),
+        )
+
+    for ax, ay, bx, by in arrows:
+        fig_arch.add_annotation(
+            x=bx, y=by, ax=ax, ay=ay,
+            xref="x", yref="y", axref="x", ayref="y",
+            showarrow=True, arrowhead=2, arrowsize=1.2,
+            arrowwidth=1.5, arrowcolor="#6b7c8a",
+        )
+
+    fig_arch.update_layout(
+        xaxis=dict(range=[0, 1], showgrid=False, zeroline=False, visible=False),
+        yaxis=dict(range=[0, 1], showgrid=False, zeroline=False, visible=False),
+        height=480, margin=dict(l=20, r=20, t=10, b=10), template=TEMPLATE,
+        plot_bgcolor="rgba(0,0,0,0)", paper_bgcolor="rgba(0,0,0,0)",
+    )
+    return fig_arch
+
+
+@cached_figure("infra")
+def infra_figure(months, ort, art):
+    gap = [a - o for o, a in zip(ort, art)]
+
+    fig_infra = go.Figure()
+    if len(months) <= MAX_BARS:
+        fig_infra.add_trace(go.Bar(x=months, y=ort, name="Optimal Response Time (hrs)", marker_color="#2c5364"))
+        fig_infra.add_trace(go.Bar(x=months, y=art, name="Actual Repair Time (hrs)", marker_color="#e07a5f"))
+    else:
+        fig_infra.add_trace(scatter(len(months), x=months, y=ort, name="Optimal Response Time (hrs)",
+                                    line=dict(color="#2c5364", width=1.5)))
+        fig_infra.add_trace(scatter(len(months), x=months, y=art, name="Actual Repair Time (hrs)",
+                                    line=dict(color="#e07a5f", width=1.5)))
+    fig_infra.add_trace(scatter(
+        len(months), x=months, y=gap, name="Gap (ART - ORT)",
+        line=dict(color="#f2cc8f", width=2.5, dash="dot"), yaxis="y",
+    ))
+    fig_infra.update_layout(
+        barmode="group", height=400, template=TEMPLATE,
+        yaxis_title="Hours",
+        legend=dict(orientation="h", yanchor="bottom", y=-0.25, xanchor="center", x=0.5),
+        margin=dict(l=40, r=20, t=20, b=60),
+    )
+    return fig_infra
+
+
+# ── Skills & Tools ───────────────────────────────────────────────────────────
+@cached_figure("skills")
+def skills_figure(rows, cat_colors):
+    by_category = {}
+    for s in rows:
+        by_category.setdefault(s.category, []).append(s)
+
+    fig_skills = go.Figure()
+    for cat, subset in by_category.items():
+        fig_skills.add_trace(go.Bar(
+            y=[s.name for s in subset], x=[s.proficiency for s in subset],
+            orientation="h", name=cat,
+            marker_color=cat_colors.get(cat, "#2c5364"),
+            text=[f"{s.proficiency}%" for s in subset],
+            textposition="outside",
+        ))
+    fig_skills.update_layout(
+        barmode="group", height=520, template=TEMPLATE,
+        xaxis=dict(range=[0, 105], title="Proficiency (%)"),
+        legend=dict(orientation="h", yanchor="bottom", y=-0.15, xanchor="center", x=0.5),
+        margin=dict(l=140, r=40, t=20, b=60),
+    )
+    return fig_skills
+
+
+@cached_figure("radar")
+def radar_figure(competencies):
+    categories = list(competencies)
+    values = list(competencies.values())
+    values_closed = values + [values[0]]
+    categories_closed = categories + [categories[0]]
+
+    fig_radar = go.Figure(go.Scatterpolar(
+        r=values_closed, theta=categories_closed,
+        fill="toself", fillcolor="rgba(44,83,100,0.2)",
+        line=dict(color="#2c5364", width=2),
+        marker=dict(size=6, color="#2c5364"),
+    ))
+    fig_radar.update_layout(
+        polar=dict(radialaxis=dict(visible=True, range=[0, 100])),
+        height=420, margin=dict(l=60, r=60, t=40, b=40),
+        template=TEMPLATE,
+    )
+    return fig_radar
+
+
+# ── Achievements & Impact ────────────────────────────────────────────────────
+@cached_figure("perf")
+def perf_figure(before, after):
+    (before_x, before_opt), (after_x, after_opt) = before, after
+    fig_perf = go.Figure()
+    fig_perf.add_trace(scatter(
+        len(before_opt), x=before_x, y=before_opt, name="Before Optimization",
+        line=dict(color="#e07a5f", width=2.5), mode="lines+markers",
+    ))
+    fig_perf.add_trace(scatter(
+        len(after_opt), x=after_x, y=after_opt, name="After Optimization",
+        line=dict(color="#2c5364", width=2.5), mode="lines+markers",
+        fill="tonexty", fillcolor="rgba(44,83,100,0.1)",
+    ))
+    fig_perf.update_layout(
+        height=380, template=TEMPLATE,
+        xaxis_title="Optimization Iteration",
+        yaxis_title="Execution Latency (seconds)",
+        legend=dict(orientation="h", yanchor="bottom", y=-0.2, xanchor="center", x=0.5),
+        margin=dict(l=40, r=20, t=20, b=60),
+    )
+    return fig_perf
+
+
+@cached_figure("bench_trend")
+def bench_trend_figure(labels, median, q1, q3, p95, regressed):
+    fig = go.Figure()
+    fig.add_trace(scatter(len(labels), x=labels, y=q3, line=dict(width=0), showlegend=False, hoverinfo="skip"))
+    fig.add_trace(scatter(
+        len(labels), x=labels, y=q1, name="Interquartile range", line=dict(width=0),
+        fill="tonexty", fillcolor="rgba(44,83,100,0.15)",
+    ))
+    fig.add_trace(scatter(len(labels), x=labels, y=p95, name="p95", line=dict(color="#81b29a", width=1.5, dash="dot")))
+    fig.add_trace(scatter(len(labels), x=labels, y=median, name="Median", mode="lines+markers",
+                          line=dict(color="#2c5364", width=2.5)))
+    flagged = [i for i, r in enumerate(regressed) if r]
+    if flagged:
+        fig.add_trace(go.Scatter(
+            x=[labels[i] for i in flagged], y=[median[i] for i in flagged], name="Regression",
+            mode="markers", marker=dict(color="#e07a5f", size=11, symbol="triangle-up"),
+        ))
+    fig.update_layout(
+        height=380, template=TEMPLATE,
+        xaxis=dict(title="Run", type="category"),
+        yaxis_title="Time per call (seconds)",
+        legend=dict(orientation="h", yanchor="bottom", y=-0.35, xanchor="center", x=0.5),
+        margin=dict(l=40, r=20, t=20, b=60),
+    )
+    return fig
+
+
+@cached_figure("bench_distribution")
+def bench_distribution_figure(labels, q1, median, q3, lower, upper, mean, count):
+    # Quartiles are computed server-side, so each box costs a few numbers
+    # rather than every raw sample.
+    fig = go.Figure(go.Box(
+        x=labels, q1=q1, median=median, q3=q3, lowerfence=lower, upperfence=upper, mean=mean,
+        marker_color="#2c5364", name="Samples", customdata=count,
+        hovertemplate="%{x}<br>median %{median:.4g}s<br>%{customdata} samples<extra></extra>",
+    ))
+    fig.update_layout(
+        height=380, template=TEMPLATE,
+        xaxis=dict(title="Run", type="category"),
+        yaxis_title="Time per call (seconds)",
+        margin=dict(l=40, r=20, t=20, b=60),
+    )
+    return fig
+
+
+@cached_figure("forecast")
+def forecast_figure(months, incidents, repair_hours, history_months=(), history_incidents=()):
+    fig_fc = go.Figure()
+    if len(history_months):
+        fig_fc.add_trace(go.Bar(x=history_months, y=history_incidents, name="Recorded incidents",
+                                marker_color="#b0c4d0"))
+    fig_fc.add_trace(go.Bar(x=months, y=incidents, name="Predicted incidents", marker_color="#2c5364"))
+    fig_fc.add_trace(go.Scatter(
+        x=months, y=repair_hours, name="Predicted repair time (hrs)", yaxis="y2",
+        line=dict(color="#e07a5f", width=2.5),
+    ))
+    fig_fc.update_layout(
+        height=400, template=TEMPLATE,
+        yaxis_title="Incidents / month",
+        yaxis2=dict(title="Hours", overlaying="y", side="right", showgrid=False, rangemode="tozero"),
+        legend=dict(orientation="h", yanchor="bottom", y=-0.25, xanchor="center", x=0.5),
+        margin=dict(l=40, r=40, t=20, b=60),
+    )
+    return fig_fc
+
+
+@cached_figure("crews")
+def crew_figure(crews, p10, p50, p90, ort):
+    crews = list(crews)
+    fig_crews = go.Figure()
+    fig_crews.add_trace(go.Scatter(x=crews, y=p90, line=dict(width=0), hoverinfo="skip", showlegend=False))
+    fig_crews.add_trace(go.Scatter(
+        x=crews, y=p10, fill="tonexty", fillcolor="rgba(224,122,95,0.2)", line=dict(width=0),
+        name="ART 10th-90th percentile",
+    ))
+    fig_crews.add_trace(go.Scatter(x=crews, y=p50, name="Median ART (hrs)", line=dict(color="#e07a5f", width=2.5)))
+    fig_crews.add_trace(go.Scatter(
+        x=crews, y=[ort] * len(crews), name="Optimal Response Time (hrs)",
+        line=dict(color="#2c5364", width=2, dash="dot"),
+    ))
+    fig_crews.update_layout(
+        height=400, template=TEMPLATE,
+        xaxis=dict(title="Crews on duty", dtick=1), yaxis=dict(title="Hours", type="log"),
+        legend=dict(orientation="h", yanchor="bottom", y=-0.3, xanchor="center", x=0.5),
+        margin=dict(l=40, r=20, t=20, b=60),
+    )
+    return fig_crews
+
+
+@cached_figure("biz")
+def biz_figure(quarters, sa_engagement, drc_engagement, sa_conversion, drc_conversion, countries=("SA", "DRC")):
+    fig_biz = go.Figure()
+    if "SA" in countries:
+        fig_biz.add_trace(go.Bar(x=quarters, y=sa_engagement, name="SA — User Engagement", marker_color="#2c5364"))
+    if "DRC" in countries:
+        fig_biz.add_trace(go.Bar(x=quarters, y=drc_engagement, name="DRC — User Engagement", marker_color="#81b29a"))
+    if "SA" in countries:
+        fig_biz.add_trace(go.Scatter(
+            x=quarters, y=[c * 100 for c in sa_conversion], name="SA — Conversion Rate (x100)",
+            line=dict(color="#f2cc8f", width=2.5), yaxis="y",
+        ))
+    if "DRC" in countries:
+        fig_biz.add_trace(go.Scatter(
+            x=quarters, y=[c * 100 for c in drc_conversion], name="DRC — Conversion Rate (x100)",
+            line=dict(color="#e07a5f", width=2.5, dash="dot"), yaxis="y",
+        ))
+    fig_biz.update_layout(
+        barmode="group", height=420, template=TEMPLATE,
+        yaxis_title="Users / Rate (x100)",
+        legend=dict(orientation="h", yanchor="bottom", y=-0.25, xanchor="center", x=0.5),
+        margin=dict(l=40, r=20, t=20, b=60),
+    )
+    return fig_biz
+
+
+@cached_figure("interests")
+def interests_figure(interests):
+    fig_int = go.Figure(go.Bar(
+        x=list(interests.values()),
+        y=list(interests.keys()),
+        orientation="h",
+        marker=dict(
+            color=list(interests.values()),
+            colorscale=[[0, "#b0d4e8"], [1, "#0f2027"]],
+        ),
+    ))
+    fig_int.update_layout(
+        height=350, template=TEMPLATE,
+        xaxis=dict(title="Interest Level", range=[0, 100]),
+        margin=dict(l=200, r=20, t=10, b=40),
+    )
+    return fig_int
@@ -0,0 +1,305 @@
+"""Durable storage for contact-form messages.
+
+``submit`` validates a message, applies rate limits and duplicate detection in
+memory, and hands it to a background writer thread through a bounded queue.
+It never touches the disk and never waits, so a burst of submissions costs
+the script thread a few dictionary lookups.
+
+The writer drains the queue in batches (up to ``BATCH_MAX`` messages, or
+whatever arrived within ``BATCH_WAIT`` seconds) and commits each batch in one
+transaction to a SQLite database in WAL mode. A message counts as received
+for duplicate detection only once its batch has committed; a UNIQUE content
+hash backs that check across restarts. If the database cannot be opened the
+writer retries with backoff, and ``submit`` answers ``BUSY`` until it is
+connected. Rows that cannot be written are logged, never silently dropped.
+
+Configure with ``PROFILE_MESSAGES_DB`` (default ``data/messages.sqlite3``) and
+``PROFILE_TRUST_PROXY=1`` to take the client address from
+``X-Forwarded-For`` when the app sits behind a reverse proxy.
+"""
+import atexit
+import hashlib
+import logging
+import os
+import queue
+import sqlite3
+import threading
+import time
+from collections import OrderedDict, deque
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+DB_PATH = os.environ.get("PROFILE_MESSAGES_DB", os.path.join(ROOT, "data", "messages.sqlite3"))
+TRUST_PROXY = os.environ.get("PROFILE_TRUST_PROXY", "").lower() in ("1", "true", "yes", "on")
+
+QUEUE_MAX = 1000
+BATCH_MAX = 100
+BATCH_WAIT = 0.25
+# Seconds between attempts to open the database, doubling up to the maximum.
+CONNECT_RETRY = (0.5, 30.0)
+
+# (max submissions, window seconds)
+SESSION_LIMIT = (3, 60)
+IP_LIMIT = (10, 3600)
+RECENT_HASHES = 4096
+
+MAX_LENGTHS = {"name": 200, "email": 320, "message": 5000}
+
+# submit() outcomes
+QUEUED = "queued"
+DUPLICATE = "duplicate"
+RATE_LIMITED = "rate_limited"
+INVALID = "invalid"
+BUSY = "busy"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS messages (
+    id INTEGER PRIMARY KEY,
+    received_at REAL NOT NULL,
+    name TEXT NOT NULL,
+    email TEXT NOT NULL,
+    message TEXT NOT NULL,
+    ip TEXT,
+    session_id TEXT,
+    content_hash TEXT NOT NULL UNIQUE
+)
+"""
+
+log = logging.getLogger(__name__)
+
+_queue = queue.Queue(maxsize=QUEUE_MAX)
+_lock = threading.Lock()
+_hits = {}
+# Digests committed recently, and digests queued but not yet committed.
+_recent = OrderedDict()
+_pending = set()
+_writer = None
+# Set while the writer cannot open the database.
+_unavailable = threading.Event()
+
+
+# ── Admission (script thread) ────────────────────────────────────────────────
+def content_hash(name, email, message):
+    """Identity of a message: same sender and same text, ignoring case and spacing."""
+    norm = "\x1f".join(" ".join(part.split()).lower() for part in (name, email, message))
+    return hashlib.sha256(norm.encode()).hexdigest()
+
+
+def _allow(key, limit, now):
+    max_hits, window = limit
+    hits = _hits.get(key)
+    if hits is None:
+        hits = _hits[key] = deque()
+    while hits and now - hits[0] > window:
+        hits.popleft()
+    if len(hits) >= max_hits:
+        return False
+    hits.append(now)
+    return True
+
+
+def _prune_hits(now):
+    longest = max(SESSION_LIMIT[1], IP_LIMIT[1])
+    for key in [k for k, hits in _hits.items() if not hits or now - hits[-1] > longest]:
+        del _hits[key]
+
+
+def validate(name, email, message):
+    """Cleaned ``(name, email, message)``, or ``None`` if the form is unusable."""
+    name, email, message = (value.strip() for value in (name or "", email or "", message or ""))
+    if not message or "@" not in email or "." not in email.rsplit("@", 1)[-1]:
+        return None
+    if any(len(value) > MAX_LENGTHS[field] for field, value in zip(MAX_LENGTHS, (name, email, message))):
+        return None
+    return name, email, message
+
+
+def submit(name, email, message, ip=None, session_id=None):
+    """Queue a message for storage; returns one of the outcome constants."""
+    cleaned = validate(name, email, message)
+    if cleaned is None:
+        return INVALID
+    digest = content_hash(*cleaned)
+    now = time.monotonic()
+
+    if not _writer_ready():
+        # Accepting now would promise storage the writer cannot deliver.
+        _ensure_writer()
+        return BUSY
+
+    # One critical section, so two identical submissions cannot both pass the
+    # duplicate check before either is marked pending.
+    with _lock:
+        if digest in _recent or digest in _pending:
+            return DUPLICATE
+        if len(_hits) > 4 * RECENT_HASHES:
+            _prune_hits(now)
+        # Check the session first so one noisy tab does not spend its IP's budget.
+        if session_id and not _allow(("session", session_id), SESSION_LIMIT, now):
+            return RATE_LIMITED
+        if ip and not _allow(("ip", ip), IP_LIMIT, now):
+            return RATE_LIMITED
+        try:
+            _queue.put_nowait((time.time(), *cleaned, ip, session_id, digest))
+        except queue.Full:
+            return BUSY
+        _pending.add(digest)
+
+    _ensure_writer()
+    return QUEUED
+
+
+def client():
+    """``(ip, session_id)`` of the current Streamlit session, where known."""
+    from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+    ctx = get_script_run_ctx()
+    session_id = ctx.session_id if ctx is not None else None
+    ip = None
+    try:
+        import streamlit as st
+
+        if TRUST_PROXY:
+            forwarded = st.context.headers.get("X-Forwarded-For")
+            if forwarded:
+                ip = forwarded.split(",")[0].strip()
+        ip = ip or getattr(st.context, "ip_address", None)
+    except (AttributeError, RuntimeError):
+        pass
+    return (ip if isinstance(ip, str) else None), session_id
+
+
+# ── Writer thread ────────────────────────────────────────────────────────────
+def connect(path=DB_PATH):
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    conn = sqlite3.connect(path, check_same_thread=False)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute(SCHEMA)
+    conn.commit()
+    return conn
+
+
+def _next_batch():
+    batch = [_queue.get()]
+    deadline = time.monotonic() + BATCH_WAIT
+    while len(batch) < BATCH_MAX:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        try:
+            batch.append(_queue.get(timeout=remaining))
+        except queue.Empty:
+            break
+    return batch
+
+
+def _write(conn, batch):
+    with conn:
+        conn.executemany(
+            "INSERT OR IGNORE INTO messages "
+            "(received_at, name, email, message, ip, session_id, content_hash) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            batch,
+        )
+
+
+def _committed(rows):
+    with _lock:
+        for row in rows:
+            digest = row[-1]
+            _pending.discard(digest)
+            _recent[digest] = None
+            _recent.move_to_end(digest)
+        while len(_recent) > RECENT_HASHES:
+            _recent.popitem(last=False)
+
+
+def _dropped(row, exc):
+    with _lock:
+        _pending.discard(row[-1])
+    log.error("inbox: dropped message %s received at %.3f: %s", row[-1][:12], row[0], exc)
+
+
+def _connect_with_retry():
+    delay, longest = CONNECT_RETRY
+    while True:
+        try:
+            conn = connect()
+        except (sqlite3.Error, OSError) as exc:
+            _unavailable.set()
+            log.warning("inbox: cannot open %s (%s); retrying in %.1fs", DB_PATH, exc, delay)
+            time.sleep(delay)
+            delay = min(delay * 2, longest)
+        else:
+            _unavailable.clear()
+            return conn
+
+
+def _write_loop():
+    conn = _connect_with_retry()
+    while True:
+        batch = _next_batch()
+        try:
+            _write(conn, batch)
+            _committed(batch)
+        except sqlite3.Error:
+            # Most likely a transient lock held by an external reader. Retry
+            # row by row so one bad row cannot take the rest of the batch down.
+            time.sleep(BATCH_WAIT)
+            for row in batch:
+                try:
+                    _write(conn, [row])
+                except sqlite3.Error as exc:
+                    _dropped(row, exc)
+                else:
+                    _committed([row])
+        finally:
+            for _ in batch:
+                _queue.task_done()
+
+
+def _writer_ready():
+    """False when the writer thread has died or cannot open the database."""
+    return _writer is None or (_writer.is_alive() and not _unavailable.is_set())
+
+
+def _ensure_writer():
+    global _writer
+    if _writer is not None and _writer.is_alive():
+        return
+    with _lock:
+        if _writer is None or not _writer.is_alive():
+            _writer = threading.Thread(target=_write_loop, name="inbox-writer", daemon=True)
+            _writer.start()
+
+
+def flush(timeout=5.0):
+    """Wait up to ``timeout`` seconds for queued messages to be committed."""
+    if _writer is None:
+        return True
+    deadline = time.monotonic() + timeout
+    while _queue.unfinished_tasks:
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+def _flush_at_exit():
+    if not flush():
+        log.error("inbox: exiting with %d messages not written to %s", _queue.unfinished_tasks, DB_PATH)
+
+
+atexit.register(_flush_at_exit)
+
+
+def messages(path=DB_PATH, limit=50):
+    """Most recent stored messages, newest first."""
+    if not os.path.exists(path):
+        return []
+    conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+    try:
+        conn.row_factory = sqlite3.Row
+        rows = conn.execute("SELECT * FROM messages ORDER BY id DESC LIMIT ?", (limit,)).fetchall()
+        return [dict(row) for row in rows]
+    finally:
+        conn.close()
@@ -0,0 +1,160 @@
+"""Chunked ingestion of water-incident logs into ORT/ART aggregates.
+
+Raw logs (CSV or Parquet, potentially millions of rows) are streamed in chunks.
+Each chunk is reduced with vectorized pandas group-bys to per
+``(month, region, asset_class)`` sums. The partial sums are merged and written
+to an on-disk cache keyed on the source file's path, size and mtime, so
+reruns and restarts only read the small aggregate table.
+
+Expected columns (rename with ``columns=``):
+
+=========================  ==============================================
+``reported_at``            incident timestamp
+``region``                 reporting region / municipality
+``asset_class``            pipe, pump station, reservoir, ...
+``optimal_response_hours`` Optimal Response Time (ORT) for the incident
+``actual_repair_hours``    Actual Repair Time (ART) for the incident
+=========================  ==============================================
+"""
+import hashlib
+import json
+import os
+import threading
+
+import numpy as np
+import pandas as pd
+
+import atomic
+
+CACHE_VERSION = 1
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache", "incidents")
+CHUNK_ROWS = 500_000
+COMPACT_EVERY = 20
+
+KEYS = ["month", "region", "asset_class"]
+COLUMNS = {
+    "reported_at": "reported_at",
+    "region": "region",
+    "asset_class": "asset_class",
+    "ort": "optimal_response_hours",
+    "art": "actual_repair_hours",
+}
+
+_loaded = {}
+_lock = threading.Lock()
+# One lock per cache key, held only while that key is read from disk or aggregated.
+_key_locks = {}
+
+
+# ── Reading ──────────────────────────────────────────────────────────────────
+def iter_chunks(path, columns=None, chunk_rows=CHUNK_ROWS):
+    """Yield DataFrames with the canonical column names, ``chunk_rows`` at a time."""
+    columns = {**COLUMNS, **(columns or {})}
+    rename = {source: name for name, source in columns.items()}
+    usecols = list(rename)
+
+    if path.endswith((".parquet", ".pq")):
+        try:
+            import pyarrow.parquet as pq
+        except ImportError as exc:
+            raise ImportError("Reading Parquet incident logs requires pyarrow: pip install pyarrow") from exc
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=chunk_rows, columns=usecols):
+            yield batch.to_pandas().rename(columns=rename)
+    else:
+        reader = pd.read_csv(
+            path, usecols=usecols, chunksize=chunk_rows,
+            dtype={columns["region"]: "category", columns["asset_class"]: "category"},
+        )
+        for chunk in reader:
+            yield chunk.rename(columns=rename)
+
+
+def aggregate_chunk(df):
+    """Reduce raw incidents to per-group counts and ORT/ART sums."""
+    reported = pd.to_datetime(df["reported_at"], errors="coerce")
+    ort = pd.to_numeric(df["ort"], errors="coerce").to_numpy(dtype=np.float64)
+    art = pd.to_numeric(df["art"], errors="coerce").to_numpy(dtype=np.float64)
+    valid = reported.notna().to_numpy() & np.isfinite(ort) & np.isfinite(art)
+
+    frame = pd.DataFrame({
+        "month": reported[valid].dt.to_period("M").dt.to_timestamp().to_numpy(),
+        "region": df["region"].astype(str).to_numpy()[valid],
+        "asset_class": df["asset_class"].astype(str).to_numpy()[valid],
+        "ort_sum": ort[valid],
+        "art_sum": art[valid],
+    })
+    grouped = frame.groupby(KEYS, sort=False)
+    out = grouped[["ort_sum", "art_sum"]].sum()
+    out["incidents"] = grouped.size()
+    return out
+
+
+def _merge(parts):
+    return pd.concat(parts).groupby(level=KEYS, sort=False).sum()
+
+
+def aggregate(path, columns=None, chunk_rows=CHUNK_ROWS):
+    """Stream ``path`` and return the merged aggregate table (no caching)."""
+    parts = []
+    for chunk in iter_chunks(path, columns, chunk_rows):
+        parts.append(aggregate_chunk(chunk))
+        if len(parts) >= COMPACT_EVERY:
+            parts = [_merge(parts)]
+    if not parts:
+        return pd.DataFrame(columns=[*KEYS, "ort_sum", "art_sum", "incidents"])
+    return _merge(parts).sort_index().reset_index()
+
+
+# ── Cache ────────────────────────────────────────────────────────────────────
+def _cache_key(path, columns):
+    stat = os.stat(path)
+    ident = [CACHE_VERSION, os.path.abspath(path), stat.st_size, stat.st_mtime_ns, sorted((columns or {}).items())]
+    return hashlib.sha256(json.dumps(ident).encode()).hexdigest()[:24]
+
+
+def load(path, columns=None, cache_dir=CACHE_DIR, chunk_rows=CHUNK_ROWS):
+    """Aggregates for ``path``, from memory, then the disk cache, then the raw file.
+
+    Only callers asking for the same log and columns wait on one another; a
+    rebuild never holds up a memory hit or the load of a different log.
+    """
+    key = _cache_key(path, columns)
+    with _lock:
+        table = _loaded.get(key)
+        if table is not None:
+            return table
+        key_lock = _key_locks.setdefault(key, threading.Lock())
+
+    with key_lock:
+        with _lock:
+            table = _loaded.get(key)
+        if table is None:
+            cached = os.path.join(cache_dir, f"{key}.pkl")
+            if os.path.exists(cached):
+                table = pd.read_pickle(cached)
+            else:
+                table = aggregate(path, columns, chunk_rows)
+                with atomic.replacing(cached) as f:
+                    table.to_pickle(f)
+            with _lock:
+                _loaded.clear()
+                _loaded[key] = table
+    with _lock:
+        _key_locks.pop(key, None)
+    return table
+
+
+def monthly(table, regions=None, asset_classes=None):
+    """Mean ORT, ART and gap per month, optionally filtered by region/asset class."""
+    mask = np.ones(len(table), dtype=bool)
+    if regions:
+        mask &= table["region"].isin(regions).to_numpy()
+    if asset_classes:
+        mask &= table["asset_class"].isin(asset_classes).to_numpy()
+
+    sums = table.loc[mask].groupby("month")[["ort_sum", "art_sum", "incidents"]].sum()
+    counts = sums["incidents"].to_numpy(dtype=np.float64)
+    ort = sums["ort_sum"].to_numpy() / counts
+    art = sums["art_sum"].to_numpy() / counts
+    return pd.DataFrame({"ort": ort, "art": art, "gap": art - ort, "incidents": sums["incidents"].to_numpy()},
+                        index=sums.index)
@@ -0,0 +1,181 @@
+"""Shared page chrome: stylesheet, sidebar navigation and footer.
+
+The stylesheet and fonts live in assets/. On import they are copied to
+static/ under content-hashed names (served by Streamlit at ``app/static/``),
+so each rerun only sends a one-line ``@import`` of a cacheable file.
+"""
+import functools
+import hashlib
+import html
+import os
+import re
+from collections import namedtuple
+from datetime import datetime
+
+import streamlit as st
+
+import atomic
+import cv
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+ASSETS_DIR = os.path.join(ROOT, "assets")
+STATIC_DIR = os.path.join(ROOT, "static")
+
+_FONT_URL = re.compile(r"""url\((['"]?)fonts/([^'")]+)\1\)""")
+_MISSING_FONT_SRC = re.compile(r""",\s*url\((['"]?)fonts/([^'")]+)\1\)\s*format\([^)]*\)""")
+
+Assets = namedtuple("Assets", ["css", "css_name", "files"])
+
+
+def _fingerprint(name, data):
+    stem, ext = os.path.splitext(name)
+    return f"{stem}.{hashlib.sha256(data).hexdigest()[:12]}{ext}"
+
+
+def build_assets(out_dir, font_prefix="fonts/"):
+    """Write content-hashed copies of the stylesheet and fonts to ``out_dir``.
+
+    Font ``url()`` references in assets/profile.css are rewritten to the hashed
+    names, prefixed with ``font_prefix``; sources whose font file is absent are
+    dropped so browsers never request them. Files are only written when a file
+    with that hash does not exist yet.
+    """
+    with open(os.path.join(ASSETS_DIR, "profile.css"), encoding="utf-8") as f:
+        css = f.read()
+
+    files = []
+    fonts = {}
+    for name in sorted(set(m.group(2) for m in _FONT_URL.finditer(css))):
+        path = os.path.join(ASSETS_DIR, "fonts", name)
+        if not os.path.exists(path):
+            continue
+        with open(path, "rb") as f:
+            data = f.read()
+        fonts[name] = _fingerprint(name, data)
+        atomic.write_once(os.path.join(out_dir, "fonts", fonts[name]), data)
+        files.append(f"fonts/{fonts[name]}")
+
+    css = _MISSING_FONT_SRC.sub(lambda m: m.group(0) if m.group(2) in fonts else "", css)
+    css = _FONT_URL.sub(lambda m: f"url('{font_prefix}{fonts[m.group(2)]}')", css)
+
+    data = css.encode("utf-8")
+    css_name = _fingerprint("profile.css", data)
+    atomic.write_once(os.path.join(out_dir, css_name), data)
+    files.append(css_name)
+    return Assets(css, css_name, files)
+
+
+def static_served(ext):
+    """Whether app/static serves ``ext`` files with their real content type.
+
+    Older Streamlit releases only do so for a whitelist of extensions and send
+    everything else as text/plain with nosniff, which browsers refuse to use
+    as a stylesheet or image.
+    """
+    if not st.get_option("server.enableStaticServing"):
+        return False
+    try:
+        from streamlit.web.server.app_static_file_handler import SAFE_APP_STATIC_FILE_EXTENSIONS
+    except ImportError:
+        return True
+    return ext in SAFE_APP_STATIC_FILE_EXTENSIONS
+
+
+def deferred_downloads():
+    """Whether ``st.download_button`` accepts a callable and calls it only on click.
+
+    Older Streamlit releases need the file's bytes on every rerun.
+    """
+    try:
+        import streamlit.runtime.backend_operation_handler  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+ASSETS = build_assets(STATIC_DIR)
+DEFERRED_DOWNLOADS = deferred_downloads()
+
+if static_served(".css"):
+    _STYLE_TAG = f'<style>@import url("app/static/{ASSETS.css_name}");</style>'
+else:
+    # Inlined, so font URLs must be relative to the page rather than the file.
+    _STYLE_TAG = "<style>\n{}</style>".format(ASSETS.css.replace("url('fonts/", "url('app/static/fonts/"))
+
+
+def inject_styles():
+    """Reference the fingerprinted stylesheet; the browser caches it across reruns."""
+    st.markdown(_STYLE_TAG, unsafe_allow_html=True)
+
+
+def _go_to(title):
+    st.session_state["page"] = title
+
+
+def search_results(pages, index):
+    """Search box over the profile; each hit is a button that opens its page."""
+    titles = {slug: title for title, slug in pages.items()}
+    query = st.text_input("Search", placeholder="Search the profile", key="search_query",
+                          label_visibility="collapsed")
+    if not query.strip():
+        return
+    results = index.search(query)
+    if not results.hits:
+        st.caption("No matches.")
+        return
+    st.caption(f"{results.total} match{'es' if results.total != 1 else ''}")
+    for n, hit in enumerate(results.hits):
+        title = titles[hit.doc.page]
+        st.button(f"{title} › {hit.doc.section}", key=f"search_hit_{n}", on_click=_go_to, args=(title,),
+                  use_container_width=True)
+        st.markdown(f"<div class='search-hit'><b>{hit.title}</b><br>{hit.snippet}</div>",
+                    unsafe_allow_html=True)
+
+
+def cv_download(profile):
+    """Download CV button. The PDF is built in cv's worker pool, never on the script thread."""
+    if DEFERRED_DOWNLOADS:
+        # Called on click, from Streamlit's download thread.
+        st.download_button("Download CV", data=functools.partial(cv.pdf, profile),
+                           file_name=cv.file_name(profile.person.name), mime="application/pdf",
+                           on_click="ignore", use_container_width=True)
+        return
+    doc = cv.document(profile)
+    path = cv.cached(doc)
+    if path is None:
+        cv.submit(doc)
+        st.button("Download CV", disabled=True, help="The CV is being prepared.", use_container_width=True)
+        return
+    with open(path, "rb") as f:
+        st.download_button("Download CV", data=f.read(), file_name=cv.file_name(doc.name), mime="application/pdf",
+                           use_container_width=True)
+
+
+def sidebar(pages, profile):
+    person = profile.person
+    with st.sidebar:
+        search_results(pages, profile.search)
+        st.markdown("### Navigation")
+        page = st.radio(
+            "Go to",
+            list(pages),
+            label_visibility="collapsed",
+            key="page",
+        )
+        st.markdown("---")
+        st.markdown("##### Quick Links")
+        st.markdown(" · ".join(f"[{link.label}]({link.url})" for link in person.links))
+        cv_download(profile)
+        st.markdown("---")
+        st.caption(f"Last updated: {datetime.now().strftime('%B %Y')}")
+    return page
+
+
+def footer(person):
+    st.markdown("---")
+    st.markdown(
+        "<div style='text-align:center; color:#6b7c8a; font-size:0.8rem; font-family:Inter,sans-serif;'>"
+        f"{html.escape(person.footer)}"
+        "</div>",
+        unsafe_allow_html=True,
+    )
@@ -0,0 +1,215 @@
+"""Lightweight hot-path instrumentation.
+
+Enable with ``PROFILE_METRICS=1``. Views wrap their sections in
+``metrics.section("name")``. When metrics are disabled that call returns a
+shared no-op context manager, so the instrumented code pays only a function
+call.
+
+When enabled, the module records:
+
+* per-section timing histograms (``profile_section_seconds``),
+* figure cache hits/misses and content reloads, read from those modules,
+* active sessions: sessions that reran within ``SESSION_TTL`` seconds.
+
+``render()`` produces Prometheus text exposition format. If
+``PROFILE_METRICS_FILE`` is set, a background thread rewrites that file every
+``PROFILE_METRICS_INTERVAL`` seconds for a textfile scraper to collect. The
+same data is shown on the hidden ``?diagnostics=1`` page.
+"""
+import os
+import sys
+import threading
+import time
+from bisect import bisect_left
+from contextlib import nullcontext
+
+import atomic
+
+ENABLED = os.environ.get("PROFILE_METRICS", "").lower() in ("1", "true", "yes", "on")
+EXPORT_PATH = os.environ.get("PROFILE_METRICS_FILE")
+EXPORT_INTERVAL = float(os.environ.get("PROFILE_METRICS_INTERVAL", "15"))
+SESSION_TTL = 300
+
+BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+
+_NULL = nullcontext()
+_lock = threading.Lock()
+_sections = {}
+_counters = {}
+_sessions = {}
+_writer = None
+
+
+class _Histogram:
+    __slots__ = ("counts", "total", "count", "max")
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS) + 1)
+        self.total = 0.0
+        self.count = 0
+        self.max = 0.0
+
+    def observe(self, seconds):
+        self.counts[bisect_left(BUCKETS, seconds)] += 1
+        self.total += seconds
+        self.count += 1
+        self.max = max(self.max, seconds)
+
+
+class _Timer:
+    __slots__ = ("name", "started")
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        observe(self.name, time.perf_counter() - self.started)
+        return False
+
+
+# ── Recording ────────────────────────────────────────────────────────────────
+def section(name):
+    """Time the enclosed block as ``name``; free when metrics are disabled."""
+    if not ENABLED:
+        return _NULL
+    return _Timer(name)
+
+
+def observe(name, seconds):
+    with _lock:
+        hist = _sections.get(name)
+        if hist is None:
+            hist = _sections[name] = _Histogram()
+        hist.observe(seconds)
+
+
+def count(name, n=1):
+    if not ENABLED:
+        return
+    with _lock:
+        _counters[name] = _counters.get(name, 0) + n
+
+
+def touch_session():
+    """Mark the current Streamlit session as active; call once per rerun."""
+    if not ENABLED:
+        return
+    from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+    ctx = get_script_run_ctx()
+    if ctx is None:
+        return
+    now = time.monotonic()
+    with _lock:
+        _sessions[ctx.session_id] = now
+        if len(_sessions) > 1024:
+            for sid in [s for s, seen in _sessions.items() if now - seen > SESSION_TTL]:
+                del _sessions[sid]
+    _ensure_writer()
+
+
+def active_sessions():
+    now = time.monotonic()
+    with _lock:
+        return sum(1 for seen in _sessions.values() if now - seen <= SESSION_TTL)
+
+
+# ── Snapshot and export ──────────────────────────────────────────────────────
+def _cache_stats():
+    # Only report on modules that are already loaded; exporting must not pull
+    # plotly into a process that never drew a chart.
+    stats = {}
+    figures = sys.modules.get("figures")
+    if figures is not None:
+        stats["figure_cache_hits_total"] = figures.cache.hits
+        stats["figure_cache_misses_total"] = figures.cache.misses
+        stats["figure_cache_entries"] = len(figures.cache)
+    content = sys.modules.get("content")
+    if content is not None:
+        stats["content_reloads_total"] = content.store.reloads
+        stats["content_stores_cached"] = len(content.stores)
+    templates = sys.modules.get("templates")
+    if templates is not None:
+        stats["template_cache_hits_total"], stats["template_cache_misses_total"] = templates.cache_stats()
+    cv = sys.modules.get("cv")
+    if cv is not None:
+        stats["cv_cache_hits_total"] = cv.hits
+        stats["cv_cache_misses_total"] = cv.misses
+        stats["cv_builds_total"] = cv.builds
+        stats["cv_build_failures_total"] = cv.failures
+    datasets = sys.modules.get("datasets")
+    if datasets is not None:
+        shared = datasets.report()
+        stats["shared_datasets"] = len(shared)
+        stats["shared_dataset_bytes"] = sum(d.nbytes for d in shared)
+    return stats
+
+
+def snapshot():
+    """Plain-dict view of everything recorded so far."""
+    with _lock:
+        sections = {
+            name: {"count": h.count, "total_s": h.total, "mean_ms": h.total / h.count * 1000, "max_ms": h.max * 1000}
+            for name, h in _sections.items()
+        }
+        counters = dict(_counters)
+    return {
+        "enabled": ENABLED,
+        "sections": sections,
+        "counters": counters,
+        "caches": _cache_stats(),
+        "active_sessions": active_sessions(),
+    }
+
+
+def render():
+    """All metrics in Prometheus text exposition format."""
+    lines = [
+        "# HELP profile_section_seconds Time spent rendering each instrumented section.",
+        "# TYPE profile_section_seconds histogram",
+    ]
+    with _lock:
+        sections = [(name, list(h.counts), h.total, h.count) for name, h in sorted(_sections.items())]
+        counters = sorted(_counters.items())
+    for name, counts, total, n in sections:
+        cumulative = 0
+        for bound, c in zip((*BUCKETS, "+Inf"), counts):
+            cumulative += c
+            lines.append(f'profile_section_seconds_bucket{{section="{name}",le="{bound}"}} {cumulative}')
+        lines.append(f'profile_section_seconds_sum{{section="{name}"}} {total:.6f}')
+        lines.append(f'profile_section_seconds_count{{section="{name}"}} {n}')
+
+    for name, value in counters:
+        lines += [f"# TYPE profile_{name}_total counter", f"profile_{name}_total {value}"]
+    for name, value in sorted(_cache_stats().items()):
+        kind = "counter" if name.endswith("_total") else "gauge"
+        lines += [f"# TYPE profile_{name} {kind}", f"profile_{name} {value}"]
+    lines += ["# TYPE profile_active_sessions gauge", f"profile_active_sessions {active_sessions()}"]
+    return "\n".join(lines) + "\n"
+
+
+def write(path=EXPORT_PATH):
+    atomic.write(path, render())
+
+
+def _export_loop():
+    while True:
+        time.sleep(EXPORT_INTERVAL)
+        try:
+            write()
+        except OSError:
+            pass
+
+
+def _ensure_writer():
+    global _writer
+    if _writer is not None or not EXPORT_PATH:
+        return
+    with _lock:
+        if _writer is None:
+            _writer = threading.Thread(target=_export_loop, name="metrics-export", daemon=True)
+            _writer.start()
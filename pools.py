@@ -0,0 +1,34 @@
+"""Process pools for CPU-bound work started from the app.
+
+Every pool uses the ``spawn`` start method: forking a threaded server process
+can deadlock the children. ``get(name)`` returns a long-lived pool shared by
+every session, created on first use, replaced if a worker dies and breaks it,
+and shut down at exit; ``new()`` returns
+a private pool for one-off batch work, to be used as a context manager.
+"""
+import atexit
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+_pools = {}
+_lock = threading.Lock()
+
+
+def new(max_workers=None):
+    return ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context("spawn"))
+
+
+def get(name, max_workers=None):
+    """The shared pool called ``name``; ``max_workers`` applies when it is first created."""
+    with _lock:
+        pool = _pools.get(name)
+        # A worker that died (OOM kill, segfault) breaks the whole pool, and
+        # every later submit would fail until a restart.
+        if pool is not None and pool._broken:
+            pool.shutdown(wait=False, cancel_futures=True)
+            pool = None
+        if pool is None:
+            pool = _pools[name] = new(max_workers)
+            atexit.register(pool.shutdown, wait=False, cancel_futures=True)
+        return pool
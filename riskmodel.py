@@ -0,0 +1,225 @@
+"""Failure-risk and repair-time regression over the incident aggregates.
+
+Two ridge regressors are fitted on the per ``(month, region, asset_class)``
+table from ``incidents.load``:
+
+``risk``    incidents per month (fitted on ``log1p`` counts)
+``repair``  mean Actual Repair Time, weighted by the incident count, with
+            the group's mean ORT as an extra input
+
+Inputs are one-hot region and asset class, a linear trend in months and a
+yearly sine/cosine season. The ridge penalty is chosen per target by
+time-blocked K-fold cross-validation; every (penalty, fold) fit runs as its
+own job in a process pool. A log covering fewer than ``MIN_FOLDS`` months
+cannot be cross-validated; its fits use ``DEFAULT_ALPHA`` and carry no CV
+error.
+
+Fitted coefficients are saved under .cache/models/ in a file named by the
+hash of the training arrays and hyperparameters, so the same data is never
+trained twice, across reruns, sessions or restarts. ``Model.predict`` scores
+a whole batch of what-if rows with one matrix product.
+"""
+import hashlib
+import io
+import json
+import os
+from collections import namedtuple
+
+import numpy as np
+
+import atomic
+import pools
+
+MODEL_VERSION = 2
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache", "models")
+ALPHAS = (0.01, 0.1, 1.0, 10.0, 100.0)
+FOLDS = 5
+# Every fold must leave some months to train on.
+MIN_FOLDS = 2
+DEFAULT_ALPHA = 1.0
+MAX_WORKERS = int(os.environ.get("PROFILE_MODEL_WORKERS", "0")) or None
+
+Fit = namedtuple("Fit", ["mean", "scale", "coef", "intercept", "alpha", "cv_rmse"])
+
+
+# ── Features ─────────────────────────────────────────────────────────────────
+def design(region, asset_class, month, ort, regions, asset_classes, start, with_ort):
+    """Feature matrix for aligned arrays of what-if or training rows."""
+    region, asset_class = np.asarray(region), np.asarray(asset_class)
+    month = np.asarray(month, dtype="datetime64[M]")
+    t = (month - np.datetime64(start, "M")).astype(np.float64)
+    season = 2 * np.pi * (month.astype(np.int64) % 12) / 12
+    columns = [
+        *(region == r for r in regions),
+        *(asset_class == a for a in asset_classes),
+        t, np.sin(season), np.cos(season),
+    ]
+    if with_ort:
+        columns.append(np.asarray(ort, dtype=np.float64))
+    return np.column_stack(columns).astype(np.float64)
+
+
+# ── Ridge ────────────────────────────────────────────────────────────────────
+def ridge(X, y, w, alpha):
+    """Weighted ridge on standardized columns; the intercept is not penalized."""
+    total = w.sum()
+    mean = w @ X / total
+    scale = np.sqrt(w @ (X - mean) ** 2 / total)
+    scale[scale == 0] = 1.0
+    Z = (X - mean) / scale
+    y_mean = w @ y / total
+    A = Z.T @ (Z * w[:, None]) + alpha * np.eye(X.shape[1])
+    coef = np.linalg.solve(A, Z.T @ (w * (y - y_mean)))
+    return mean, scale, coef, y_mean
+
+
+def _apply(params, X):
+    mean, scale, coef, intercept = params[:4]
+    return ((X - mean) / scale) @ coef + intercept
+
+
+def _cv_job(job):
+    """Weighted squared error of one (alpha, fold) fit on the held-out block."""
+    X, y, w, folds, alpha, fold = job
+    train, test = folds != fold, folds == fold
+    params = ridge(X[train], y[train], w[train], alpha)
+    err = _apply(params, X[test]) - y[test]
+    return alpha, float(w[test] @ err ** 2), float(w[test].sum())
+
+
+def can_cross_validate(folds):
+    """Whether fold ids ``folds`` give at least ``MIN_FOLDS`` held-out blocks."""
+    return len(np.unique(folds)) >= MIN_FOLDS
+
+
+def cross_validate(targets, alphas=ALPHAS, executor=None):
+    """``{target: {alpha: rmse}}`` for ``{target: (X, y, w, folds)}``, jobs run on ``executor``.
+
+    Targets with too few folds to validate get an empty ``{}``.
+    """
+    jobs, owners = [], []
+    sums = {name: {} for name in targets}
+    for name, (X, y, w, folds) in targets.items():
+        if not can_cross_validate(folds):
+            continue
+        for alpha in alphas:
+            for fold in np.unique(folds):
+                jobs.append((X, y, w, folds, alpha, fold))
+                owners.append(name)
+    results = executor.map(_cv_job, jobs) if executor is not None else map(_cv_job, jobs)
+    for name, (alpha, sse, weight) in zip(owners, results):
+        acc = sums[name].setdefault(alpha, [0.0, 0.0])
+        acc[0] += sse
+        acc[1] += weight
+    return {name: {alpha: float(np.sqrt(sse / weight)) for alpha, (sse, weight) in by_alpha.items()}
+            for name, by_alpha in sums.items()}
+
+
+# ── Model ────────────────────────────────────────────────────────────────────
+class Model:
+    """Both fitted regressors plus the vocabulary their features were built with."""
+
+    def __init__(self, key, regions, asset_classes, start, last, fits, rows):
+        self.key = key
+        self.regions = tuple(regions)
+        self.asset_classes = tuple(asset_classes)
+        self.start = np.datetime64(start, "M")
+        self.last = np.datetime64(last, "M")
+        self.fits = fits
+        self.rows = rows
+
+    def predict(self, region, asset_class, month, ort):
+        """Expected incidents per month and mean repair hours for each what-if row."""
+        args = (region, asset_class, month, ort, self.regions, self.asset_classes, self.start)
+        risk = np.expm1(_apply(self.fits["risk"], design(*args, with_ort=False)))
+        repair = _apply(self.fits["repair"], design(*args, with_ort=True))
+        return np.clip(risk, 0, None), np.clip(repair, 0, None)
+
+    # Persisted as one .npz: arrays per fit plus a JSON header.
+    def dumps(self):
+        arrays = {}
+        for name, fit in self.fits.items():
+            for field in ("mean", "scale", "coef"):
+                arrays[f"{name}.{field}"] = getattr(fit, field)
+        meta = {
+            "version": MODEL_VERSION, "key": self.key, "rows": self.rows,
+            "regions": list(self.regions), "asset_classes": list(self.asset_classes),
+            "start": str(self.start), "last": str(self.last),
+            "fits": {name: {"intercept": fit.intercept, "alpha": fit.alpha,
+                            "cv_rmse": {str(a): r for a, r in fit.cv_rmse.items()}}
+                     for name, fit in self.fits.items()},
+        }
+        buf = io.BytesIO()
+        np.savez(buf, meta=np.array(json.dumps(meta)), **arrays)
+        return buf.getvalue()
+
+    @classmethod
+    def loads(cls, data):
+        with np.load(io.BytesIO(data)) as arrays:
+            meta = json.loads(str(arrays["meta"]))
+            fits = {
+                name: Fit(arrays[f"{name}.mean"], arrays[f"{name}.scale"], arrays[f"{name}.coef"],
+                          f["intercept"], f["alpha"], {float(a): r for a, r in f["cv_rmse"].items()})
+                for name, f in meta["fits"].items()
+            }
+        return cls(meta["key"], meta["regions"], meta["asset_classes"], meta["start"], meta["last"],
+                   fits, meta["rows"])
+
+
+def training_arrays(table, folds=FOLDS):
+    """``(vocabulary, {target: (X, y, w, fold ids)})`` from an incidents aggregate table."""
+    table = table[table["incidents"] > 0]
+    month = table["month"].to_numpy().astype("datetime64[M]")
+    region = table["region"].astype(str).to_numpy()
+    asset_class = table["asset_class"].astype(str).to_numpy()
+    incidents = table["incidents"].to_numpy(dtype=np.float64)
+    ort = table["ort_sum"].to_numpy(dtype=np.float64) / incidents
+    art = table["art_sum"].to_numpy(dtype=np.float64) / incidents
+
+    regions, asset_classes = sorted(set(region)), sorted(set(asset_class))
+    start, last = month.min(), month.max()
+    # Time-blocked folds: each fold holds out a contiguous run of months.
+    months = np.unique(month)
+    fold_of_month = np.arange(len(months)) * min(folds, len(months)) // len(months)
+    fold = fold_of_month[np.searchsorted(months, month)]
+
+    args = (region, asset_class, month, ort, regions, asset_classes, start)
+    targets = {
+        "risk": (design(*args, with_ort=False), np.log1p(incidents), np.ones_like(incidents), fold),
+        "repair": (design(*args, with_ort=True), art, incidents, fold),
+    }
+    return (regions, asset_classes, start, last), targets
+
+
+def cache_key(vocabulary, targets, alphas=ALPHAS, folds=FOLDS):
+    digest = hashlib.sha256(json.dumps([MODEL_VERSION, list(alphas), folds, [str(v) for v in vocabulary]]).encode())
+    for name in sorted(targets):
+        for array in targets[name]:
+            digest.update(np.ascontiguousarray(array).tobytes())
+    return digest.hexdigest()[:24]
+
+
+def train(table, alphas=ALPHAS, folds=FOLDS, cache_dir=CACHE_DIR, max_workers=MAX_WORKERS):
+    """The fitted ``Model`` for ``table``, from the disk cache when these inputs were seen before."""
+    vocabulary, targets = training_arrays(table, folds)
+    key = cache_key(vocabulary, targets, alphas, folds)
+    path = os.path.join(cache_dir, f"{key}.npz")
+    if os.path.exists(path):
+        with open(path, "rb") as f:
+            return Model.loads(f.read())
+
+    if any(can_cross_validate(folds) for *_, folds in targets.values()):
+        with pools.new(max_workers) as executor:
+            scores = cross_validate(targets, alphas, executor)
+    else:
+        scores = cross_validate(targets, alphas)
+
+    fits = {}
+    for name, (X, y, w, _) in targets.items():
+        alpha = min(scores[name], key=scores[name].get) if scores[name] else DEFAULT_ALPHA
+        mean, scale, coef, intercept = ridge(X, y, w, alpha)
+        fits[name] = Fit(mean, scale, coef, float(intercept), alpha, scores[name])
+    model = Model(key, *vocabulary, fits, int(len(targets["risk"][1])))
+
+    atomic.write(path, model.dumps())
+    return model
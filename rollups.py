@@ -0,0 +1,209 @@
+"""Incremental per-country, per-quarter rollups of engagement events.
+
+The BI chart on the Achievements page can be backed by an append-only event
+log (``PROFILE_EVENTS_PATH``, JSON Lines). Each line is one event::
+
+    {"ts": "2025-04-02T10:31:00Z", "country": "SA", "event": "engage"}
+    {"ts": "2025-04-02T10:35:12Z", "country": "SA", "event": "convert"}
+
+``Rollup`` keeps running ``engage``/``convert`` counts per ``(country,
+quarter)`` together with the byte offset of the log it has consumed. Each
+``update`` stats the file and parses only the complete lines appended since
+the last call, in blocks, then persists the counts and offset under
+.cache/rollups/. Malformed lines are counted in ``malformed`` and skipped; a
+trailing line without its newline is left for the next update. A restart
+resumes from the saved offset; a log that shrank or was replaced is re-read
+from the start.
+
+Chart queries read the rollup table only, so render time depends on the
+number of quarters, not on the number of events.
+"""
+import hashlib
+import json
+import os
+import threading
+
+import pandas as pd
+
+import atomic
+import datasets
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+CACHE_DIR = os.path.join(ROOT, ".cache", "rollups")
+EVENTS_PATH = os.environ.get("PROFILE_EVENTS_PATH")
+
+STATE_VERSION = 1
+BLOCK_BYTES = 32 * 1024 * 1024
+EVENTS = ("engage", "convert")
+COUNTRIES = ("SA", "DRC")
+
+_rollups = {}
+_lock = threading.Lock()
+
+
+def _quarter_label(period):
+    year, q = period.split("Q")
+    return f"Q{q} {year}"
+
+
+def aggregate_block(data):
+    """``({(country, quarter): [engage, convert]}, malformed lines)`` for a block of complete lines.
+
+    Lines are decoded one at a time, so a truncated or corrupt line costs
+    only itself; it is counted and skipped.
+    """
+    ts, countries, events = [], [], []
+    malformed = 0
+    for line in data.splitlines():
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+            fields = str(record["ts"]), str(record["country"]), str(record["event"])
+        except (ValueError, TypeError, KeyError):
+            malformed += 1
+            continue
+        ts.append(fields[0])
+        countries.append(fields[1])
+        events.append(fields[2])
+    if not ts:
+        return {}, malformed
+
+    frame = pd.DataFrame({"country": countries, "event": events})
+    ts = pd.to_datetime(pd.Series(ts), errors="coerce", utc=True, format="ISO8601")
+    valid = ts.notna() & frame["event"].isin(EVENTS)
+    frame = pd.DataFrame({
+        "country": frame.loc[valid, "country"],
+        "quarter": ts[valid].dt.tz_localize(None).dt.to_period("Q").astype(str),
+        "event": frame.loc[valid, "event"],
+    })
+    counts = frame.groupby(["country", "quarter", "event"]).size()
+    out = {}
+    for (country, quarter, event), n in counts.items():
+        out.setdefault((country, quarter), [0, 0])[EVENTS.index(event)] += int(n)
+    return out, malformed
+
+
+class Rollup:
+    """Running counts over one append-only event log."""
+
+    def __init__(self, path, cache_dir=CACHE_DIR):
+        self.path = path
+        key = hashlib.sha256(os.path.abspath(path).encode()).hexdigest()[:16]
+        self.state_path = os.path.join(cache_dir, f"{key}.json")
+        self._lock = threading.Lock()
+        self._reset()
+        self._restore()
+
+    def _reset(self, inode=None):
+        self.inode = inode
+        self.offset = 0
+        self.counts = {}
+        self.malformed = 0
+
+    def _restore(self):
+        try:
+            with open(self.state_path, encoding="utf-8") as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return
+        if state.get("version") != STATE_VERSION:
+            return
+        self.inode = state["inode"]
+        self.offset = state["offset"]
+        self.counts = {tuple(k.split("|", 1)): v for k, v in state["counts"].items()}
+        self.malformed = state.get("malformed", 0)
+
+    def _save(self):
+        state = {
+            "version": STATE_VERSION,
+            "path": os.path.abspath(self.path),
+            "inode": self.inode,
+            "offset": self.offset,
+            "counts": {"|".join(k): v for k, v in self.counts.items()},
+            "malformed": self.malformed,
+        }
+        atomic.write(self.state_path, json.dumps(state))
+
+    def update(self):
+        """Fold newly appended events into the counts; returns bytes consumed."""
+        stat = os.stat(self.path)
+        if stat.st_size == self.offset and stat.st_ino == self.inode:
+            return 0
+        with self._lock:
+            # Another session may have read further while this one waited;
+            # only a fresh stat can tell a shrunken file from a stale size.
+            stat = os.stat(self.path)
+            if stat.st_ino != self.inode or stat.st_size < self.offset:
+                self._reset(stat.st_ino)
+            consumed = 0
+            with open(self.path, "rb") as f:
+                f.seek(self.offset)
+                carry = b""
+                remaining = stat.st_size - self.offset
+                while remaining > 0:
+                    # read(n) allocates n bytes up front; a pending partial line
+                    # must not cost a full block on every rerun.
+                    block = f.read(min(BLOCK_BYTES, remaining))
+                    if not block:
+                        break
+                    remaining -= len(block)
+                    block = carry + block
+                    end = block.rfind(b"\n") + 1
+                    # A trailing partial line is still being written; leave it.
+                    block, carry = block[:end], block[end:]
+                    if block:
+                        counts, malformed = aggregate_block(block)
+                        for key, (engage, convert) in counts.items():
+                            total = self.counts.setdefault(key, [0, 0])
+                            total[0] += engage
+                            total[1] += convert
+                        # Malformed lines are consumed too, or every update would re-read them.
+                        self.malformed += malformed
+                        consumed += len(block)
+            if consumed:
+                self.offset += consumed
+                self._save()
+            return consumed
+
+    def quarters(self):
+        return sorted({quarter for _, quarter in self.counts})
+
+    def series(self, countries=COUNTRIES):
+        """``(quarter labels, {country: (engagements, conversion %)})`` from the rollups."""
+        quarters = self.quarters()
+        out = {}
+        for country in countries:
+            engage = [self.counts.get((country, q), [0, 0])[0] for q in quarters]
+            convert = [self.counts.get((country, q), [0, 0])[1] for q in quarters]
+            rate = [round(100 * c / e, 2) if e else 0.0 for e, c in zip(engage, convert)]
+            out[country] = (engage, rate)
+        return [_quarter_label(q) for q in quarters], out
+
+
+def get(path=EVENTS_PATH):
+    """The shared, freshly updated ``Rollup`` for ``path``."""
+    with _lock:
+        rollup = _rollups.get(path)
+        if rollup is None:
+            rollup = _rollups[path] = Rollup(path)
+    rollup.update()
+    return rollup
+
+
+def engagement(path=EVENTS_PATH):
+    """The BI chart's series as a ``content.Engagement``, answered from rollups.
+
+    Built once per log position and shared by every session until more
+    events arrive.
+    """
+    from content import Engagement
+
+    rollup = get(path)
+
+    def build():
+        quarters, by_country = rollup.series(COUNTRIES)
+        (sa_engagement, sa_conversion), (drc_engagement, drc_conversion) = by_country["SA"], by_country["DRC"]
+        return Engagement(quarters, sa_engagement, drc_engagement, sa_conversion, drc_conversion)
+
+    return datasets.get(("rollups.engagement", path, rollup.inode, rollup.offset), build)
@@ -0,0 +1,274 @@
+"""Pre-render every profile page to static HTML for CDN hosting.
+
+Each page is run headlessly through Streamlit's ``AppTest``, so the export uses
+exactly the same views, content and cached figures as the live app. The element
+tree is then translated to plain HTML:
+
+* markdown/HTML blocks are copied through (simple markdown is converted),
+* ``st.plotly_chart`` elements embed their precomputed figure JSON and are drawn
+  client-side with a content-hashed ``plotly.<hash>.min.js``,
+* files the views reference under ``app/static/`` (the architecture SVG) are
+  copied to ``assets/`` and the references rewritten,
+* the stylesheet is inlined into every page, with its self-hosted fonts copied
+  to ``assets/fonts/`` under hashed names,
+* the contact form is replaced by a link to the live app (``--live-url``).
+
+Every text asset is written alongside ``.gz`` and, when the optional ``brotli``
+package is installed, ``.br`` variants so the CDN can serve them precompressed.
+Files under ``assets/`` carry a content hash and can be cached forever.
+
+    python scripts/export_static.py --out dist --live-url https://profile.example.org
+"""
+import argparse
+import gzip
+import hashlib
+import html
+import json
+import os
+import re
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import content  # noqa: E402
+import layout  # noqa: E402
+import views  # noqa: E402
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+APP = os.path.join(ROOT, "app.py")
+_STATIC_REF = re.compile(r"app/static/([\w.\-]+)")
+COMPRESSIBLE = (".html", ".css", ".js", ".json", ".svg")
+
+SHELL_STYLE = """
+<style>
+    body { margin: 0; background: #f8fbfd; color: #1a2f3a; font-family: 'Inter', sans-serif; }
+    .static-shell { display: flex; min-height: 100vh; }
+    .static-sidebar { width: 240px; flex-shrink: 0; background: #e8f4f8; padding: 1.5rem 1.2rem; }
+    .static-sidebar ul { list-style: none; padding: 0; }
+    .static-sidebar li a { display: block; padding: 0.35rem 0.6rem; border-radius: 8px; color: #1a2f3a; text-decoration: none; }
+    .static-sidebar li a.active { background: #2c5364; color: #ffffff; }
+    .static-sidebar .caption { font-size: 0.8rem; color: #6b7c8a; }
+    .main { flex: 1; }
+    .main .block-container { margin: 0 auto; padding: 2rem 1.5rem; }
+    .columns { display: flex; gap: 1rem; flex-wrap: wrap; }
+    .columns > .column { flex: 1; min-width: 220px; }
+    @media (max-width: 760px) { .static-shell { flex-direction: column; } .static-sidebar { width: auto; } }
+</style>
+"""
+
+_CHART_INIT = """
+<script>
+document.querySelectorAll("script.plotly-figure").forEach(function (node) {
+    var fig = JSON.parse(node.textContent);
+    Plotly.newPlot(node.previousElementSibling, fig.data, fig.layout, {responsive: true, displaylogo: false});
+});
+</script>
+"""
+
+
+# ── Markdown ─────────────────────────────────────────────────────────────────
+def _inline(text):
+    text = html.escape(text, quote=False)
+    text = re.sub(r"\[([^\]]+)\]\(([^)\s]+)\)", r'<a href="\2" target="_blank">\1</a>', text)
+    text = re.sub(r"\*\*(.+?)\*\*", r"<strong>\1</strong>", text)
+    return re.sub(r"\*(.+?)\*", r"<em>\1</em>", text)
+
+
+def markdown_to_html(text):
+    """Convert the small markdown subset the views use; raw HTML passes through."""
+    text = text.strip()
+    if text.startswith("<"):
+        return text
+    if text == "---":
+        return "<hr>"
+    heading = re.match(r"(#{1,6})\s+(.*)", text)
+    if heading:
+        level = len(heading.group(1))
+        return f"<h{level}>{_inline(heading.group(2))}</h{level}>"
+    return f"<p>{_inline(text)}</p>"
+
+
+# ── Element tree → HTML ──────────────────────────────────────────────────────
+class PageRenderer:
+    def __init__(self, page, filenames, live_url):
+        self.page = page
+        self.filenames = filenames
+        self.live_url = live_url
+        self.charts = 0
+        self.static = set()
+
+    def render(self, node):
+        kind = getattr(node, "type", "")
+        if kind == "markdown":
+            if node.value.lstrip().startswith("<style>"):
+                return ""
+            return self.static_refs(markdown_to_html(node.value))
+        if kind == "caption":
+            return f'<p class="caption">{_inline(node.value)}</p>'
+        if kind == "plotly_chart":
+            return self.chart(node.proto.spec)
+        if kind == "radio":
+            return self.nav()
+        if kind == "form":
+            return self.form()
+        if kind == "column":
+            return f'<div class="column">{self.children(node)}</div>'
+        if kind in ("flex_container", "horizontal"):
+            return f'<div class="columns">{self.children(node)}</div>'
+        return self.children(node)
+
+    def children(self, node):
+        children = getattr(node, "children", None)
+        if not isinstance(children, dict):
+            return ""
+        return "\n".join(filter(None, (self.render(child) for child in children.values())))
+
+    def static_refs(self, text):
+        def rewrite(m):
+            self.static.add(m.group(1))
+            return f"assets/{m.group(1)}"
+        return _STATIC_REF.sub(rewrite, text)
+
+    def chart(self, spec):
+        self.charts += 1
+        payload = spec.replace("</", "<\\/")
+        return (
+            f'<div class="plotly-chart" id="chart-{self.charts}"></div>'
+            f'<script type="application/json" class="plotly-figure">{payload}</script>'
+        )
+
+    def nav(self):
+        items = []
+        for title, name in self.filenames.items():
+            active = ' class="active"' if title == self.page else ""
+            items.append(f'<li><a href="{name}"{active}>{html.escape(title)}</a></li>')
+        return f'<ul class="static-nav">{"".join(items)}</ul>'
+
+    def form(self):
+        if not self.live_url:
+            return ""
+        return (
+            '<div class="project-card"><div class="project-desc">'
+            f'Messages are handled by the <a href="{html.escape(self.live_url)}">live profile</a>.'
+            "</div></div>"
+        )
+
+
+def _run_page(title):
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(APP, default_timeout=120)
+    at.run()
+    if title != next(iter(views.PAGES)):
+        at.sidebar.radio[0].set_value(title).run()
+    if at.exception:
+        raise RuntimeError(f"{title}: {at.exception[0].value}")
+    return at
+
+
+def render_page(title, filenames, plotly_js, css, live_url):
+    at = _run_page(title)
+    renderer = PageRenderer(title, filenames, live_url)
+    body = renderer.render(at.main)
+    sidebar = renderer.render(at.sidebar)
+    scripts = ""
+    if renderer.charts:
+        scripts = f'<script src="{plotly_js}"></script>{_CHART_INIT}'
+    page = f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>{html.escape(title)} · {html.escape(content.get().person.page_title)}</title>
+<style>
+{css}</style>
+{SHELL_STYLE}
+</head>
+<body>
+<div class="static-shell">
+<nav class="static-sidebar">
+{sidebar}
+</nav>
+<main class="main"><div class="block-container">
+{body}
+</div></main>
+</div>
+{scripts}
+</body>
+</html>
+"""
+    return page, renderer.static
+
+
+# ── Output ───────────────────────────────────────────────────────────────────
+def _write(out, name, data):
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    path = os.path.join(out, name)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(data)
+    written = [name]
+    if name.endswith(COMPRESSIBLE):
+        with open(path + ".gz", "wb") as f:
+            f.write(gzip.compress(data, compresslevel=9, mtime=0))
+        written.append(name + ".gz")
+        if brotli is not None:
+            with open(path + ".br", "wb") as f:
+                f.write(brotli.compress(data, quality=11))
+            written.append(name + ".br")
+    return written
+
+
+def hashed_name(stem, ext, data):
+    digest = hashlib.sha256(data.encode("utf-8") if isinstance(data, str) else data).hexdigest()[:12]
+    return f"assets/{stem}.{digest}{ext}"
+
+
+def export(out, live_url=None):
+    from plotly.offline import get_plotlyjs
+
+    written = []
+    assets = layout.build_assets(os.path.join(out, "assets"), font_prefix="assets/fonts/")
+    for name in assets.files:
+        with open(os.path.join(out, "assets", name), "rb") as f:
+            written += _write(out, f"assets/{name}", f.read())
+
+    plotly_js = get_plotlyjs()
+    plotly_name = hashed_name("plotly", ".min.js", plotly_js)
+    written += _write(out, plotly_name, plotly_js)
+
+    filenames = {
+        title: "index.html" if i == 0 else f"{slug}.html"
+        for i, (title, slug) in enumerate(views.PAGES.items())
+    }
+    static = set()
+    for title, name in filenames.items():
+        page, refs = render_page(title, filenames, plotly_name, assets.css, live_url)
+        written += _write(out, name, page)
+        static |= refs
+    for name in sorted(static):
+        with open(os.path.join(layout.STATIC_DIR, name), "rb") as f:
+            written += _write(out, f"assets/{name}", f.read())
+    return written
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--out", default=os.path.join(ROOT, "dist"), help="output directory (default: dist/)")
+    parser.add_argument("--live-url", help="URL of the live app, linked from the contact page")
+    args = parser.parse_args(argv)
+
+    written = export(args.out, args.live_url)
+    if brotli is None:
+        print("brotli not installed; wrote gzip variants only", file=sys.stderr)
+    print(json.dumps({"out": os.path.abspath(args.out), "files": written}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
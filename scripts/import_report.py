@@ -0,0 +1,104 @@
+"""Report the cold import cost of each profile page.
+
+Every page is measured in a fresh interpreter. The shared baseline
+(streamlit, the content layer and the layout) is imported first. Then the
+page's module from ``views`` is imported and timed, and the RSS growth is
+reported. With
+``--top N`` the packages that account for most of each page's import time
+are listed, using ``python -X importtime``.
+
+    python scripts/import_report.py [--top 5] [--json]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+sys.path.insert(0, ROOT)
+import views  # noqa: E402
+
+BASELINE = ("streamlit", "content", "layout", "views")
+
+PAGE_IMPORTS = {title: (f"views.{slug}",) for title, slug in views.PAGES.items()}
+
+_PROBE = """
+import json, sys, time
+
+def rss_kb():
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * (__import__("os").sysconf("SC_PAGE_SIZE") // 1024)
+    except OSError:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak // 1024 if sys.platform == "darwin" else peak
+
+for name in {baseline!r}:
+    __import__(name)
+before, t0 = rss_kb(), time.perf_counter()
+for name in {modules!r}:
+    __import__(name)
+elapsed, after = time.perf_counter() - t0, rss_kb()
+sys.stdout.write(json.dumps({{"ms": elapsed * 1000, "rss_kb": after - before, "modules": len(sys.modules)}}))
+"""
+
+
+def _top_packages(stderr, limit):
+    # -X importtime lines: "import time: self [us] | cumulative | name".
+    # Self time is summed per root package so nested imports are attributed
+    # to whatever pulled them in first (plotly, numpy, ...).
+    totals = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_us, _, name = line[len("import time:"):].split("|", 2)
+        if not self_us.strip().isdigit():
+            continue
+        root = name.strip().split(".")[0]
+        totals[root] = totals.get(root, 0) + int(self_us)
+    ranked = sorted(totals.items(), key=lambda kv: kv[1], reverse=True)
+    return [(name, us / 1000) for name, us in ranked[:limit]]
+
+
+def measure(page, top=0):
+    modules = PAGE_IMPORTS[page]
+    cmd = [sys.executable]
+    if top:
+        cmd += ["-X", "importtime"]
+    cmd += ["-c", _PROBE.format(baseline=BASELINE, modules=modules)]
+    proc = subprocess.run(cmd, cwd=ROOT, capture_output=True, text=True, check=True)
+    result = json.loads(proc.stdout)
+    result["page"] = page
+    result["imports"] = list(modules)
+    if top:
+        # The baseline is imported first, so everything it loaded appears
+        # before the page's own imports and can be skipped by position.
+        marker = max(proc.stderr.rfind(f"| {name}\n") for name in BASELINE)
+        page_log = proc.stderr[proc.stderr.find("\n", marker) + 1:]
+        result["top"] = _top_packages(page_log, top)
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--top", type=int, default=0, help="list the N heaviest imports per page")
+    parser.add_argument("--json", action="store_true", help="print machine-readable results")
+    args = parser.parse_args(argv)
+
+    results = [measure(page, args.top) for page in PAGE_IMPORTS]
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{'Page':<24} {'Import ms':>10} {'RSS MiB':>9}  Imports")
+    for r in results:
+        print(f"{r['page']:<24} {r['ms']:>10.1f} {r['rss_kb'] / 1024:>9.1f}  {', '.join(r['imports']) or '-'}")
+        for name, ms in r.get("top", []):
+            print(f"{'':<24} {ms:>10.1f} {'':>9}    {name}")
+
+
+if __name__ == "__main__":
+    main()
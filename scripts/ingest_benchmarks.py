@@ -0,0 +1,54 @@
+"""Ingest benchmark result files into the columnar benchmark store.
+
+Accepts pytest-benchmark JSON (``pytest --benchmark-json=out.json``, with
+``--benchmark-save-data`` for raw samples) and asv result files; directories
+are searched recursively for ``*.json``. Files already in the store are
+skipped, so it is safe to re-run over a growing results directory.
+
+    python scripts/ingest_benchmarks.py .benchmarks/ results/
+"""
+import argparse
+import glob
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import benchstore  # noqa: E402
+
+
+def _files(paths):
+    for path in paths:
+        if os.path.isdir(path):
+            yield from sorted(glob.glob(os.path.join(path, "**", "*.json"), recursive=True))
+        else:
+            yield path
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("paths", nargs="+", help="result files or directories")
+    parser.add_argument("--store", default=benchstore.STORE_DIR)
+    args = parser.parse_args(argv)
+
+    store = benchstore.BenchStore(args.store)
+    added = skipped = 0
+    for path in _files(args.paths):
+        if os.path.basename(path) in ("machine.json", "benchmarks.json"):
+            continue  # asv metadata, not results
+        try:
+            n = store.ingest(path)
+        except ValueError as exc:
+            print(f"skip {path}: {exc}", file=sys.stderr)
+            continue
+        if n:
+            added += 1
+            print(f"{path}: {n} benchmarks")
+        else:
+            skipped += 1
+    print(f"{added} runs added, {skipped} already stored; {len(store)} runs in {args.store}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,347 @@
+"""Ramp up concurrent Streamlit sessions against the app and report rerun latency.
+
+Starts the app on a free local port (or targets ``--url``), then for each
+concurrency level opens that many websocket sessions that behave like
+visitors: every session clicks through the sidebar pages and submits the
+contact form, round after round, for ``--duration`` seconds. Each step
+reports p50/p99 rerun latency (request sent to ``script_finished``
+received), reruns per second, failed reruns, and the CPU use and peak RSS
+of the server together with its child processes, read from /proc.
+
+    python scripts/load_test.py --levels 1,5,10,25,50 --duration 20
+
+A server started by this script writes contact messages to a throwaway
+database. All sessions come from 127.0.0.1, so most submissions end up
+rate limited; that path still runs the form and the inbox checks. Sessions
+speak Streamlit's protobuf protocol through ``websockets`` (installed with
+current Streamlit releases) or, on older ones, tornado.
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+
+import numpy as np
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from streamlit.proto.Radio_pb2 import Radio
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+FINISHED = ForwardMsg.ScriptFinishedStatus
+# Radio values travel as the option label on current releases, as its index on older ones.
+RADIO_BY_LABEL = "raw_value" in Radio.DESCRIPTOR.fields_by_name
+CONTACT_PAGE = "Contact"
+FORM_VALUES = {"Name": "Load Test", "Email": "load@example.com", "Message": "Load test message."}
+
+
+# ── Websocket client ─────────────────────────────────────────────────────────
+async def _connect(url):
+    """``(send, recv, close)`` coroutines for a binary websocket to ``url``."""
+    try:
+        import websockets
+    except ImportError:
+        from tornado.websocket import websocket_connect
+
+        conn = await websocket_connect(url, subprotocols=["streamlit"], max_message_size=1 << 30)
+
+        async def send(data):
+            await conn.write_message(data, binary=True)
+
+        async def recv():
+            data = await conn.read_message()
+            if data is None:
+                raise ConnectionError("server closed the websocket")
+            return data
+
+        async def close():
+            conn.close()
+
+        return send, recv, close
+
+    ws = await websockets.connect(url, subprotocols=["streamlit"], max_size=None)
+    return ws.send, ws.recv, ws.close
+
+
+class Session:
+    """One simulated browser tab."""
+
+    def __init__(self, url):
+        self.url = url.rstrip("/").replace("http", "ws", 1) + "/_stcore/stream"
+        self.page_hash = ""
+        self.radio = None          # (id, options) of the sidebar page radio
+        self.form = {}             # label -> widget id of the contact form
+        self.submit = None         # (id, fragment id) of the form's submit button
+
+    async def open(self):
+        self._send, self._recv, self.close = await _connect(self.url)
+
+    def _widget(self, state, value):
+        if isinstance(value, bool):
+            state.trigger_value = value
+        elif isinstance(value, int):
+            state.int_value = value
+        else:
+            state.string_value = value
+
+    async def rerun(self, widgets=None, fragment_id=""):
+        """Request a rerun with ``widgets`` (id -> value); returns ``(seconds, ok)``."""
+        msg = BackMsg()
+        client = msg.rerun_script
+        client.page_script_hash = self.page_hash
+        client.fragment_id = fragment_id
+        for widget_id, value in (widgets or {}).items():
+            state = client.widget_states.widgets.add()
+            state.id = widget_id
+            self._widget(state, value)
+
+        started = time.perf_counter()
+        await self._send(msg.SerializeToString())
+        ok = True
+        while True:
+            reply = ForwardMsg()
+            reply.ParseFromString(await self._recv())
+            kind = reply.WhichOneof("type")
+            if kind == "new_session":
+                self.page_hash = reply.new_session.page_script_hash
+            elif kind == "delta" and reply.delta.WhichOneof("type") == "new_element":
+                ok &= self._element(reply.delta.new_element, reply.delta.fragment_id)
+            elif kind == "script_finished":
+                if reply.script_finished == FINISHED.FINISHED_EARLY_FOR_RERUN:
+                    continue
+                ok &= reply.script_finished != FINISHED.FINISHED_WITH_COMPILE_ERROR
+                return time.perf_counter() - started, ok
+
+    def _element(self, element, fragment_id):
+        kind = element.WhichOneof("type")
+        if kind == "exception":
+            return False
+        if kind == "radio" and self.radio is None:
+            self.radio = (element.radio.id, list(element.radio.options))
+        elif kind in ("text_input", "text_area"):
+            widget = getattr(element, kind)
+            if widget.form_id and widget.label in FORM_VALUES:
+                self.form[widget.label] = widget.id
+        elif kind == "button" and element.button.is_form_submitter:
+            self.submit = (element.button.id, fragment_id)
+        return True
+
+    def page(self, title):
+        radio_id, options = self.radio
+        return {radio_id: title if RADIO_BY_LABEL else options.index(title)}
+
+    async def send_message(self):
+        submit_id, fragment_id = self.submit
+        widgets = self.page(CONTACT_PAGE)
+        widgets.update({self.form[label]: value for label, value in FORM_VALUES.items() if label in self.form})
+        widgets[submit_id] = True
+        return await self.rerun(widgets, fragment_id)
+
+
+async def visitor(url, deadline, samples, errors):
+    session = Session(url)
+    await session.open()
+    try:
+        await session.rerun()
+        if session.radio is None:
+            raise RuntimeError("no page radio in the first run")
+        while time.monotonic() < deadline:
+            for title in session.radio[1]:
+                elapsed, ok = await session.rerun(session.page(title))
+                samples.append(elapsed)
+                errors[0] += not ok
+            if session.submit is not None:
+                elapsed, ok = await session.send_message()
+                samples.append(elapsed)
+                errors[0] += not ok
+    finally:
+        await session.close()
+
+
+# ── Server ───────────────────────────────────────────────────────────────────
+def _free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def start_server(port, scratch):
+    env = dict(os.environ, PROFILE_MESSAGES_DB=os.path.join(scratch, "messages.sqlite3"))
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "streamlit", "run", os.path.join(ROOT, "app.py"),
+         "--server.headless=true", f"--server.port={port}", "--server.address=127.0.0.1",
+         "--browser.gatherUsageStats=false"],
+        cwd=ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    url = f"http://127.0.0.1:{port}"
+    for _ in range(300):
+        if proc.poll() is not None:
+            raise RuntimeError(f"streamlit exited with status {proc.returncode}")
+        try:
+            with urllib.request.urlopen(f"{url}/_stcore/health", timeout=1):
+                return proc, url
+        except OSError:
+            time.sleep(0.2)
+    proc.terminate()
+    raise RuntimeError("streamlit did not become healthy within 60s")
+
+
+class ProcStats:
+    """CPU time and resident memory of a process and all its descendants, from /proc.
+
+    The app does its heavy work in spawned children (crew simulations, CV
+    builds, risk model cross-validation), so the server process alone
+    understates both. CPU includes children that have exited and been
+    reaped; RSS is summed per process, so pages shared between them count
+    more than once.
+    """
+
+    def __init__(self, pid):
+        self.pid = pid
+        self.available = pid is not None and os.path.exists(f"/proc/{pid}/stat")
+        self.tick = os.sysconf("SC_CLK_TCK") if self.available else 1
+
+    @staticmethod
+    def _stat(pid):
+        """Fields after the parenthesised command name, or ``None`` if the process is gone."""
+        try:
+            with open(f"/proc/{pid}/stat") as f:
+                return f.read().rsplit(")", 1)[1].split()
+        except (OSError, IndexError):
+            return None
+
+    def tree(self):
+        """The process and its live descendants."""
+        # /proc/<pid>/task/*/children needs CONFIG_PROC_CHILDREN; parent ids are always there.
+        children = {}
+        for entry in os.listdir("/proc"):
+            if entry.isdigit():
+                fields = self._stat(entry)
+                if fields is not None:
+                    children.setdefault(int(fields[1]), []).append(int(entry))
+        pids, todo = [], [self.pid]
+        while todo:
+            pid = todo.pop()
+            pids.append(pid)
+            todo.extend(children.get(pid, ()))
+        return pids
+
+    def cpu_seconds(self):
+        if not self.available:
+            return None
+        total = 0
+        for pid in self.tree():
+            fields = self._stat(pid)
+            if fields is not None:
+                # utime, stime, cutime and cstime are the 14th to 17th fields.
+                total += sum(int(value) for value in fields[11:15])
+        return total / self.tick
+
+    def rss_mb(self):
+        if not self.available:
+            return None
+        total = 0
+        for pid in self.tree():
+            try:
+                with open(f"/proc/{pid}/status") as f:
+                    for line in f:
+                        if line.startswith("VmRSS:"):
+                            total += int(line.split()[1])
+                            break
+            except OSError:
+                continue
+        return total / 1024
+
+
+# ── Ramp ─────────────────────────────────────────────────────────────────────
+async def run_level(url, sessions, duration, stats):
+    samples, errors = [], [0]
+    peak_rss = [stats.rss_mb()]
+
+    async def sample_rss():
+        while True:
+            await asyncio.sleep(0.5)
+            rss = stats.rss_mb()
+            if rss is not None:
+                peak_rss[0] = max(peak_rss[0], rss)
+
+    async def staggered():
+        await asyncio.sleep(random.uniform(0, min(1.0, duration / 4)))
+        await visitor(url, deadline, samples, errors)
+
+    deadline = time.monotonic() + duration
+    cpu_before, started = stats.cpu_seconds(), time.monotonic()
+    sampler = asyncio.ensure_future(sample_rss())
+    failures = [r for r in await asyncio.gather(*(staggered() for _ in range(sessions)), return_exceptions=True)
+                if isinstance(r, BaseException)]
+    sampler.cancel()
+    wall = time.monotonic() - started
+    cpu_after = stats.cpu_seconds()
+
+    latencies = np.asarray(samples) * 1000
+    return {
+        "sessions": sessions,
+        "reruns": len(samples),
+        "reruns_per_s": len(samples) / wall,
+        "p50_ms": float(np.percentile(latencies, 50)) if len(latencies) else None,
+        "p99_ms": float(np.percentile(latencies, 99)) if len(latencies) else None,
+        "errors": errors[0] + len(failures),
+        "cpu_pct": None if cpu_before is None else 100 * (cpu_after - cpu_before) / wall,
+        "rss_mb": peak_rss[0],
+    }
+
+
+def _fmt(value, spec):
+    return "n/a" if value is None else format(value, spec)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--levels", default="1,5,10,25,50",
+                        help="comma-separated concurrent session counts (default: %(default)s)")
+    parser.add_argument("--duration", type=float, default=20, help="seconds per level (default: %(default)s)")
+    parser.add_argument("--url", help="existing server to test instead of starting one")
+    parser.add_argument("--pid", type=int,
+                        help="server process id for CPU/RSS (summed with its children) when using --url")
+    parser.add_argument("--json", dest="json_path", help="also write the results to this file")
+    args = parser.parse_args(argv)
+    levels = [int(n) for n in args.levels.split(",") if n.strip()]
+
+    proc = None
+    with tempfile.TemporaryDirectory() as scratch:
+        if args.url:
+            url, pid = args.url, args.pid
+        else:
+            proc, url = start_server(_free_port(), scratch)
+            pid = proc.pid
+        stats = ProcStats(pid)
+        print(f"target {url}" + (f" (pid {pid})" if pid else ""))
+        print(f"{'sessions':>8}{'reruns':>8}{'reruns/s':>10}{'p50 ms':>9}{'p99 ms':>9}"
+              f"{'errors':>8}{'tree cpu %':>12}{'tree rss MB':>13}")
+        results = []
+        try:
+            for sessions in levels:
+                row = asyncio.run(run_level(url, sessions, args.duration, stats))
+                results.append(row)
+                print(f"{row['sessions']:>8}{row['reruns']:>8}{row['reruns_per_s']:>10.1f}"
+                      f"{_fmt(row['p50_ms'], '.1f'):>9}{_fmt(row['p99_ms'], '.1f'):>9}{row['errors']:>8}"
+                      f"{_fmt(row['cpu_pct'], '.0f'):>12}{_fmt(row['rss_mb'], '.0f'):>13}", flush=True)
+        finally:
+            if proc is not None:
+                proc.terminate()
+                proc.wait(timeout=10)
+
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""Measure how much memory each additional session keeps alive.
+
+Runs the app in-process with Streamlit's AppTest: one warm-up session visits
+every page so imports and process-wide caches (content, figures, shared
+datasets) are built, then ``--sessions`` more sessions do the same and are
+kept open. The tracemalloc difference between the two points, divided by the
+number of sessions, is the per-session overhead; the part allocated by this
+repo's modules (rather than Streamlit or the test harness) is listed by
+source line. The tracemalloc peak of one warm rerun per page shows what a
+session allocates transiently while rendering, which is what concurrent
+reruns add up. Compare two checkouts to see what a change saves.
+
+    python scripts/memory_report.py --sessions 20
+"""
+import argparse
+import gc
+import os
+import sys
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from streamlit.testing.v1 import AppTest  # noqa: E402
+
+import views  # noqa: E402
+
+
+def visit_all_pages():
+    at = AppTest.from_file(os.path.join(ROOT, "app.py"), default_timeout=60)
+    at.run()
+    for title in views.PAGES:
+        at.sidebar.radio(key="page").set_value(title).run()
+        if at.exception:
+            raise RuntimeError(f"{title}: {at.exception[0].value}")
+    return at
+
+
+def rerun_peaks(at):
+    """Peak traced bytes above the starting point during one rerun of each page."""
+    peaks = {}
+    for title in views.PAGES:
+        at.sidebar.radio(key="page").set_value(title).run()
+        gc.collect()
+        tracemalloc.reset_peak()
+        start = tracemalloc.get_traced_memory()[0]
+        at.run()
+        peaks[title] = tracemalloc.get_traced_memory()[1] - start
+    return peaks
+
+
+def _rss_mb():
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return None
+
+
+def _own_code(stat):
+    filename = stat.traceback[0].filename
+    return filename.startswith(ROOT) and not filename.startswith(os.path.join(ROOT, "scripts"))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=20, help="sessions to open (default: %(default)s)")
+    parser.add_argument("--top", type=int, default=10, help="source lines to list (default: %(default)s)")
+    args = parser.parse_args(argv)
+
+    tracemalloc.start(1)
+    keep = [visit_all_pages()]
+    gc.collect()
+    before, rss_before = tracemalloc.take_snapshot(), _rss_mb()
+
+    keep += [visit_all_pages() for _ in range(args.sessions)]
+    gc.collect()
+    after, rss_after = tracemalloc.take_snapshot(), _rss_mb()
+
+    diff = after.compare_to(before, "lineno")
+    total = sum(stat.size_diff for stat in diff)
+    own = [stat for stat in diff if stat.size_diff > 0 and _own_code(stat)]
+    own_total = sum(stat.size_diff for stat in own)
+
+    n = args.sessions
+    print(f"{n} sessions, all pages visited, kept open")
+    print(f"  traced per session:      {total / n / 1024:9.1f} KiB")
+    print(f"  from app code:           {own_total / n / 1024:9.1f} KiB")
+    if rss_before is not None:
+        print(f"  RSS per session:         {(rss_after - rss_before) / n * 1024:9.1f} KiB")
+    if own:
+        print("\nApp-code allocations still alive, per session:")
+        for stat in sorted(own, key=lambda s: -s.size_diff)[:args.top]:
+            frame = stat.traceback[0]
+            print(f"  {stat.size_diff / n / 1024:8.1f} KiB  {os.path.relpath(frame.filename, ROOT)}:{frame.lineno}")
+    print("\nPeak allocated during one warm rerun:")
+    for title, peak in rerun_peaks(keep[-1]).items():
+        print(f"  {peak / 1024:8.1f} KiB  {title}")
+    del keep
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Subset the Inter font to the latin range used by the profile.
+
+Writes ``assets/fonts/inter-latin.woff2``, the file assets/profile.css refers
+to. layout.py fingerprints it into static/ on startup, so the app never
+fetches fonts from Google and works offline. Start from the variable font
+(``InterVariable.ttf``) so a single file covers weights 300-700.
+
+Requires the optional ``fonttools`` and ``brotli`` packages:
+
+    pip install fonttools brotli
+    python scripts/subset_font.py path/to/InterVariable.ttf
+"""
+import argparse
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+OUTPUT = os.path.join(ROOT, "assets", "fonts", "inter-latin.woff2")
+
+# Keep in sync with the unicode-range of the @font-face rule in assets/profile.css.
+LATIN = (
+    "U+0000-00FF,U+0131,U+0152-0153,U+02BB-02BC,U+02C6,U+02DA,U+02DC,"
+    "U+2000-206F,U+2074,U+20AC,U+2122,U+2191,U+2193,U+2212,U+2215,U+FEFF,U+FFFD"
+)
+
+
+def subset(source, output=OUTPUT, weights=(300, 700)):
+    try:
+        from fontTools import subset as ftsubset
+        from fontTools.ttLib import TTFont
+    except ImportError:
+        sys.exit("fonttools is required: pip install fonttools brotli")
+
+    options = ftsubset.Options()
+    options.flavor = "woff2"
+    options.layout_features = ["kern", "liga", "calt", "tnum"]
+    options.name_IDs = ["*"]
+    options.notdef_outline = True
+
+    font = TTFont(source)
+    subsetter = ftsubset.Subsetter(options)
+    subsetter.populate(unicodes=ftsubset.parse_unicodes(LATIN))
+    subsetter.subset(font)
+
+    # Instance after subsetting: less to process, and fontTools' subsetter
+    # trips over the lazily loaded glyph variations an instanced font has.
+    if "fvar" in font:
+        from fontTools.varLib import instancer
+
+        limits = {"wght": weights}
+        # Inter 4 adds an optical-size axis; pin it to the text default.
+        if any(axis.axisTag == "opsz" for axis in font["fvar"].axes):
+            limits["opsz"] = None
+        font = instancer.instantiateVariableFont(font, limits)
+
+    os.makedirs(os.path.dirname(output), exist_ok=True)
+    font.flavor = "woff2"
+    font.save(output)
+    return output
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("source", help="Inter .ttf/.otf (preferably the variable font)")
+    parser.add_argument("--output", default=OUTPUT)
+    args = parser.parse_args(argv)
+
+    path = subset(args.source, args.output)
+    print(f"{path}: {os.path.getsize(path) / 1024:.1f} KiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""Fit (or load) the failure-risk and repair-time model for an incident log.
+
+Aggregates the log through the incidents cache, then trains both regressors
+with cross-validation in a process pool and stores the result under
+.cache/models/. Running it after ingesting a new log means the Research page
+never has to fit anything itself.
+
+    python scripts/train_model.py incidents.parquet --workers 4
+"""
+import argparse
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import incidents  # noqa: E402
+import riskmodel  # noqa: E402
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("path", help="CSV or Parquet incident log")
+    parser.add_argument("--workers", type=int, default=riskmodel.MAX_WORKERS,
+                        help="cross-validation processes (default: one per CPU)")
+    args = parser.parse_args(argv)
+
+    table = incidents.load(args.path)
+    started = time.perf_counter()
+    model = riskmodel.train(table, max_workers=args.workers)
+    elapsed = time.perf_counter() - started
+    print(f"model {model.key}: {model.rows} aggregate rows, "
+          f"{len(model.regions)} regions, {len(model.asset_classes)} asset classes ({elapsed:.2f}s)")
+    for name, fit in model.fits.items():
+        scores = ("  ".join(f"{alpha:g}: {rmse:.4f}" for alpha, rmse in sorted(fit.cv_rmse.items()))
+                  or "n/a, not enough history")
+        print(f"  {name:<7} alpha={fit.alpha:g}  cv rmse by alpha  {scores}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,187 @@
+"""Full-text search over every section of a profile.
+
+``ProfileIndex`` is built once per content load (``content.Content.search``).
+It flattens the profile into small documents (one per project, certificate,
+education entry, skill category, ...) that each know the page they are shown
+on, and precomputes an inverted index from term to ``(document, BM25 weight)``
+postings with title terms boosted. A query is then a few dictionary lookups
+and additions; the last query term also matches as a prefix (through a
+bisect over the sorted vocabulary), so results update while typing. Snippets
+are cut and highlighted only for the hits that are displayed.
+"""
+import bisect
+import html
+import math
+import re
+from collections import namedtuple
+from types import MappingProxyType
+
+from taxonomy import tokens
+
+MAX_HITS = 8
+MAX_EXPANSIONS = 64
+TITLE_BOOST = 3
+PREFIX_DISCOUNT = 0.8
+SNIPPET_CHARS = 160
+# BM25 parameters
+K1, B = 1.2, 0.75
+
+Document = namedtuple("Document", ["page", "section", "title", "text"])
+Hit = namedtuple("Hit", ["doc", "score", "title", "snippet"])
+Results = namedtuple("Results", ["hits", "total"])
+
+_TAG = re.compile(r"<[^>]+>")
+_TOKEN_CHARS = "a-z0-9#+"
+
+
+def plain(text):
+    """Visible text of a content fragment that may contain inline HTML."""
+    return " ".join(html.unescape(_TAG.sub(" ", text)).split())
+
+
+def documents(profile):
+    """Searchable documents for a ``content.Content``, in page order."""
+    person = profile.person
+    docs = [Document("home", "About", person.name, " · ".join([person.headline, person.bio, *person.badges]))]
+    docs.append(Document("home", "Highlights", "Highlights",
+                         " · ".join(f"{h.value} {h.label}" for h in profile.highlights)))
+    docs += [Document("home", "Education", e.title, " · ".join(filter(None, (e.year, e.subtitle, e.note))))
+             for e in profile.education]
+    docs += [Document("home", "Certifications", cert, cert) for cert in profile.certs]
+
+    docs += [Document("research", f.heading, f.title, f.desc) for f in profile.research.values()]
+    docs += [Document("research", "Projects", p.title, p.desc) for p in profile.projects.items]
+
+    docs += [Document("skills", "Skills", category, ", ".join(s.name for s in rows))
+             for category, rows in profile.skills.by_category.items()]
+    docs.append(Document("skills", "Toolbox", "Toolbox", ", ".join(profile.tools)))
+    docs.append(Document("skills", "Competencies", "Core Competencies", ", ".join(profile.competencies)))
+
+    docs += [Document("achievements", "Accomplishments", a.title, a.desc) for a in profile.accomplishments.items]
+    docs += [Document("achievements", "Research Interests", name, name) for name in profile.interests]
+
+    docs += [Document("contact", "Contact", c.title, c.desc) for c in profile.contact.items]
+    return [d._replace(title=plain(d.title), text=plain(d.text)) for d in docs]
+
+
+class ProfileIndex:
+    """Immutable inverted index over ``documents(profile)``."""
+
+    __slots__ = ("docs", "postings", "vocabulary")
+
+    def __init__(self, docs):
+        self.docs = tuple(docs)
+        counts = []
+        for doc in self.docs:
+            tf = {}
+            for term in tokens(doc.text):
+                tf[term] = tf.get(term, 0) + 1
+            for term in tokens(doc.title):
+                tf[term] = tf.get(term, 0) + TITLE_BOOST
+            counts.append(tf)
+
+        n = len(counts)
+        avg_len = sum(sum(tf.values()) for tf in counts) / n if n else 1.0
+        df = {}
+        for tf in counts:
+            for term in tf:
+                df[term] = df.get(term, 0) + 1
+
+        postings = {}
+        for i, tf in enumerate(counts):
+            norm = K1 * (1 - B + B * sum(tf.values()) / avg_len)
+            for term, f in tf.items():
+                idf = math.log(1 + (n - df[term] + 0.5) / (df[term] + 0.5))
+                postings.setdefault(term, {})[i] = idf * f * (K1 + 1) / (f + norm)
+        self.postings = MappingProxyType({term: MappingProxyType(p) for term, p in postings.items()})
+        self.vocabulary = tuple(sorted(postings))
+
+    @classmethod
+    def build(cls, profile):
+        return cls(documents(profile))
+
+    def __len__(self):
+        return len(self.docs)
+
+    def _expand(self, prefix):
+        start = bisect.bisect_left(self.vocabulary, prefix)
+        out = []
+        for term in self.vocabulary[start:start + MAX_EXPANSIONS]:
+            if not term.startswith(prefix):
+                break
+            out.append(term)
+        return out
+
+    def _term_scores(self, term, prefix):
+        exact = self.postings.get(term, {})
+        if not prefix:
+            return exact
+        scores = dict(exact)
+        for other in self._expand(term):
+            if other == term:
+                continue
+            for i, w in self.postings[other].items():
+                w *= PREFIX_DISCOUNT
+                if w > scores.get(i, 0.0):
+                    scores[i] = w
+        return scores
+
+    def search(self, query, limit=MAX_HITS):
+        """Best ``limit`` documents containing every query term, highlighted.
+
+        The last term also matches longer words it prefixes.
+        """
+        terms = tokens(query)
+        if not terms:
+            return Results((), 0)
+        scores = None
+        for n, term in enumerate(terms):
+            term_scores = self._term_scores(term, prefix=n == len(terms) - 1)
+            if scores is None:
+                scores = dict(term_scores)
+            else:
+                scores = {i: s + term_scores[i] for i, s in scores.items() if i in term_scores}
+            if not scores:
+                return Results((), 0)
+
+        ranked = sorted(scores, key=lambda i: (-scores[i], i))[:limit]
+        pattern = _highlighter(terms)
+        hits = tuple(
+            Hit(self.docs[i], scores[i], highlight(self.docs[i].title, pattern), snippet(self.docs[i].text, pattern))
+            for i in ranked
+        )
+        return Results(hits, len(scores))
+
+
+# ── Highlighting ─────────────────────────────────────────────────────────────
+def _highlighter(terms):
+    alternatives = "|".join(re.escape(t) for t in sorted(set(terms), key=len, reverse=True))
+    # Whole tokens starting with a query term, the way they were matched.
+    return re.compile(rf"(?<![{_TOKEN_CHARS}])(?:{alternatives})[{_TOKEN_CHARS}]*", re.IGNORECASE)
+
+
+def highlight(text, pattern):
+    """``text`` HTML-escaped, with matches wrapped in ``<mark>``."""
+    out, last = [], 0
+    for m in pattern.finditer(text):
+        out.append(html.escape(text[last:m.start()]))
+        out.append(f"<mark>{html.escape(m.group(0))}</mark>")
+        last = m.end()
+    out.append(html.escape(text[last:]))
+    return "".join(out)
+
+
+def snippet(text, pattern, width=SNIPPET_CHARS):
+    """About ``width`` characters of ``text`` around its first match, highlighted."""
+    first = pattern.search(text)
+    start = 0 if first is None else max(0, first.start() - width // 3)
+    if start:
+        space = text.find(" ", start)
+        start = space + 1 if 0 <= space < first.start() else start
+    end = min(len(text), start + width)
+    if end < len(text):
+        space = text.rfind(" ", start, end)
+        end = space if space > start else end
+    prefix = "… " if start else ""
+    suffix = " …" if end < len(text) else ""
+    return prefix + highlight(text[start:end], pattern) + suffix
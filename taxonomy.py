@@ -0,0 +1,141 @@
+"""Searchable skill taxonomy: grouping, prefix search, facets and pages.
+
+``SkillIndex`` is built once per content load from the ``skills`` section. A
+single pass over the rows fills the name and category lookups and an
+inverted index from every token prefix (up to ``MAX_PREFIX`` characters) to
+the rows containing it. ``search`` then costs a few dictionary lookups and a
+set intersection, however large the taxonomy. ``TagIndex`` does the same for
+plain names such as the toolbox.
+
+Views render one ``paginate`` slice at a time, so a taxonomy of thousands of
+entries sends no more elements or chart bars than a page holds.
+"""
+import math
+import re
+from collections import namedtuple
+from types import MappingProxyType
+
+MAX_PREFIX = 12
+
+Page = namedtuple("Page", ["items", "number", "pages", "total", "start"])
+
+_TOKEN = re.compile(r"[a-z0-9#+]+")
+
+
+def tokens(text):
+    """Lower-case search tokens; ``C++``, ``C#`` and ``Node.js`` stay searchable."""
+    return _TOKEN.findall(text.lower())
+
+
+def _prefix_index(names, max_prefix=MAX_PREFIX):
+    postings = {}
+    for i, name in enumerate(names):
+        for token in set(tokens(name)):
+            for n in range(1, min(len(token), max_prefix) + 1):
+                postings.setdefault(token[:n], set()).add(i)
+    return MappingProxyType({prefix: frozenset(ids) for prefix, ids in postings.items()})
+
+
+def _match(postings, names, query):
+    """Ids of ``names`` where every query token prefixes some token of the name."""
+    terms = tokens(query)
+    if not terms:
+        return None
+    candidates = []
+    for term in terms:
+        ids = postings.get(term[:MAX_PREFIX])
+        if not ids:
+            return set()
+        candidates.append(ids)
+    found = set(min(candidates, key=len)).intersection(*candidates)
+    long_terms = [t for t in terms if len(t) > MAX_PREFIX]
+    if long_terms:
+        found = {i for i in found if all(any(tok.startswith(t) for tok in tokens(names[i])) for t in long_terms)}
+    return found
+
+
+def paginate(items, number, per_page):
+    """The 1-based page ``number`` of ``items``, clamped to the last page."""
+    total = len(items)
+    pages = max(1, math.ceil(total / per_page))
+    number = min(max(1, number), pages)
+    start = (number - 1) * per_page
+    return Page(tuple(items[start:start + per_page]), number, pages, total, start)
+
+
+class SkillIndex:
+    """Immutable lookups and search over ``content.Skill`` rows."""
+
+    __slots__ = ("rows", "by_name", "by_category", "_category_ids", "_postings", "_names")
+
+    def __init__(self, rows):
+        self.rows = tuple(rows)
+        self._names = tuple(s.name for s in self.rows)
+        by_name = {}
+        by_category = {}
+        for i, s in enumerate(self.rows):
+            by_name[s.name] = s
+            by_category.setdefault(s.category, []).append(i)
+        self.by_name = MappingProxyType(by_name)
+        self._category_ids = MappingProxyType({cat: frozenset(ids) for cat, ids in by_category.items()})
+        self.by_category = MappingProxyType({
+            cat: tuple(self.rows[i] for i in ids) for cat, ids in by_category.items()
+        })
+        self._postings = _prefix_index(self._names)
+
+    def __len__(self):
+        return len(self.rows)
+
+    def search(self, query="", categories=None):
+        """Matching row ids, best first.
+
+        Without a query rows keep their profile order. With one, a name equal
+        to the query comes first, then names starting with it, then the rest;
+        ties go to higher proficiency.
+        """
+        found = _match(self._postings, self._names, query)
+        if categories is not None:
+            allowed = set().union(*(self._category_ids.get(c, ()) for c in categories))
+            if found is None:
+                return tuple(sorted(allowed))
+            found &= allowed
+        if found is None:
+            return tuple(range(len(self.rows)))
+
+        needle = " ".join(tokens(query))
+        def rank(i):
+            name = " ".join(tokens(self._names[i]))
+            return (name != needle, not name.startswith(needle), -self.rows[i].proficiency, i)
+        return tuple(sorted(found, key=rank))
+
+    def facets(self, ids):
+        """Number of ``ids`` per category, in taxonomy order."""
+        counts = dict.fromkeys(self.by_category, 0)
+        for i in ids:
+            counts[self.rows[i].category] += 1
+        return counts
+
+    def select(self, ids):
+        return tuple(self.rows[i] for i in ids)
+
+
+class TagIndex:
+    """Prefix search over a flat list of names (the toolbox)."""
+
+    __slots__ = ("items", "_postings")
+
+    def __init__(self, names):
+        self.items = tuple(str(name) for name in names)
+        self._postings = _prefix_index(self.items)
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def __len__(self):
+        return len(self.items)
+
+    def search(self, query=""):
+        found = _match(self._postings, self.items, query)
+        if found is None:
+            return self.items
+        return tuple(self.items[i] for i in sorted(found))
@@ -0,0 +1,117 @@
+"""HTML components for the page markup, compiled once and memoized.
+
+Each component is a ``string.Template`` compiled at import. ``render`` fills
+it with keyword fields; every field is HTML-escaped except those the
+component lists in ``html``: fields the profile schema documents as inline
+HTML (``desc``, ``note``) and fragments produced by other components.
+
+Rendered markup is memoized per component in an LRU keyed on the fields, so a
+section whose content has not changed costs one dictionary lookup per rerun.
+``many`` does the same for a whole list of rows (content namedtuples or
+mappings), returning the joined markup.
+"""
+import html
+import string
+import textwrap
+from functools import lru_cache
+
+CACHE_SIZE = 1024
+
+
+def _items(row):
+    if hasattr(row, "_asdict"):
+        row = row._asdict()
+    return tuple(sorted(row.items()))
+
+
+class Component:
+    """One compiled template with its own render cache."""
+
+    def __init__(self, name, source, html=()):
+        self.name = name
+        self.template = string.Template(textwrap.dedent(source).strip())
+        self.html = frozenset(html)
+        self._render = lru_cache(maxsize=CACHE_SIZE)(self._substitute)
+        self._many = lru_cache(maxsize=CACHE_SIZE)(self._join)
+
+    def _substitute(self, items):
+        return self.template.substitute({
+            key: value if key in self.html else html.escape(str(value)) for key, value in items
+        })
+
+    def _join(self, rows, sep):
+        return sep.join(self._render(_items(row) if hasattr(row, "_asdict") else row) for row in rows)
+
+    def render(self, **fields):
+        return self._render(tuple(sorted(fields.items())))
+
+    def many(self, rows, sep=""):
+        # Content namedtuples are hashable as they are, so a repeat costs one lookup.
+        return self._many(tuple(row if hasattr(row, "_asdict") else _items(row) for row in rows), sep)
+
+    def cache_info(self):
+        return self._render.cache_info(), self._many.cache_info()
+
+
+SECTION_HEADER = Component("section_header", '<div class="section-header">$title</div>')
+
+HERO = Component("hero", """
+    <div class="hero-section">
+        <div class="hero-name">$name</div>
+        <div class="hero-title">$headline</div>
+        <div class="hero-bio">$bio</div>
+        <div style="margin-top:1rem;">$badges</div>
+    </div>
+""", html=("badges",))
+
+CONTACT_BADGE = Component("contact_badge", '<span class="contact-badge">$text</span>')
+
+METRIC_CARD = Component("metric_card", """
+    <div class="metric-card"><div class="metric-value">$value</div><div class="metric-label">$label</div></div>
+""")
+
+TIMELINE_ITEM = Component("timeline_item", """
+    <div class="timeline-item">
+        <div class="timeline-year">$year</div>
+        <div class="timeline-title">$title</div>
+        <div class="timeline-subtitle">$subtitle</div>$note
+    </div>
+""", html=("note",))
+
+TIMELINE_NOTE = Component("timeline_note", """
+    <div class="timeline-subtitle" style="margin-top:0.3rem; color:#4a5c6a;">$note</div>
+""", html=("note",))
+
+PROJECT_CARD = Component("project_card", """
+    <div class="project-card">
+        <div class="project-title">$title</div>
+        <div class="project-desc">$desc</div>
+    </div>
+""", html=("desc",))
+
+SKILL_TAG = Component("skill_tag", '<span class="skill-tag">$text</span>')
+
+COMPONENTS = {c.name: c for c in (
+    SECTION_HEADER, HERO, CONTACT_BADGE, METRIC_CARD, TIMELINE_ITEM, TIMELINE_NOTE, PROJECT_CARD, SKILL_TAG,
+)}
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _tags(component, texts, sep):
+    return component.many(({"text": t} for t in texts), sep)
+
+
+def tags(component, texts, sep=" "):
+    """``component`` rendered once per string in ``texts``, joined."""
+    return _tags(component, tuple(texts), sep)
+
+
+def cache_stats():
+    """Hits and misses summed over every component's caches."""
+    info = _tags.cache_info()
+    hits, misses = info.hits, info.misses
+    for component in COMPONENTS.values():
+        for info in component.cache_info():
+            hits += info.hits
+            misses += info.misses
+    return hits, misses
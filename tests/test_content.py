@@ -0,0 +1,48 @@
+import os
+import shutil
+
+import pytest
+
+import content
+
+
+def _store(tmp_path):
+    path = tmp_path / "profile.json"
+    shutil.copy(content.DEFAULT_PATH, path)
+    return path, content.ContentStore(str(path))
+
+
+def _rewrite(path, text):
+    mtime = path.stat().st_mtime_ns
+    path.write_text(text)
+    os.utime(path, ns=(mtime + 10**9, mtime + 10**9))
+
+
+def test_broken_reload_keeps_last_good_content(tmp_path):
+    path, store = _store(tmp_path)
+    good = store.get()
+    _rewrite(path, '{"version": 2, "person": ')
+
+    assert store.get() is good
+    reloads = store.reloads
+    assert store.get() is good
+    assert store.reloads == reloads
+
+
+def test_reload_recovers_once_the_file_is_fixed(tmp_path):
+    path, store = _store(tmp_path)
+    text = path.read_text()
+    good = store.get()
+    _rewrite(path, "{}")
+    assert store.get() is good
+
+    _rewrite(path, text)
+    assert store.get() is not good
+    assert store.get().person == good.person
+
+
+def test_first_load_still_raises(tmp_path):
+    path = tmp_path / "profile.json"
+    path.write_text('{"version": 2')
+    with pytest.raises(ValueError):
+        content.ContentStore(str(path)).get()
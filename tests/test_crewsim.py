@@ -0,0 +1,41 @@
+import numpy as np
+import crewsim
+
+SCENARIO = crewsim.Scenario("pooled", 6.0, 4.0, max_crews=3, scenarios=700, seed=7)
+
+
+def test_block_is_reproducible_for_a_seed():
+    seed = np.random.SeedSequence(SCENARIO.seed)
+    first = crewsim.simulate_block(SCENARIO, seed, 50)
+    again = crewsim.simulate_block(SCENARIO, np.random.SeedSequence(SCENARIO.seed), 50)
+    assert first.shape == (50, SCENARIO.max_crews)
+    np.testing.assert_array_equal(first, again)
+
+
+def test_different_seeds_differ():
+    a = crewsim.simulate_block(SCENARIO, np.random.SeedSequence(1), 50)
+    b = crewsim.simulate_block(SCENARIO, np.random.SeedSequence(2), 50)
+    assert not np.array_equal(a, b)
+
+
+def test_more_pooled_crews_never_wait_longer_on_average():
+    # Common random numbers: every crew count replays the same incidents.
+    # (Zoned dispatch is not monotonic: from ZONES crews up, each crew serves only its zone.)
+    out = crewsim.simulate_block(SCENARIO, np.random.SeedSequence(3), 100)
+    means = np.nanmean(out, axis=0)
+    assert np.all(np.diff(means) <= 1e-9)
+
+
+def test_simulate_matches_blocks_and_is_cached(monkeypatch):
+    monkeypatch.setattr(crewsim, "_results", type(crewsim._results)())
+    partial = []
+    bands = crewsim.simulate(SCENARIO, on_block=partial.append)
+
+    # Two blocks (500 + 200 scenarios): one partial report, then the final bands.
+    seeds = np.random.SeedSequence(SCENARIO.seed).spawn(2)
+    expected = crewsim.bands([crewsim.simulate_block(SCENARIO, s, n) for s, n in zip(seeds, (500, 200))], 700)
+    assert len(partial) == 1 and partial[0].scenarios in (200, 500)
+    assert bands.scenarios == 700
+    np.testing.assert_allclose(bands.p50, expected.p50)
+    np.testing.assert_allclose(bands.mean, expected.mean)
+    assert crewsim.simulate(SCENARIO) is bands
@@ -0,0 +1,83 @@
+import re
+import time
+import zlib
+
+import pytest
+
+import content
+import cv
+
+
+@pytest.fixture(scope="module")
+def doc():
+    return cv.document(content.get())
+
+
+@pytest.fixture
+def counters(monkeypatch):
+    for name in ("hits", "misses", "builds", "failures"):
+        monkeypatch.setattr(cv, name, 0)
+    monkeypatch.setattr(cv, "CHARTS", False)
+
+
+def _settled(finished=1, timeout=5.0):
+    """Wait for done-callbacks, which may run just after ``result()`` returns."""
+    deadline = time.monotonic() + timeout
+    while cv.builds + cv.failures < finished and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+def _objects(data):
+    """Object numbers found at the offsets the xref table lists."""
+    xref = int(re.search(rb"startxref\n(\d+)\n%%EOF\n$", data).group(1))
+    assert data[xref:xref + 4] == b"xref"
+    offsets = [int(o) for o in re.findall(rb"^(\d{10}) 00000 n ?$", data[xref:], re.M)]
+    return [int(re.match(rb"(\d+) 0 obj", data[offset:]).group(1)) for offset in offsets]
+
+
+def test_render_is_a_well_formed_pdf(doc, counters):
+    data = cv.render(doc)
+    assert data.startswith(b"%PDF-1.4\n")
+    objects = _objects(data)
+    assert objects == list(range(1, len(objects) + 1))
+    assert int(re.search(rb"/Size (\d+)", data).group(1)) == len(objects) + 1
+
+    pages = int(re.search(rb"/Type /Pages /Kids \[[^\]]*\] /Count (\d+)", data).group(1))
+    streams = [zlib.decompress(s) for s in re.findall(rb"/FlateDecode >>\nstream\n(.*?)\nendstream", data, re.S)]
+    assert pages == len(streams) >= 1
+    text = b"".join(streams)
+    assert cv._pdf_string(doc.name) in text
+    assert cv._pdf_string(f"{doc.name} · CV · {pages}/{pages}") in streams[-1]
+
+
+def test_text_is_escaped_and_wrapped():
+    assert cv._pdf_string("a (b) \\ c") == b"(a \\(b\\) \\\\ c)"
+    lines = cv.wrap("word " * 200, 10, 200)
+    assert len(lines) > 1
+    assert all(cv.text_width(line, 10) <= 200 for line in lines)
+
+
+def test_submit_caches_by_content(doc, counters, tmp_path):
+    path = cv.submit(doc, cache_dir=str(tmp_path)).result(timeout=60)
+    assert path == cv.cached(doc, cache_dir=str(tmp_path))
+    assert (cv.misses, cv.hits) == (1, 0)
+
+    _settled()
+    again = cv.submit(doc, cache_dir=str(tmp_path))
+    assert again.result() == path
+    assert (cv.misses, cv.hits, cv.builds, cv.failures) == (1, 1, 1, 0)
+
+    changed = doc._replace(headline="Something else")
+    assert cv.cached(changed, cache_dir=str(tmp_path)) is None
+    assert cv.digest(changed) != cv.digest(doc)
+
+
+def test_failed_build_is_not_cached(doc, counters, tmp_path):
+    blocked = tmp_path / "file"
+    blocked.write_text("")
+    job = cv.submit(doc, cache_dir=str(blocked / "cv"))
+    with pytest.raises(OSError):
+        job.result(timeout=60)
+    _settled()
+    assert cv.cached(doc, cache_dir=str(blocked / "cv")) is None
+    assert (cv.builds, cv.failures) == (0, 1)
@@ -0,0 +1,17 @@
+import os
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+import pools
+
+
+def test_get_replaces_a_broken_pool():
+    pool = pools.get("test.broken", 1)
+    assert pools.get("test.broken") is pool
+    with pytest.raises(BrokenProcessPool):
+        pool.submit(os._exit, 1).result(timeout=60)
+
+    fresh = pools.get("test.broken")
+    assert fresh is not pool
+    assert fresh.submit(abs, -3).result(timeout=60) == 3
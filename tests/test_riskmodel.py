@@ -0,0 +1,43 @@
+import numpy as np
+import pandas as pd
+
+import riskmodel
+
+
+def _table(months):
+    rng = np.random.default_rng(0)
+    rows = []
+    for month in pd.date_range("2024-01-01", periods=months, freq="MS"):
+        for region in ("North", "South"):
+            for asset_class in ("pipe", "pump"):
+                n = int(rng.integers(50, 150))
+                rows.append((month, region, asset_class, 4.0 * n, rng.uniform(6, 10) * n, n))
+    return pd.DataFrame(rows, columns=["month", "region", "asset_class", "ort_sum", "art_sum", "incidents"])
+
+
+def test_single_month_skips_cross_validation(tmp_path):
+    _, targets = riskmodel.training_arrays(_table(1))
+    assert not any(riskmodel.can_cross_validate(folds) for *_, folds in targets.values())
+    assert riskmodel.cross_validate(targets) == {"risk": {}, "repair": {}}
+
+    model = riskmodel.train(_table(1), cache_dir=str(tmp_path))
+    for fit in model.fits.values():
+        assert fit.cv_rmse == {}
+        assert fit.alpha == riskmodel.DEFAULT_ALPHA
+    risk, repair = model.predict(np.array(["North"]), np.array(["pipe"]), model.last + np.arange(1, 2), np.array([4.0]))
+    assert np.isfinite(risk).all() and np.isfinite(repair).all()
+
+
+def test_cross_validation_scores_every_alpha(tmp_path):
+    _, targets = riskmodel.training_arrays(_table(24))
+    scores = riskmodel.cross_validate(targets)
+    for by_alpha in scores.values():
+        assert set(by_alpha) == set(riskmodel.ALPHAS)
+        assert all(np.isfinite(rmse) for rmse in by_alpha.values())
+
+
+def test_model_round_trips_through_cache(tmp_path):
+    model = riskmodel.train(_table(1), cache_dir=str(tmp_path))
+    again = riskmodel.train(_table(1), cache_dir=str(tmp_path))
+    assert again.key == model.key
+    assert again.fits["risk"].cv_rmse == {}
@@ -0,0 +1,89 @@
+import json
+
+import rollups
+
+
+def _line(ts, country="SA", event="engage"):
+    return json.dumps({"ts": ts, "country": country, "event": event}) + "\n"
+
+
+def _rollup(tmp_path, text):
+    log = tmp_path / "events.jsonl"
+    log.write_text(text)
+    return log, rollups.Rollup(str(log), cache_dir=str(tmp_path / "cache"))
+
+
+def test_update_counts_per_country_and_quarter(tmp_path):
+    log, rollup = _rollup(tmp_path, _line("2025-01-05T10:00:00Z") + _line("2025-02-01T00:00:00Z", event="convert")
+                          + _line("2025-04-02T00:00:00Z", country="DRC"))
+    assert rollup.update() == log.stat().st_size
+    assert rollup.counts == {("SA", "2025Q1"): [1, 1], ("DRC", "2025Q2"): [1, 0]}
+    assert rollup.update() == 0
+
+
+def test_resumes_from_saved_offset(tmp_path):
+    log, rollup = _rollup(tmp_path, _line("2025-01-05T10:00:00Z"))
+    rollup.update()
+    with log.open("a") as f:
+        f.write(_line("2025-01-06T10:00:00Z"))
+
+    resumed = rollups.Rollup(str(log), cache_dir=str(tmp_path / "cache"))
+    assert resumed.offset == rollup.offset
+    assert resumed.update() == len(_line("2025-01-06T10:00:00Z"))
+    assert resumed.counts == {("SA", "2025Q1"): [2, 0]}
+
+
+def test_replaced_log_is_reread(tmp_path):
+    log, rollup = _rollup(tmp_path, _line("2025-01-05T10:00:00Z") * 3)
+    rollup.update()
+    log.write_text(_line("2025-07-01T00:00:00Z"))
+    rollup.update()
+    assert rollup.counts == {("SA", "2025Q3"): [1, 0]}
+
+
+def test_malformed_lines_are_skipped_and_consumed(tmp_path):
+    text = (_line("2025-01-05T10:00:00Z") + '{"ts": "2025-01-06T00:00:00Z", "coun\n'
+            + _line("2025-01-07T10:00:00Z") + "[1, 2]\n" + "not json\n")
+    log, rollup = _rollup(tmp_path, text)
+    assert rollup.update() == log.stat().st_size
+    assert rollup.counts == {("SA", "2025Q1"): [2, 0]}
+    assert rollup.malformed == 3
+    # The bad lines are behind the offset now: nothing is re-read or re-counted.
+    assert rollup.update() == 0
+    assert rollups.Rollup(str(log), cache_dir=str(tmp_path / "cache")).malformed == 3
+
+
+def test_trailing_partial_line_waits_for_its_newline(tmp_path):
+    first = _line("2025-01-05T10:00:00Z")
+    log, rollup = _rollup(tmp_path, first + '{"ts": "2025-01-06T00:00:00Z", "cou')
+    assert rollup.update() == len(first)
+    assert rollup.malformed == 0
+
+    with log.open("a") as f:
+        f.write('ntry": "SA", "event": "convert"}\n')
+    rollup.update()
+    assert rollup.offset == log.stat().st_size
+    assert rollup.counts == {("SA", "2025Q1"): [1, 1]}
+    assert rollup.malformed == 0
+
+
+def test_stale_stat_does_not_reset_counts(tmp_path, monkeypatch):
+    log, rollup = _rollup(tmp_path, _line("2025-01-05T10:00:00Z") * 3)
+    stale = log.stat()
+    with log.open("a") as f:
+        f.write(_line("2025-01-06T10:00:00Z"))
+    rollup.update()
+    assert rollup.counts == {("SA", "2025Q1"): [4, 0]}
+
+    # A session that stat'ed the log before the other one read further.
+    real_stat = rollups.os.stat
+    calls = []
+
+    def stat(path, *args, **kwargs):
+        calls.append(path)
+        return stale if len(calls) == 1 else real_stat(path, *args, **kwargs)
+
+    monkeypatch.setattr(rollups.os, "stat", stat)
+    assert rollup.update() == 0
+    assert rollup.counts == {("SA", "2025Q1"): [4, 0]}
+    assert rollup.offset == log.stat().st_size
@@ -0,0 +1,28 @@
+"""Page modules, loaded on first visit.
+
+Each module exposes ``render(profile)`` and imports only what its page needs
+(plotly, numpy, ...) at module top. ``load`` imports a page the first time it
+is shown, so a rerun executes just the active page's ``render`` and Home and
+Contact never pull in the chart libraries. See scripts/import_report.py for
+the per-page cost.
+
+Modules outside ``PAGES`` (``diagnostics``) are not listed in the sidebar and
+are reached through ``module`` directly.
+"""
+import importlib
+
+PAGES = {
+    "Home": "home",
+    "Research & Projects": "research",
+    "Skills & Tools": "skills",
+    "Achievements & Impact": "achievements",
+    "Contact": "contact",
+}
+
+
+def module(slug):
+    return importlib.import_module(f"{__name__}.{slug}")
+
+
+def load(title):
+    return module(PAGES[title])
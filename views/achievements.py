@@ -0,0 +1,113 @@
+"""Achievements & Impact: accomplishments, optimisation, BI metrics and interests."""
+import os
+
+import numpy as np
+import streamlit as st
+
+import benchstore
+import datasets
+import deferred
+import downsample
+import figures
+import metrics
+import templates
+
+COUNTRIES = {"South Africa": "SA", "DRC": "DRC"}
+# JSON Lines engagement event log; see rollups.py for the expected records.
+EVENTS_PATH = os.environ.get("PROFILE_EVENTS_PATH")
+
+
+def _perf_series():
+    iterations = np.arange(1, 11)
+    before_opt = np.array([45, 42, 48, 44, 46, 43, 47, 45, 44, 46])
+    after_opt = np.array([45, 38, 32, 28, 24, 21, 19, 17, 16, 15])
+    return downsample.series(iterations, before_opt), downsample.series(iterations, after_opt)
+
+
+def perf_section():
+    """The hand-measured before/after series, shown until benchmark results are ingested."""
+    with metrics.section("chart.perf"):
+        deferred.chart(figures.perf_figure, *datasets.get("achievements.perf", _perf_series), height=380)
+
+
+@st.fragment
+def bench_section():
+    store = benchstore.store
+    with metrics.section("chart.perf"):
+        col1, col2, col3 = st.columns([3, 2, 2])
+        name = col1.selectbox("Benchmark", store.benchmarks(), key="bench_name")
+        view = col2.radio("View", ["Trend", "Distribution"], horizontal=True, key="bench_view")
+        last = col3.slider("Last runs", min_value=5, max_value=max(5, min(len(store), 500)),
+                           value=min(len(store), 30), key="bench_last")
+
+        if view == "Trend":
+            trend = store.trend(name, last=last)
+            deferred.chart(figures.bench_trend_figure, trend.labels, trend.median, trend.q1, trend.q3, trend.p95,
+                           trend.regressed, height=380)
+            if trend.regressed.any():
+                st.caption(f"{int(trend.regressed.sum())} run(s) more than 10% slower than the median "
+                           "of the five runs before them.")
+        else:
+            deferred.chart(figures.bench_distribution_figure, *store.distribution(name, last=last), height=380)
+
+
+@st.fragment
+def biz_section(profile):
+    with metrics.section("chart.biz"):
+        # Rolled up from the event log when one is configured; updating only
+        # reads events appended since the previous rerun.
+        if EVENTS_PATH:
+            import rollups
+
+            engagement = rollups.engagement(EVENTS_PATH)
+        else:
+            engagement = profile.engagement
+        quarters = list(engagement.quarters)
+        if not quarters:
+            st.info("No engagement events recorded yet.")
+            return
+        col1, col2 = st.columns([1, 2])
+        with col1:
+            picked = st.multiselect("Countries", list(COUNTRIES), default=list(COUNTRIES), key="biz_countries")
+        with col2:
+            first, last = quarters[0], quarters[-1]
+            if len(quarters) > 1:
+                first, last = st.select_slider("Quarters", options=quarters, value=(first, last), key="biz_quarters")
+        if not picked:
+            st.info("Select at least one country.")
+            return
+        window = slice(quarters.index(first), quarters.index(last) + 1)
+        series = [values[window] for values in engagement]
+        deferred.chart(figures.biz_figure, *series, tuple(COUNTRIES[c] for c in picked), height=420)
+
+
+@st.fragment
+def interests_section(profile):
+    with metrics.section("chart.interests"):
+        interests = profile.interests
+        top = st.slider("Show top", min_value=1, max_value=len(interests), value=len(interests), key="interests_top")
+        keep = set(sorted(interests, key=interests.get, reverse=True)[:top])
+        deferred.chart(figures.interests_figure, {k: v for k, v in interests.items() if k in keep}, height=350)
+
+
+def render(profile):
+    st.markdown('<div class="section-header">Key Accomplishments</div>', unsafe_allow_html=True)
+
+    st.markdown(templates.PROJECT_CARD.many(profile.accomplishments.items), unsafe_allow_html=True)
+
+    st.markdown('<div class="section-header">Research & Quantitative Impact</div>', unsafe_allow_html=True)
+
+    if len(benchstore.store):
+        st.markdown("##### Benchmark History")
+        bench_section()
+    else:
+        st.markdown("##### System Optimization — Script Performance Improvement")
+        perf_section()
+
+    st.markdown("##### Cross-Border Business Intelligence Metrics" + ("" if EVENTS_PATH else " (Simulated)"))
+
+    biz_section(profile)
+
+    st.markdown('<div class="section-header">Research Interests</div>', unsafe_allow_html=True)
+
+    interests_section(profile)
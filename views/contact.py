@@ -0,0 +1,45 @@
+"""Contact: affiliations, profile links and the message form."""
+import streamlit as st
+
+import inbox
+import metrics
+import templates
+
+REPLIES = {
+    inbox.QUEUED: (st.success, "Thanks for reaching out! I'll get back to you soon."),
+    inbox.DUPLICATE: (st.info, "This message has already been received."),
+    inbox.RATE_LIMITED: (st.warning, "Too many messages in a short time. Please try again later."),
+    inbox.INVALID: (st.error, "Please enter a message and a valid email address."),
+    inbox.BUSY: (st.warning, "The inbox is busy right now. Please try again in a minute."),
+}
+
+
+# A fragment, so submitting reruns only the form.
+@st.fragment
+def contact_form():
+    with metrics.section("contact.form"):
+        with st.form("contact_form"):
+            name = st.text_input("Name")
+            email = st.text_input("Email")
+            message = st.text_area("Message")
+            submitted = st.form_submit_button("Send")
+            if submitted:
+                status = inbox.submit(name, email, message, *inbox.client())
+                metrics.count(f"contact_{status}")
+                show, text = REPLIES[status]
+                show(text)
+
+
+def render(profile):
+    st.markdown('<div class="section-header">Get in Touch</div>', unsafe_allow_html=True)
+
+    cards = profile.contact.items
+    half = (len(cards) + 1) // 2
+    for col, column_cards in zip(st.columns(2), (cards[:half], cards[half:])):
+        with col:
+            st.markdown(templates.PROJECT_CARD.many(column_cards), unsafe_allow_html=True)
+
+    st.markdown("---")
+
+    st.markdown("##### Send a Message")
+    contact_form()
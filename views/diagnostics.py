@@ -0,0 +1,50 @@
+"""Diagnostics: section timings, cache stats and the Prometheus export.
+
+Not listed in the sidebar; open the app with ``?diagnostics=1``.
+"""
+import streamlit as st
+
+import datasets
+import metrics
+
+
+def render(profile):
+    st.markdown('<div class="section-header">Diagnostics</div>', unsafe_allow_html=True)
+
+    if not metrics.ENABLED:
+        st.info("Metrics are disabled. Start the app with PROFILE_METRICS=1 to record section timings.")
+        return
+
+    snap = metrics.snapshot()
+    col1, col2, col3 = st.columns(3)
+    col1.metric("Active sessions", snap["active_sessions"])
+    col2.metric("Figure cache hits", snap["caches"].get("figure_cache_hits_total", 0))
+    col3.metric("Figure cache misses", snap["caches"].get("figure_cache_misses_total", 0))
+
+    st.markdown("##### Sections")
+    rows = [
+        {"section": name, "runs": s["count"], "mean ms": round(s["mean_ms"], 2), "max ms": round(s["max_ms"], 2)}
+        for name, s in sorted(snap["sections"].items(), key=lambda item: -item[1]["total_s"])
+    ]
+    if rows:
+        st.dataframe(rows, use_container_width=True, hide_index=True)
+    else:
+        st.caption("Nothing recorded yet; visit a page first.")
+
+    if snap["counters"]:
+        st.markdown("##### Counters")
+        st.json(snap["counters"])
+
+    st.markdown("##### Shared datasets")
+    shared = datasets.report()
+    if shared:
+        st.dataframe([d._asdict() for d in shared], use_container_width=True, hide_index=True)
+        st.caption("Held once per process and handed to every session read-only. "
+                   "Run scripts/memory_report.py to measure what each session adds on top.")
+    else:
+        st.caption("None built yet; visit the chart pages first.")
+
+    st.markdown("##### Prometheus export")
+    if metrics.EXPORT_PATH:
+        st.caption(f"Written to {metrics.EXPORT_PATH} every {metrics.EXPORT_INTERVAL:g}s.")
+    st.code(metrics.render(), language="text")
@@ -0,0 +1,29 @@
+"""Home: hero, headline metrics, education timeline and certifications."""
+import streamlit as st
+
+import metrics
+import templates
+
+
+def render(profile):
+    person = profile.person
+    with metrics.section("home.hero"):
+        st.markdown(templates.HERO.render(
+            name=person.name, headline=person.headline, bio=person.bio,
+            badges=templates.tags(templates.CONTACT_BADGE, person.badges, sep=""),
+        ), unsafe_allow_html=True)
+
+    with metrics.section("home.metric_cards"):
+        for col, h in zip(st.columns(len(profile.highlights) or 1), profile.highlights):
+            with col:
+                st.markdown(templates.METRIC_CARD.render(value=h.value, label=h.label), unsafe_allow_html=True)
+
+    st.markdown('<div class="section-header">Education</div>', unsafe_allow_html=True)
+
+    st.markdown(templates.TIMELINE_ITEM.many(
+        e._replace(note=templates.TIMELINE_NOTE.render(note=e.note) if e.note else "") for e in profile.education
+    ), unsafe_allow_html=True)
+
+    st.markdown('<div class="section-header">Certifications</div>', unsafe_allow_html=True)
+
+    st.markdown(templates.tags(templates.SKILL_TAG, profile.certs), unsafe_allow_html=True)
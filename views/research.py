@@ -0,0 +1,224 @@
+"""Research & Projects: The Kneel architecture, infrastructure analysis and ventures."""
+import os
+
+import numpy as np
+import streamlit as st
+
+import datasets
+import deferred
+import crewsim
+import diagrams
+import downsample
+import figures
+import layout
+import metrics
+import templates
+
+# CSV or Parquet water-incident log; see incidents.py for the expected columns.
+INCIDENTS_PATH = os.environ.get("PROFILE_INCIDENTS_PATH")
+
+
+def _log_version():
+    stat = os.stat(INCIDENTS_PATH)
+    return INCIDENTS_PATH, stat.st_size, stat.st_mtime_ns
+
+
+def regions():
+    """Regions present in the incident log, or ``()`` for simulated data."""
+    if not INCIDENTS_PATH:
+        return ()
+    import incidents
+
+    return datasets.get(("incidents.regions", *_log_version()),
+                        lambda: sorted(incidents.load(INCIDENTS_PATH)["region"].unique()))
+
+
+def _simulated_response_times():
+    rng = np.random.RandomState(42)
+    months = np.arange("2024-06", "2025-06", dtype="datetime64[M]")
+    ort = rng.uniform(2, 6, 12)
+    art = ort + rng.uniform(1, 8, 12)
+    return months, ort, art
+
+
+def _logged_response_times(region_filter):
+    import incidents
+
+    by_month = incidents.monthly(incidents.load(INCIDENTS_PATH), regions=region_filter)
+    return by_month.index.to_numpy(), by_month["ort"].to_numpy(), by_month["art"].to_numpy()
+
+
+def response_times(region_filter=None):
+    """Monthly mean ORT and ART as shared read-only arrays.
+
+    From the incident log when one is configured; each region selection is
+    aggregated once per log version, not once per session.
+    """
+    if INCIDENTS_PATH:
+        key = ("incidents.monthly", *_log_version(), tuple(sorted(region_filter or ())))
+        return datasets.get(key, lambda: _logged_response_times(region_filter))
+    return datasets.get("research.simulated_response_times", _simulated_response_times)
+
+
+# Each chart is a fragment: its controls rerun only that fragment, not the page.
+@st.fragment
+def architecture_section(spec):
+    with metrics.section("chart.architecture"):
+        col1, col2 = st.columns(2)
+        flow = col1.toggle("Show data flow", value=True, key="arch_flow")
+        interactive = col2.toggle("Interactive", value=False, key="arch_interactive")
+        arrows = spec.arrows if flow else ()
+        if interactive:
+            deferred.chart(figures.architecture_figure, spec.boxes, arrows, height=480)
+        else:
+            # A cached, content-hashed SVG: no figure build, a one-line payload.
+            diagram = diagrams.compile_svg(spec.boxes, arrows)
+            st.markdown(diagrams.image_tag(diagram, layout.static_served(".svg")), unsafe_allow_html=True)
+
+
+@st.fragment
+def infra_section():
+    st.markdown("##### Infrastructure Response Analysis" + ("" if INCIDENTS_PATH else " (Simulated)"))
+    with metrics.section("chart.infra"):
+        options = regions()
+        selected = None
+        if options:
+            selected = st.multiselect("Regions", list(options), placeholder="All regions", key="infra_regions") or None
+        months, ort, art = response_times(selected)
+        if len(months) == 0:
+            st.info("No incidents for this selection.")
+            return
+
+        labels = months.astype("datetime64[D]").tolist()
+        x_range = None
+        if len(labels) > 1:
+            lo, hi = st.select_slider(
+                "Date range", options=labels, value=(labels[0], labels[-1]),
+                format_func=lambda m: m.strftime("%b %Y"), key="infra_range",
+            )
+            x_range = (np.datetime64(lo, "M"), np.datetime64(hi, "M"))
+        months, (ort, art) = downsample.mean_buckets(months.astype("datetime64[M]"), [ort, art], x_range=x_range)
+        months = [m.strftime("%b %Y") for m in months.astype("datetime64[D]").tolist()]
+
+        deferred.chart(figures.infra_figure, months, ort, art)
+
+
+@st.fragment
+def crew_section():
+    with metrics.section("chart.crews"):
+        col1, col2, col3, col4 = st.columns(4)
+        policy = col1.radio("Dispatch", crewsim.POLICIES, format_func=str.title, horizontal=True, key="crew_policy")
+        per_day = col2.slider("Incidents per day", 2, 40, 12, key="crew_rate")
+        max_crews = col3.slider("Up to crews", 3, 15, 8, key="crew_max")
+        scenarios = col4.select_slider("Scenarios", [1000, 2000, 5000, 10000], value=2000, key="crew_scenarios")
+
+        # Repair work averages the charted ORT, so the band shows how close each crew count gets to it.
+        ort = float(np.mean(response_times()[1]))
+        scenario = crewsim.Scenario(policy, float(per_day), round(ort, 3), max_crews, scenarios, seed=42)
+        chart, status = st.empty(), st.empty()
+        chart.markdown(deferred.PLACEHOLDER.format(height=400), unsafe_allow_html=True)
+
+        def show(bands, build=figures.crew_figure):
+            chart.plotly_chart(build(bands.crews, bands.p10, bands.p50, bands.p90, ort), use_container_width=True)
+
+        def progress(bands):
+            # Partial frames are seen once; building them uncached keeps them out of the figure LRU.
+            show(bands, figures.crew_figure.build)
+            status.caption(f"Simulated {bands.scenarios:,} of {scenarios:,} scenarios...")
+
+        def run():
+            bands = crewsim.simulate(scenario, on_block=progress)
+            show(bands)
+            enough = np.flatnonzero(bands.p90 <= 2 * ort)
+            status.caption(
+                f"{scenarios:,} simulated weeks per crew count. "
+                + (f"{bands.crews[enough[0]]} crews keep 90% of weeks under twice the ORT."
+                   if len(enough) else "No crew count tried keeps 90% of weeks under twice the ORT.")
+            )
+
+        # Streams into its own placeholders, so it runs on the script thread after the page text.
+        deferred.later(run)
+
+
+def _model():
+    """The fitted failure model for the current log; trained at most once per log version."""
+    import incidents
+    import riskmodel
+
+    return datasets.get(("incidents.model", *_log_version()),
+                        lambda: riskmodel.train(incidents.load(INCIDENTS_PATH)))
+
+
+@st.fragment
+def model_section():
+    with metrics.section("chart.model"):
+        with st.spinner("Fitting the failure model..."):
+            model = _model()
+        col1, col2, col3, col4 = st.columns(4)
+        region = col1.selectbox("Region", model.regions, key="model_region")
+        asset_class = col2.selectbox("Asset class", model.asset_classes, key="model_asset")
+        ort = col3.slider("Optimal response (hrs)", 0.5, 24.0, 4.0, 0.5, key="model_ort")
+        horizon = col4.slider("Months ahead", 3, 24, 12, key="model_horizon")
+
+        # One vectorized batch for the whole horizon; nothing is refitted here.
+        months = np.arange(model.last + 1, model.last + 1 + horizon)
+        n = len(months)
+        risk, repair = model.predict(np.full(n, region), np.full(n, asset_class), months, np.full(n, ort))
+
+        history = response_history(region, asset_class)
+        deferred.chart(
+            figures.forecast_figure, [m.strftime("%b %Y") for m in months.astype("datetime64[D]").tolist()],
+            np.round(risk, 1), np.round(repair, 2), *history,
+        )
+        risk_fit, repair_fit = model.fits["risk"], model.fits["repair"]
+        if not (risk_fit.cv_rmse and repair_fit.cv_rmse):
+            st.caption(f"Ridge regression on {model.rows} month × region × asset class aggregates. "
+                       "Not enough history to cross-validate the error yet.")
+            return
+        st.caption(
+            f"Ridge regression on {model.rows} month × region × asset class aggregates. "
+            f"Cross-validated error: ±{100 * np.expm1(risk_fit.cv_rmse[risk_fit.alpha]):.1f}% incidents, "
+            f"±{repair_fit.cv_rmse[repair_fit.alpha]:.2f} h repair time."
+        )
+
+
+def response_history(region, asset_class, last=12):
+    """Recorded incidents per month for one region and asset class, last ``last`` months."""
+    import incidents
+
+    def build():
+        table = incidents.load(INCIDENTS_PATH)
+        rows = table[(table["region"] == region) & (table["asset_class"] == asset_class)]
+        counts = rows.groupby("month")["incidents"].sum().iloc[-last:]
+        labels = [m.strftime("%b %Y") for m in counts.index]
+        return labels, counts.to_numpy()
+
+    return datasets.get(("incidents.history", *_log_version(), region, asset_class, last), build)
+
+
+def _feature(feature):
+    st.markdown(templates.SECTION_HEADER.render(title=feature.heading), unsafe_allow_html=True)
+    st.markdown(templates.PROJECT_CARD.render(title=feature.title, desc=feature.desc), unsafe_allow_html=True)
+
+
+def render(profile):
+    _feature(profile.research["flagship"])
+
+    st.markdown("##### System Architecture")
+
+    architecture_section(profile.architecture)
+
+    _feature(profile.research["study"])
+
+    infra_section()
+
+    st.markdown("##### Crew Scheduling Scenarios (Monte Carlo)")
+    crew_section()
+
+    if INCIDENTS_PATH:
+        st.markdown("##### Failure Risk & Repair Time Model")
+        model_section()
+
+    st.markdown('<div class="section-header">Ventures & Other Projects</div>', unsafe_allow_html=True)
+
+    st.markdown(templates.PROJECT_CARD.many(profile.projects.items), unsafe_allow_html=True)
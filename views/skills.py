@@ -0,0 +1,82 @@
+"""Skills & Tools: proficiency chart, toolbox and competency radar."""
+import streamlit as st
+
+import deferred
+import figures
+import metrics
+import taxonomy
+import templates
+
+SKILLS_PER_PAGE = 12
+TOOLS_PER_PAGE = 40
+
+
+def _page_number(key, total, per_page):
+    """Page picker, shown only when there is more than one page."""
+    pages = max(1, -(-total // per_page))
+    if st.session_state.get(key, 1) > pages:
+        st.session_state[key] = pages
+    if pages == 1:
+        return 1
+    return st.number_input(f"Page (of {pages})", min_value=1, max_value=pages, step=1, key=key)
+
+
+@st.fragment
+def skills_section(profile):
+    index = profile.skills
+    with metrics.section("chart.skills"):
+        col1, col2 = st.columns([2, 3])
+        query = col1.text_input("Search skills", placeholder="e.g. mach lear, py", key="skills_query")
+        categories = list(index.by_category)
+        selected = col2.multiselect("Categories", categories, default=categories, key="skills_categories")
+
+        facets = index.facets(index.search(query))
+        st.caption(" · ".join(f"{cat} ({n})" for cat, n in facets.items() if n))
+
+        ids = index.search(query, selected)
+        if not ids:
+            st.info("No skills match this search.")
+            return
+        page = taxonomy.paginate(ids, _page_number("skills_page", len(ids), SKILLS_PER_PAGE), SKILLS_PER_PAGE)
+        if page.pages > 1:
+            st.caption(f"Showing {page.start + 1}-{page.start + len(page.items)} of {page.total}")
+        deferred.chart(figures.skills_figure, index.select(page.items), profile.skill_colors, height=520)
+
+
+@st.fragment
+def tools_section(profile):
+    tools = profile.tools
+    if len(tools) > TOOLS_PER_PAGE:
+        query = st.text_input("Filter tools", key="tools_query")
+        matches = tools.search(query)
+    else:
+        matches = tools.items
+    page = taxonomy.paginate(matches, _page_number("tools_page", len(matches), TOOLS_PER_PAGE), TOOLS_PER_PAGE)
+    st.markdown(templates.tags(templates.SKILL_TAG, page.items), unsafe_allow_html=True)
+
+
+@st.fragment
+def radar_section(profile):
+    with metrics.section("chart.radar"):
+        names = list(profile.competencies)
+        selected = st.multiselect("Competencies", names, default=names, key="radar_competencies")
+        if len(selected) < 3:
+            st.info("Select at least three competencies.")
+            return
+        # Keep the profile's axis order whatever order they were picked in.
+        deferred.chart(figures.radar_figure, {n: profile.competencies[n] for n in names if n in selected},
+                       height=420)
+
+
+def render(profile):
+    st.markdown('<div class="section-header">Technical Skill Proficiency</div>', unsafe_allow_html=True)
+
+    skills_section(profile)
+
+    st.markdown('<div class="section-header">Toolbox</div>', unsafe_allow_html=True)
+
+    tools_section(profile)
+
+    st.markdown('<div class="section-header">Competency Radar</div>', unsafe_allow_html=True)
+
+    radar_section(profile)